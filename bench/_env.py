@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Import first in benchmark scripts: repository root on sys.path, temporary home directory with
+config from the template, exchanges_wrapper stop on import without it
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).absolute().parent.parent
+sys.path.insert(0, str(ROOT))
+
+_home = tempfile.mkdtemp(prefix='exch_srv_bench_')
+os.environ['HOME'] = _home
+atexit.register(shutil.rmtree, _home, ignore_errors=True)
+_config_path = Path(_home, ".MartinBinance", "config")
+_config_path.mkdir(parents=True)
+Path(_home, ".MartinBinance", "exch_srv_log").mkdir()
+shutil.copy(Path(ROOT, "exchanges_wrapper", "exch_srv_cfg.toml.template"), Path(_config_path, "exch_srv_cfg.toml"))
@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Memory and throughput of event wrappers on the recorded Binance combined stream replay: "slotted" wrappers
+with fields copied to slots (events.py), "lazy" slotted wrappers that keep the source dict and read fields
+on access, "eager" wrappers that copy every field into instance __dict__, as in 1.2.6.
+Each event is read the way exch_srv consumes it: OnTickerUpdate 4 fields, OnOrderBookUpdate 3,
+OnKlinesUpdate the candle. Run from the repository root: python3 bench/bench_event_wrappers.py
+"""
+import json
+import time
+import tracemalloc
+
+import _env  # noqa: F401
+import replay
+
+from exchanges_wrapper import events
+from exchanges_wrapper.c_structures import field
+
+COUNT = 30000
+ROUNDS = 7
+
+
+class EagerKlineWrapper:
+    def __init__(self, event_data, handlers):
+        self.handlers = handlers
+        self.event_type = event_data["e"]
+        self.event_time = event_data["E"]
+        self.symbol = event_data["s"]
+        kline = event_data["k"]
+        self.kline_start_time = kline["t"]
+        self.kline_close_time = kline["T"]
+        self.kline_symbol = kline["s"]
+        self.kline_interval = kline["i"]
+        self.kline_first_trade_id = kline["f"]
+        self.kline_last_trade_id = kline["L"]
+        self.kline_open_price = kline["o"]
+        self.kline_close_price = kline["c"]
+        self.kline_high_price = kline["h"]
+        self.kline_low_price = kline["l"]
+        self.kline_base_asset_volume = kline["v"]
+        self.kline_trades_number = kline["n"]
+        self.kline_closed = kline["x"]
+        self.kline_quote_asset_volume = kline["q"]
+        self.kline_taker_buy_base_asset_volume = kline["V"]
+        self.kline_taker_buy_quote_asset_volume = kline["Q"]
+        self.kline_ignore = kline["B"]
+
+
+class EagerSymbolMiniTickerWrapper:
+    def __init__(self, event_data, handlers):
+        self.handlers = handlers
+        self.event_type = event_data["e"]
+        self.event_time = event_data["E"]
+        self.symbol = event_data["s"]
+        self.close_price = event_data["c"]
+        self.open_price = event_data["o"]
+        self.high_price = event_data["h"]
+        self.low_price = event_data["l"]
+        self.total_traded_base_asset_volume = event_data["v"]
+        self.total_traded_quote_asset_volume = event_data["q"]
+
+
+class EagerPartialBookDepthWrapper:
+    def __init__(self, event_data, handlers):
+        self.handlers = handlers
+        self.last_update_id = event_data["lastUpdateId"]
+        self.bids = event_data["bids"]
+        self.asks = event_data["asks"]
+        self.book = event_data.get("book")
+
+
+def kline_field(key):
+    return property(lambda self: self.event_data["k"][key])
+
+
+class LazyKlineWrapper(events.LazyEventWrapper):
+    __slots__ = ()
+
+    event_type = field("e")
+    event_time = field("E")
+    symbol = field("s")
+    kline_start_time = kline_field("t")
+    kline_close_time = kline_field("T")
+    kline_interval = kline_field("i")
+    kline_open_price = kline_field("o")
+    kline_close_price = kline_field("c")
+    kline_high_price = kline_field("h")
+    kline_low_price = kline_field("l")
+    kline_base_asset_volume = kline_field("v")
+    kline_trades_number = kline_field("n")
+    kline_closed = kline_field("x")
+    kline_quote_asset_volume = kline_field("q")
+    kline_taker_buy_base_asset_volume = kline_field("V")
+    kline_taker_buy_quote_asset_volume = kline_field("Q")
+
+
+class LazySymbolMiniTickerWrapper(events.LazyEventWrapper):
+    __slots__ = ()
+
+    event_type = field("e")
+    event_time = field("E")
+    symbol = field("s")
+    close_price = field("c")
+    open_price = field("o")
+
+
+class LazyPartialBookDepthWrapper(events.LazyEventWrapper):
+    __slots__ = ()
+
+    last_update_id = field("lastUpdateId")
+    bids = field("bids")
+    asks = field("asks")
+
+
+KLINE_READS = ('kline_start_time', 'kline_interval', 'kline_open_price', 'kline_high_price', 'kline_low_price',
+               'kline_close_price', 'kline_base_asset_volume', 'kline_close_time', 'kline_quote_asset_volume',
+               'kline_trades_number', 'kline_taker_buy_base_asset_volume', 'kline_taker_buy_quote_asset_volume',
+               'kline_closed')
+TICKER_READS = ('symbol', 'open_price', 'close_price', 'event_time')
+DEPTH_READS = ('last_update_id', 'bids', 'asks')
+
+WRAPPERS = {
+    'slotted': {'kline_1m': (events.KlineWrapper, KLINE_READS),
+                'miniTicker': (events.SymbolMiniTickerWrapper, TICKER_READS),
+                'depth5': (events.PartialBookDepthWrapper, DEPTH_READS)},
+    'lazy': {'kline_1m': (LazyKlineWrapper, KLINE_READS),
+             'miniTicker': (LazySymbolMiniTickerWrapper, TICKER_READS),
+             'depth5': (LazyPartialBookDepthWrapper, DEPTH_READS)},
+    'eager': {'kline_1m': (EagerKlineWrapper, KLINE_READS),
+              'miniTicker': (EagerSymbolMiniTickerWrapper, TICKER_READS),
+              'depth5': (EagerPartialBookDepthWrapper, DEPTH_READS)},
+}
+
+
+def consume(wrappers, items) -> None:
+    for stream_type, item in items:
+        wrapper, reads = wrappers[stream_type]
+        event = wrapper(item, None)
+        for name in reads:
+            getattr(event, name)
+
+
+def decode_consume(wrappers, raw) -> None:
+    consume(wrappers, ((stream_type, json.loads(data)) for stream_type, data in raw))
+
+
+def rate(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return COUNT / (time.perf_counter() - start)
+
+
+def allocated(func, *args) -> float:
+    """
+    Bytes per event still allocated after func, objects it returns are kept alive
+    """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    res = func(*args)
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del res
+    return size / COUNT
+
+
+def main():
+    frames = replay.binance_stream(COUNT)
+    raw = [(frame['stream'].split('@')[1], json.dumps(dict(frame['data'], stream=frame['stream']))) for frame in frames]
+    items = [(stream_type, json.loads(data)) for stream_type, data in raw]
+    print(f"{COUNT} events: kline_1m, miniTicker, depth5 in equal parts")
+    for kind, wrappers in WRAPPERS.items():
+        size = allocated(lambda: [wrappers[s][0](i, None) for s, i in items])
+        backlog = allocated(lambda: [wrappers[s][0](json.loads(d), None) for s, d in raw])
+        print(f"  {kind:7}: wrapper {size:6.0f} B per event, backlog with source dict {backlog:6.0f} B per event")
+    # Best of ROUNDS, single runs on a shared host differ up to 2x
+    best = {kind: max(rate(consume, wrappers, items) for _ in range(ROUNDS)) for kind, wrappers in WRAPPERS.items()}
+    print(f"  wrap + reads, events/s: {', '.join(f'{kind} {value:8.0f}' for kind, value in best.items())}")
+    best = {kind: max(rate(decode_consume, wrappers, raw) for _ in range(ROUNDS))
+            for kind, wrappers in WRAPPERS.items()}
+    print(f"  json decode + wrap + reads, events/s: {', '.join(f'{kind} {value:8.0f}' for kind, value in best.items())}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Events.wrap_event and dispatch per market message on the recorded Binance combined stream replay
+(kline_1m, miniTicker, depth5 for 3 symbols, one handler registered per stream), ns per event.
+"legacy" resolves the wrapper the way wrap_event did before the routing table: wrapper map built per
+call, key probing, split on "@", kline_ prefix and a defaultdict lookup.
+Run from the repository root: python3 bench/bench_events_dispatch.py
+"""
+import asyncio
+import time
+from collections import defaultdict
+
+import _env  # noqa: F401
+import replay
+
+from exchanges_wrapper import events
+from exchanges_wrapper.events import Events, Handlers
+
+COUNT = 30000
+
+
+def legacy_wrap_event(handlers, event_data):
+    wrapper_by_type = {
+        "outboundAccountPosition": events.OutboundAccountPositionWrapper,
+        "balanceUpdate": events.BalanceUpdateWrapper,
+        "executionReport": events.OrderUpdateWrapper,
+        "listStatus": events.ListStatus,
+        "aggTrade": events.AggregateTradeWrapper,
+        "trade": events.TradeWrapper,
+        "kline": events.KlineWrapper,
+        "24hrMiniTicker": events.SymbolMiniTickerWrapper,
+        "24hrTicker": events.SymbolTickerWrapper,
+        "bookTicker": events.SymbolBookTickerWrapper,
+        "depth5": events.PartialBookDepthWrapper,
+        "depth10": events.PartialBookDepthWrapper,
+        "depth20": events.PartialBookDepthWrapper,
+        "depth": events.DiffDepthWrapper,
+        "depthUpdate": events.DiffDepthWrapper,
+    }
+    stream = event_data["stream"] if "stream" in event_data else False
+    event_type = event_data["e"] if "e" in event_data else stream
+    if "@" in event_type:
+        event_type = event_type.split("@")[1]
+    if event_type.startswith("kline_"):
+        event_type = "kline"
+    if event_type not in wrapper_by_type:
+        raise events.UnknownEventType()
+    return wrapper_by_type[event_type](event_data, handlers[stream if stream else event_type])
+
+
+def ns_per_event(func, items) -> float:
+    start = time.perf_counter_ns()
+    for item in items:
+        func(item)
+    return (time.perf_counter_ns() - start) / len(items)
+
+
+async def dispatch(wrap, items) -> float:
+    start = time.perf_counter_ns()
+    for item in items:
+        await wrap(item).fire()
+    return (time.perf_counter_ns() - start) / len(items)
+
+
+def main():
+    frames = replay.binance_stream(COUNT)
+    items = [dict(frame['data'], stream=frame['stream']) for frame in frames]
+    received = []
+
+    async def on_event(event):
+        received.append(event)
+
+    _events = Events()
+    legacy_handlers = defaultdict(Handlers)
+    for stream in {frame['stream'] for frame in frames}:
+        _events.register_event(on_event, stream, 'binance', 'bench')
+        legacy_handlers[stream].append(on_event)
+    for item in items[:100]:
+        legacy, routed = legacy_wrap_event(legacy_handlers, item), _events.wrap_event(item)
+        assert type(legacy) is type(routed) and list(legacy.handlers) == list(routed.handlers)
+
+    print(f"{COUNT} events, ns per event")
+    for _ in range(2):
+        print(f"  wrap_event legacy {ns_per_event(lambda i: legacy_wrap_event(legacy_handlers, i), items):7.0f},"
+              f" routing table {ns_per_event(_events.wrap_event, items):7.0f}")
+    received.clear()
+    loop = asyncio.new_event_loop()
+    for _ in range(2):
+        legacy = loop.run_until_complete(dispatch(lambda i: legacy_wrap_event(legacy_handlers, i), items))
+        routed = loop.run_until_complete(dispatch(_events.wrap_event, items))
+        print(f"  wrap_event + fire legacy {legacy:7.0f}, routing table {routed:7.0f}")
+    loop.close()
+    assert len(received) == 4 * COUNT
+
+
+if __name__ == '__main__':
+    main()
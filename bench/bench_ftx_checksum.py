@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+FTX orderbook channel replay: checksum after each update from full sort and string build (as before)
+vs cached level strings of ftx_parser.OrderBook.
+Run from the repository root: python3 bench/bench_ftx_checksum.py
+"""
+import time
+import zlib
+
+import _env  # noqa: F401
+import replay
+
+from exchanges_wrapper import ftx_parser as ftx
+
+
+class SortFormatBook:
+    """
+    Reference: levels in dict, sorted and formatted for each checksum
+    """
+    def __init__(self, data) -> None:
+        self.bids = {str(i[0]): str(i[1]) for i in data['bids']}
+        self.asks = {str(i[0]): str(i[1]) for i in data['asks']}
+
+    def checksum(self) -> int:
+        bids = sorted(self.bids.items(), key=lambda x: float(x[0]), reverse=True)[:ftx.CHECKSUM_DEPTH]
+        asks = sorted(self.asks.items(), key=lambda x: float(x[0]))[:ftx.CHECKSUM_DEPTH]
+        raw = str()
+        for i in range(max(len(bids), len(asks))):
+            if i < len(bids):
+                raw += f"{':' if i else ''}{bids[i][0]}:{bids[i][1]}"
+            if i < len(asks):
+                raw += f":{asks[i][0]}:{asks[i][1]}"
+        return zlib.crc32(raw.encode('utf8'))
+
+    def update_book(self, data) -> int:
+        for side, levels in ((self.bids, data['bids']), (self.asks, data['asks'])):
+            for price, qty in levels:
+                if qty:
+                    side[str(price)] = str(qty)
+                else:
+                    side.pop(str(price), None)
+        return self.checksum()
+
+
+def run(book, updates) -> (float, []):
+    start = time.perf_counter()
+    res = [book.update_book(frame['data']) for frame in updates]
+    return (time.perf_counter() - start) / len(updates), res
+
+
+def main():
+    print("FTX orderbook replay, us per update frame with checksum")
+    for depth in (100, 400):
+        frames = replay.ftx_orderbook(5000, depth=depth)
+        partial, updates = frames[0]['data'], frames[1:]
+        old, old_res = run(SortFormatBook(partial), updates)
+        new, new_res = run(ftx.OrderBook(partial, 'BTC/USD'), updates)
+        assert old_res == new_res
+        print(f"  {depth} levels per side, {len(updates)} updates: sort and format {old * 1e6:7.1f},"
+              f" cached levels {new * 1e6:6.1f}, x{old / new:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+REST latency p50/p99 and socket count against a local stub HTTPS server: ClientSession per account
+with default connector (as before) vs http_session shared per exchange host. Accounts start one after
+another and send requests with random pauses, as bots do. Self-signed certificate is made by openssl,
+without it plain HTTP is used. Run from the repository root: python3 bench/bench_http_session.py
+"""
+import asyncio
+import random
+import shutil
+import ssl
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import _env  # noqa: F401
+
+import aiohttp
+from aiohttp import web
+
+from exchanges_wrapper import http_session
+
+ACCOUNTS = 50
+ROUNDS = 20
+PORT = 8443
+SERVER_DELAY = 0.002  # sec, request processing time of the stub
+connections = set()
+
+
+async def handler(_request):
+    connections.add(id(_request.transport))
+    await asyncio.sleep(SERVER_DELAY)
+    return web.json_response({"serverTime": 1})
+
+
+def percentile(values, part) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * part))]
+
+
+def certificate(path) -> (Path, Path):
+    cert, key = Path(path, 'cert.pem'), Path(path, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=localhost',
+                    '-addext', 'subjectAltName=DNS:localhost', '-keyout', str(key), '-out', str(cert)],
+                   check=True, capture_output=True)
+    return cert, key
+
+
+async def run(kind, url, client_ssl) -> None:
+    connections.clear()
+    if kind == 'per account':
+        sessions = [aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=client_ssl)) for _ in range(ACCOUNTS)]
+    else:
+        http_session._ssl_context = client_ssl
+        sessions = [http_session.get_session('binance', url, None) for _ in range(ACCOUNTS)]
+    rnd = random.Random(1)
+    first, other = [], []
+
+    async def account(i):
+        await asyncio.sleep(i * 0.02)
+        for _round in range(ROUNDS):
+            await asyncio.sleep(rnd.uniform(0, 0.5))
+            start = time.perf_counter()
+            async with sessions[i].get(f"{url}/api/v3/time", ssl=client_ssl) as response:
+                await response.read()
+            (other if _round else first).append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(account(i) for i in range(ACCOUNTS)))
+    total = first + other
+    print(f"  {kind:11}: sockets {len(connections):3}, first request p50 {percentile(first, 0.5):6.2f} ms"
+          f" p99 {percentile(first, 0.99):6.2f} ms, all p50 {percentile(total, 0.5):5.2f} ms"
+          f" p99 {percentile(total, 0.99):6.2f} ms")
+    for session in sessions:
+        if kind == 'per account':
+            await session.close()
+        else:
+            await http_session.release_session(session)
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get('/api/v3/time', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    path = tempfile.mkdtemp()
+    try:
+        if shutil.which('openssl'):
+            cert, key = certificate(path)
+            server_ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            server_ssl.load_cert_chain(str(cert), str(key))
+            client_ssl = ssl.create_default_context(cafile=str(cert))
+            url = f"https://localhost:{PORT}"
+        else:
+            server_ssl = client_ssl = None
+            url = f"http://localhost:{PORT}"
+        await web.TCPSite(runner, 'localhost', PORT, ssl_context=server_ssl).start()
+        print(f"{ACCOUNTS} accounts x {ROUNDS} requests to {url}")
+        for _ in range(2):
+            await run('per account', url, client_ssl)
+            await run('shared', url, client_ssl)
+    finally:
+        await runner.cleanup()
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+JSON decode of typical WSS frames per exchange and encode of candles for gRPC, messages/s for each
+installed library. json_codec use the first of orjson, msgspec, ujson, else stdlib json.
+Run from the repository root: python3 bench/bench_json_codec.py
+"""
+import json
+import time
+
+import _env  # noqa: F401
+import replay
+
+from exchanges_wrapper import json_codec
+
+CODECS = {'json': (json.loads, json.dumps)}
+try:
+    import orjson
+    CODECS['orjson'] = (orjson.loads, lambda obj: orjson.dumps(obj).decode())
+except ImportError:
+    pass
+try:
+    import msgspec
+    CODECS['msgspec'] = (msgspec.json.decode, lambda obj: msgspec.json.encode(obj).decode())
+except ImportError:
+    pass
+try:
+    import ujson
+    CODECS['ujson'] = (ujson.loads, ujson.dumps)
+except ImportError:
+    pass
+
+
+def frames() -> {}:
+    return {
+        'binance streams': [json.dumps(i) for i in replay.binance_stream(3000)],
+        'ftx orderbook': [json.dumps(i) for i in replay.ftx_orderbook(3000)],
+        'bitfinex book': [json.dumps(i) for i in replay.bitfinex_book(3000)],
+        'huobi depth.step0': [json.dumps(i) for i in replay.huobi_depth(500)],
+    }
+
+
+def rate(func, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return len(items) / (time.perf_counter() - start)
+
+
+def main():
+    print(f"json_codec uses: {json_codec.NAME}, installed: {', '.join(CODECS)}")
+    print("Decode, messages/s")
+    for name, items in frames().items():
+        res = ', '.join(f"{codec} {rate(loads, items):9.0f}" for codec, (loads, _) in CODECS.items())
+        print(f"  {name:18}: {res}")
+    candles = [json.loads(i)['data']['k'] for i in frames()['binance streams'] if 'kline' in i]
+    candles = [[i['t'], i['o'], i['h'], i['l'], i['c'], i['v'], i['T'], i['q'], i['n'], i['V'], i['Q'], '0.0']
+               for i in candles]
+    res = ', '.join(f"{codec} {rate(dumps, candles):9.0f}" for codec, (_, dumps) in CODECS.items())
+    print(f"Encode candle list, messages/s: {res}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Order book update cost against book depth: dict of levels fully sorted on each update (as parsers did
+before the shared book engine) vs order_book.BookSide. Huobi step0 full snapshot frames: top 5 slice,
+SortedDict rebuild, SnapshotSide.
+Run from the repository root: python3 bench/bench_order_book.py
+"""
+import time
+
+import _env  # noqa: F401
+import replay
+
+from exchanges_wrapper import bitfinex_parser as bfx
+from exchanges_wrapper import huobi_parser as hbp
+from exchanges_wrapper.order_book import BookSide
+
+
+class DictSortBook:
+    """
+    Reference: levels in dict, both sides sorted by float price for each top 5 read
+    """
+    def __init__(self, snapshot) -> None:
+        self.bids = {str(i[0]): str(i[2]) for i in snapshot if i[2] > 0}
+        self.asks = {str(i[0]): str(abs(i[2])) for i in snapshot if i[2] < 0}
+
+    def update_book(self, update) -> None:
+        side = self.bids if update[2] > 0 else self.asks
+        if update[1]:
+            side[str(update[0])] = str(abs(update[2]))
+        else:
+            side.pop(str(update[0]), None)
+
+    def get_book(self) -> {}:
+        bids = sorted(self.bids.items(), key=lambda x: float(x[0]), reverse=True)
+        asks = sorted(self.asks.items(), key=lambda x: float(x[0]))
+        return {'bids': bids[0:5], 'asks': asks[0:5]}
+
+
+def per_update(book, frames) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        book.update_book(frame[1])
+        book.get_book()
+    return (time.perf_counter() - start) / len(frames)
+
+
+def huobi(frames, update) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        update(frame)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def huobi_slice(frame):
+    # Baseline before the book engine: top 5 from the frame
+    return {'bids': frame['tick']['bids'][0:5], 'asks': frame['tick']['asks'][0:5]}
+
+
+def huobi_rebuild(frame, bids=BookSide(reverse=True), asks=BookSide()):
+    # SortedDict of all levels for each frame
+    bids.reset(frame['tick']['bids'])
+    asks.reset(frame['tick']['asks'])
+    return {'bids': bids.top(5), 'asks': asks.top(5)}
+
+
+def main():
+    print("Update + top 5 read, us per update")
+    for depth in (25, 100, 500, 2500):
+        frames = replay.bitfinex_book(5000, depth=depth)
+        snapshot, updates = frames[0][1], frames[1:]
+        old = per_update(DictSortBook(snapshot), updates)
+        new = per_update(bfx.OrderBook(snapshot, 'tBTCUSD'), updates)
+        print(f"  depth {depth:5}: dict+sort {old * 1e6:8.2f}, BookSide {new * 1e6:6.2f}, x{old / new:.1f}")
+    print("Huobi step0 frame 150 levels, us per frame")
+    frames = replay.huobi_depth(2000)
+    book = hbp.OrderBook('btcusdt')
+
+    def snapshot_side(frame):
+        book.update_book(frame)
+        return book.get_book()
+
+    for name, func in (('top 5 slice', huobi_slice), ('SortedDict rebuild', huobi_rebuild),
+                       ('SnapshotSide', snapshot_side)):
+        print(f"  {name:18}: {huobi(frames, func) * 1e6:6.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Response build throughput: json_format.ParseDict vs proto_codec converters.
+Run from the repository root: python3 bench/bench_proto_codec.py
+"""
+import timeit
+
+import _env  # noqa: F401
+
+from google.protobuf import json_format
+from google.protobuf.internal import api_implementation
+
+from exchanges_wrapper import api_pb2
+from exchanges_wrapper.proto_codec import get_converter
+
+
+def binance_order(i) -> {}:
+    return {'symbol': 'BTCUSDT', 'orderId': 1000 + i, 'orderListId': -1, 'clientOrderId': f"c{i}",
+            'price': '10000.01000000', 'origQty': '0.01000000', 'executedQty': '0.00000000',
+            'cummulativeQuoteQty': '0.00000000', 'status': 'NEW', 'timeInForce': 'GTC', 'type': 'LIMIT',
+            'side': 'BUY', 'stopPrice': '0.00000000', 'icebergQty': '0.00000000', 'time': 1600000000000 + i,
+            'updateTime': 1600000000000 + i, 'isWorking': True, 'origQuoteOrderQty': '0.00000000'}
+
+
+def parse_dict(orders):
+    response = api_pb2.FetchOpenOrdersResponse()
+    for order in orders:
+        response.items.append(json_format.ParseDict(order, api_pb2.FetchOpenOrdersResponse.Order()))
+    return response
+
+
+def converter(orders):
+    response = api_pb2.FetchOpenOrdersResponse()
+    get_converter(api_pb2.FetchOpenOrdersResponse.Order).extend(response.items, orders)
+    return response
+
+
+def main():
+    print(f"protobuf implementation: {api_implementation.Type()}")
+    for count in (10, 100, 500):
+        orders = [binance_order(i) for i in range(count)]
+        assert parse_dict(orders) == converter(orders)
+        number = max(10, 5000 // count)
+        res = []
+        for func in (parse_dict, converter):
+            res.append(min(timeit.repeat(lambda: func(orders), number=number, repeat=3)) / number)
+        print(f"FetchOpenOrders {count:4} orders: ParseDict {res[0] * 1e3:8.3f} ms,"
+              f" converter {res[1] * 1e3:8.3f} ms, {count / res[1]:10.0f} orders/s, x{res[0] / res[1]:.1f}")
+
+
+if __name__ == '__main__':
+    main()
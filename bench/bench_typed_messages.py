@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Legacy JSON string elements vs typed messages (Candle, PriceLevel, Balance): server build and serialize,
+client parse and decode of each element. Run from the repository root: python3 bench/bench_typed_messages.py
+"""
+import timeit
+
+import _env  # noqa: F401
+
+from google.protobuf.internal import api_implementation
+
+from exchanges_wrapper import api_pb2, json_codec
+from exchanges_wrapper.exch_srv import candle_message
+
+CANDLES = [[1600000000000 + i * 60000, "10000.01000000", "10010.00000000", "9990.00000000", "10005.12000000",
+            "12.34567800", 1600000059999 + i * 60000, "123456.78900000", 321, "6.10000000", "61000.12000000", "0"]
+           for i in range(1000)]
+LEVELS = [[f"{100 - i * 0.01:.8f}", f"{i * 0.1 + 1:.8f}"] for i in range(20)]
+BALANCES = {"BTC": {"free": "0.12345678", "locked": "0.00000000"},
+            "USDT": {"free": "1234.56789000", "locked": "10.00000000"}}
+
+
+def round_trip(message_class, response):
+    data = response.SerializeToString()
+    res = message_class()
+    res.ParseFromString(data)
+    return res, len(data)
+
+
+def klines_json():
+    response = api_pb2.FetchKlinesResponse()
+    for candle in CANDLES:
+        response.klines.append(json_codec.dumps(candle))
+    res, size = round_trip(api_pb2.FetchKlinesResponse, response)
+    return [json_codec.loads(i) for i in res.klines], size
+
+
+def klines_typed():
+    response = api_pb2.FetchKlinesResponse()
+    response.candles.extend(map(candle_message, CANDLES))
+    res, size = round_trip(api_pb2.FetchKlinesResponse, response)
+    return [(i.open_time, i.open, i.high, i.low, i.close, i.volume) for i in res.candles], size
+
+
+def book_json():
+    response = api_pb2.FetchOrderBookResponse(lastUpdateId=1)
+    response.bids.extend(json_codec.dumps(i) for i in LEVELS)
+    response.asks.extend(json_codec.dumps(i) for i in LEVELS)
+    res, size = round_trip(api_pb2.FetchOrderBookResponse, response)
+    return [json_codec.loads(i) for i in res.bids] + [json_codec.loads(i) for i in res.asks], size
+
+
+def book_typed():
+    response = api_pb2.FetchOrderBookResponse(lastUpdateId=1)
+    response.bid_levels.extend(api_pb2.PriceLevel(price=p, quantity=q) for p, q in LEVELS)
+    response.ask_levels.extend(api_pb2.PriceLevel(price=p, quantity=q) for p, q in LEVELS)
+    res, size = round_trip(api_pb2.FetchOrderBookResponse, response)
+    return [(i.price, i.quantity) for i in res.bid_levels] + [(i.price, i.quantity) for i in res.ask_levels], size
+
+
+def funds_json():
+    response = api_pb2.OnFundsUpdateResponse(funds=json_codec.dumps(BALANCES))
+    res, size = round_trip(api_pb2.OnFundsUpdateResponse, response)
+    return json_codec.loads(res.funds), size
+
+
+def funds_typed():
+    response = api_pb2.OnFundsUpdateResponse()
+    response.balances.extend(api_pb2.Balance(asset=asset, free=i['free'], locked=i['locked'])
+                             for asset, i in BALANCES.items())
+    res, size = round_trip(api_pb2.OnFundsUpdateResponse, response)
+    return {i.asset: {'free': i.free, 'locked': i.locked} for i in res.balances}, size
+
+
+def main():
+    print(f"protobuf implementation: {api_implementation.Type()}, json codec: {json_codec.NAME}")
+    for name, legacy, typed, number in (('FetchKlines 1000 candles', klines_json, klines_typed, 50),
+                                        ('FetchOrderBook 2 x 20 levels', book_json, book_typed, 2000),
+                                        ('OnFundsUpdate 2 assets', funds_json, funds_typed, 5000)):
+        res = []
+        for func in (legacy, typed):
+            res.append((min(timeit.repeat(func, number=number, repeat=3)) / number, func()[1]))
+        print(f"  {name:28}: JSON {res[0][0] * 1e6:9.1f} us {res[0][1]:6} bytes,"
+              f" typed {res[1][0] * 1e6:9.1f} us {res[1][1]:6} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Deterministic market data frames in the exchange wire formats, for replay benchmarks.
+Prices walk randomly around 20000 with the tick 0.5, the seed makes every run the same
+"""
+import random
+
+TICK = 0.5
+MID = 20000.0
+
+
+class BookWalk:
+    """
+    Order book levels as the exchange keeps them: updates mostly near the top, some deletes
+    """
+    def __init__(self, depth, seed=1) -> None:
+        self.rnd = random.Random(seed)
+        self.depth = depth
+        self.mid = MID
+        self.bids = {self.mid - TICK * (i + 1): self._qty() for i in range(depth)}
+        self.asks = {self.mid + TICK * (i + 1): self._qty() for i in range(depth)}
+
+    def _qty(self) -> float:
+        return round(self.rnd.uniform(0.001, 5), 4)
+
+    def _level(self, side_sign) -> float:
+        return self.mid + side_sign * TICK * (1 + int(self.rnd.expovariate(0.1)) % (self.depth * 2))
+
+    def step(self, changes=3) -> ([], []):
+        """
+        Changed levels [[price, qty]], qty 0 for removed
+        """
+        if self.rnd.random() < 0.05:
+            self.mid += TICK * self.rnd.choice((-1, 1))
+        bids, asks = [], []
+        for _ in range(changes):
+            side, out, sign = (self.bids, bids, -1) if self.rnd.random() < 0.5 else (self.asks, asks, 1)
+            price = self._level(sign)
+            if price in side and self.rnd.random() < 0.3:
+                del side[price]
+                out.append([price, 0.0])
+            else:
+                side[price] = self._qty()
+                out.append([price, side[price]])
+        return bids, asks
+
+    def snapshot(self) -> ([], []):
+        return (sorted(([p, q] for p, q in self.bids.items()), reverse=True),
+                sorted([p, q] for p, q in self.asks.items()))
+
+
+def ftx_orderbook(count, depth=100, seed=1) -> []:
+    """
+    FTX orderbook channel: partial, then updates
+    """
+    walk = BookWalk(depth, seed)
+    bids, asks = walk.snapshot()
+    frames = [{'channel': 'orderbook', 'market': 'BTC/USD', 'type': 'partial',
+               'data': {'time': 1660000000.0, 'checksum': 0, 'bids': bids, 'asks': asks, 'action': 'partial'}}]
+    for i in range(count):
+        bids, asks = walk.step()
+        frames.append({'channel': 'orderbook', 'market': 'BTC/USD', 'type': 'update',
+                       'data': {'time': 1660000000.0 + i / 10, 'checksum': 0, 'bids': bids, 'asks': asks,
+                                'action': 'update'}})
+    return frames
+
+
+def bitfinex_book(count, depth=25, seed=1) -> []:
+    """
+    Bitfinex book channel: snapshot [[price, count, amount]], then [price, count, amount] updates,
+    amount < 0 for asks, count 0 for removed
+    """
+    walk = BookWalk(depth, seed)
+    bids, asks = walk.snapshot()
+    frames = [[1, [[p, 1, q] for p, q in bids] + [[p, 1, -q] for p, q in asks]]]
+    for _ in range(count):
+        bids, asks = walk.step(changes=1)
+        for price, qty in bids:
+            frames.append([1, [price, 1 if qty else 0, qty or 1]])
+        for price, qty in asks:
+            frames.append([1, [price, 1 if qty else 0, -qty or -1]])
+    return frames
+
+
+def huobi_depth(count, depth=150, seed=1) -> []:
+    """
+    Huobi market.$symbol.depth.step0: full snapshot each frame
+    """
+    walk = BookWalk(depth, seed)
+    frames = []
+    for i in range(count):
+        walk.step()
+        bids, asks = walk.snapshot()
+        frames.append({'ch': 'market.btcusdt.depth.step0', 'ts': 1660000000000 + i * 100,
+                       'tick': {'bids': bids[:depth], 'asks': asks[:depth], 'version': i,
+                                'ts': 1660000000000 + i * 100}})
+    return frames
+
+
+def binance_stream(count, symbols=('btcusdt', 'ethusdt', 'bnbusdt'), seed=1) -> []:
+    """
+    Binance combined stream frames: kline_1m, miniTicker and depth5 in turn for each symbol
+    """
+    rnd = random.Random(seed)
+    walks = {symbol: BookWalk(5, seed + i) for i, symbol in enumerate(symbols)}
+    frames = []
+    for i in range(count):
+        symbol = symbols[i % len(symbols)]
+        walk = walks[symbol]
+        walk.step()
+        event_time = 1660000000000 + i * 100
+        price = f"{walk.mid:.2f}"
+        kind = (i // len(symbols)) % 3
+        if kind == 0:
+            start = event_time // 60000 * 60000
+            frames.append({'stream': f"{symbol}@kline_1m", 'data': {
+                'e': 'kline', 'E': event_time, 's': symbol.upper(),
+                'k': {'t': start, 'T': start + 59999, 's': symbol.upper(), 'i': '1m', 'f': 100 + i, 'L': 200 + i,
+                      'o': price, 'c': price, 'h': price, 'l': price, 'v': f"{rnd.uniform(1, 100):.4f}",
+                      'n': 100, 'x': False, 'q': f"{rnd.uniform(1e4, 1e6):.4f}", 'V': '1.0', 'Q': '20000.0',
+                      'B': '0'}}})
+        elif kind == 1:
+            frames.append({'stream': f"{symbol}@miniTicker", 'data': {
+                'e': '24hrMiniTicker', 'E': event_time, 's': symbol.upper(), 'c': price, 'o': price,
+                'h': price, 'l': price, 'v': f"{rnd.uniform(1e3, 1e4):.4f}", 'q': f"{rnd.uniform(1e7, 1e8):.4f}"}})
+        else:
+            bids, asks = walk.snapshot()
+            frames.append({'stream': f"{symbol}@depth5", 'data': {
+                'lastUpdateId': 1000 + i,
+                'bids': [[f"{p:.2f}", f"{q:.8f}"] for p, q in bids[:5]],
+                'asks': [[f"{p:.2f}", f"{q:.8f}"] for p, q in asks[:5]]}})
+    return frames
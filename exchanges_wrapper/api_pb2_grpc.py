@@ -129,6 +129,16 @@ class MartinStub(object):
                 request_serializer=exchanges__wrapper_dot_api__pb2.FetchFundingWalletRequest.SerializeToString,
                 response_deserializer=exchanges__wrapper_dot_api__pb2.FetchFundingWalletResponse.FromString,
                 )
+        self.CreateLimitOrders = channel.unary_unary(
+                '/martin.Martin/CreateLimitOrders',
+                request_serializer=exchanges__wrapper_dot_api__pb2.CreateLimitOrdersRequest.SerializeToString,
+                response_deserializer=exchanges__wrapper_dot_api__pb2.CreateLimitOrdersResponse.FromString,
+                )
+        self.CancelOrders = channel.unary_unary(
+                '/martin.Martin/CancelOrders',
+                request_serializer=exchanges__wrapper_dot_api__pb2.CancelOrdersRequest.SerializeToString,
+                response_deserializer=exchanges__wrapper_dot_api__pb2.CancelOrdersResponse.FromString,
+                )
 
 
 class MartinServicer(object):
@@ -272,6 +282,18 @@ class MartinServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateLimitOrders(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CancelOrders(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MartinServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -390,6 +412,16 @@ def add_MartinServicer_to_server(servicer, server):
                     request_deserializer=exchanges__wrapper_dot_api__pb2.FetchFundingWalletRequest.FromString,
                     response_serializer=exchanges__wrapper_dot_api__pb2.FetchFundingWalletResponse.SerializeToString,
             ),
+            'CreateLimitOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateLimitOrders,
+                    request_deserializer=exchanges__wrapper_dot_api__pb2.CreateLimitOrdersRequest.FromString,
+                    response_serializer=exchanges__wrapper_dot_api__pb2.CreateLimitOrdersResponse.SerializeToString,
+            ),
+            'CancelOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.CancelOrders,
+                    request_deserializer=exchanges__wrapper_dot_api__pb2.CancelOrdersRequest.FromString,
+                    response_serializer=exchanges__wrapper_dot_api__pb2.CancelOrdersResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'martin.Martin', rpc_method_handlers)
@@ -790,3 +822,37 @@ class Martin(object):
             exchanges__wrapper_dot_api__pb2.FetchFundingWalletResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def CreateLimitOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/martin.Martin/CreateLimitOrders',
+            exchanges__wrapper_dot_api__pb2.CreateLimitOrdersRequest.SerializeToString,
+            exchanges__wrapper_dot_api__pb2.CreateLimitOrdersResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def CancelOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/martin.Martin/CancelOrders',
+            exchanges__wrapper_dot_api__pb2.CancelOrdersRequest.SerializeToString,
+            exchanges__wrapper_dot_api__pb2.CancelOrdersResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
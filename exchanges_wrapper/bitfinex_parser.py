@@ -7,49 +7,30 @@ import time
 from decimal import Decimal
 import logging
 
+import exchanges_wrapper.order_book as book
+from exchanges_wrapper.kline_columns import Klines
+
 logger = logging.getLogger('exch_srv_logger')
 
 
-class OrderBook:
+class OrderBook(book.OrderBook):
     def __init__(self, _order_book, symbol) -> None:
-        self.symbol = symbol[1:].replace(':', '').lower()
-        self.last_update_id = 1
-        self.asks = {}
-        self.bids = {}
-        for i in _order_book:
-            if i[2] > 0:
-                self.bids[str(i[0])] = str(i[2])
-            else:
-                self.asks[str(i[0])] = str(abs(i[2]))
-
-    def get_book(self) -> dict:
-        bids = list(map(list, self.bids.items()))
-        bids.sort(key=lambda x: float(x[0]), reverse=True)
-        asks = list(map(list, self.asks.items()))
-        asks.sort(key=lambda x: float(x[0]), reverse=False)
-        return {
-            'stream': f"{self.symbol}@depth5",
-            'data': {'lastUpdateId': self.last_update_id,
-                     'bids': bids[0:5],
-                     'asks': asks[0:5],
-                     }
-        }
+        super().__init__(symbol[1:].replace(':', '').lower(), 1)
+        self.bids.reset([i[0], i[2]] for i in _order_book if i[2] > 0)
+        self.asks.reset([i[0], abs(i[2])] for i in _order_book if i[2] < 0)
 
     def update_book(self, _update):
         self.last_update_id += 1
         if _update[1]:
             if _update[2] > 0:
-                self.bids[str(_update[0])] = str(_update[2])
+                self.bids.set(_update[0], _update[2])
             else:
-                self.asks[str(_update[0])] = str(abs(_update[2]))
+                self.asks.set(_update[0], abs(_update[2]))
         else:
             if _update[2] > 0:
-                self.bids.pop(str(_update[0]), None)
+                self.bids.remove(_update[0])
             else:
-                self.asks.pop(str(_update[0]), None)
-
-    def __call__(self):
-        return self
+                self.asks.remove(_update[0])
 
 
 def get_symbols(symbols_details: []) -> str:
@@ -151,7 +132,9 @@ def exchange_info(symbols_details: [], tickers: []) -> {}:
     _binance_res = {
         "timezone": "UTC",
         "serverTime": int(time.time() * 1000),
-        "rateLimits": [],
+        "rateLimits": [
+            {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 90}
+        ],
         "exchangeFilters": [],
         "symbols": symbols,
     }
@@ -397,6 +380,11 @@ def klines(res: [], _interval: str) -> []:
     return binance_klines
 
 
+def klines_columns(res: [], _interval: str) -> Klines:
+    # [MTS, OPEN, CLOSE, HIGH, LOW, VOLUME]
+    return Klines.from_records(res, (0, 1, 3, 4, 2, 5), interval(_interval) * 1000)
+
+
 def candle(res: [], symbol: str = None, ch_type: str = None) -> {}:
     symbol = symbol[1:].replace(':', '')
     start_time = res[0]
@@ -6,7 +6,36 @@ import hashlib
 import base64
 
 
+def field(key):
+    """
+    Event attribute read from the source dict on access, instead of copy to instance __dict__
+    """
+    return property(lambda self: self.event_data[key])
+
+
 class OrderUpdateEvent:
+    """
+    Order status from REST as executionReport event. Put to stream queue, so fields are copied to slots
+    and the REST response is not kept, fixed values are class attributes
+    """
+    __slots__ = ('symbol', 'client_order_id', 'side', 'order_type', 'time_in_force', 'order_quantity', 'order_price',
+                 'stop_price', 'iceberg_quantity', 'order_list_id', 'original_client_id', 'order_status', 'order_id',
+                 'cumulative_filled_quantity', 'transaction_time', 'order_creation_time', 'quote_asset_transacted',
+                 'quote_order_quantity', '__weakref__')
+
+    execution_type = "TRADE"
+    order_reject_reason = "NONE"
+    last_executed_quantity = "0.0"
+    last_executed_price = "0.0"
+    commission_amount = "0.0"
+    commission_asset = ""
+    trade_id = -1
+    ignore_a = 0
+    in_order_book = True
+    is_maker_side = False
+    ignore_b = False
+    last_quote_asset_transacted = "0.0"
+
     def __init__(self, event_data: {}):
         self.symbol = event_data["symbol"]
         self.client_order_id = event_data["clientOrderId"]
@@ -19,59 +48,55 @@ class OrderUpdateEvent:
         self.iceberg_quantity = event_data["icebergQty"]
         self.order_list_id = event_data["orderListId"]
         self.original_client_id = event_data["clientOrderId"]
-        self.execution_type = "TRADE"
         self.order_status = event_data["status"]
-        self.order_reject_reason = "NONE"
         self.order_id = event_data["orderId"]
-        self.last_executed_quantity = "0.0"
         self.cumulative_filled_quantity = event_data["executedQty"]
-        self.last_executed_price = "0.0"
-        self.commission_amount = "0.0"
-        self.commission_asset = ""
         self.transaction_time = event_data["updateTime"]
-        self.trade_id = -1
-        self.ignore_a = int()
-        self.in_order_book = True
-        self.is_maker_side = False
-        self.ignore_b = False
         self.order_creation_time = event_data["time"]
         self.quote_asset_transacted = event_data["cummulativeQuoteQty"]
-        self.last_quote_asset_transacted = "0.0"
         self.quote_order_quantity = event_data["origQuoteOrderQty"]
 
 
 class OrderTradesEvent:
+    """
+    Order trade from REST as executionReport event
+    """
+    __slots__ = ('symbol', 'order_id', 'last_executed_quantity', 'last_executed_price', 'commission_amount',
+                 'commission_asset', 'transaction_time', 'trade_id', 'order_creation_time',
+                 'last_quote_asset_transacted', 'side', '__weakref__')
+
+    client_order_id = ""
+    order_type = "LIMIT"
+    time_in_force = "GTC"
+    order_quantity = "0"
+    order_price = "0"
+    stop_price = "0"
+    iceberg_quantity = "0"
+    order_list_id = -1
+    original_client_id = ""
+    execution_type = "TRADE"
+    order_status = "PARTIALLY_FILLED"
+    order_reject_reason = "NONE"
+    cumulative_filled_quantity = "0"
+    ignore_a = 0
+    in_order_book = True
+    is_maker_side = False
+    ignore_b = False
+    quote_asset_transacted = "0"
+    quote_order_quantity = "0"
+
     def __init__(self, event_data: {}):
         self.symbol = event_data["symbol"]
-        self.client_order_id = ""
-        self.side = "BUY" if event_data["isBuyer"] else "SELL"
-        self.order_type = "LIMIT"
-        self.time_in_force = "GTC"
-        self.order_quantity = "0"
-        self.order_price = "0"
-        self.stop_price = "0"
-        self.iceberg_quantity = "0"
-        self.order_list_id = -1
-        self.original_client_id = ""
-        self.execution_type = "TRADE"
-        self.order_status = "PARTIALLY_FILLED"
-        self.order_reject_reason = "NONE"
         self.order_id = event_data["orderId"]
         self.last_executed_quantity = event_data["qty"]
-        self.cumulative_filled_quantity = "0"
         self.last_executed_price = event_data["price"]
         self.commission_amount = event_data["commission"]
         self.commission_asset = event_data["commissionAsset"]
         self.transaction_time = event_data["time"]
         self.trade_id = event_data["id"]
-        self.ignore_a = int()
-        self.in_order_book = True
-        self.is_maker_side = False
-        self.ignore_b = False
         self.order_creation_time = event_data["time"]
-        self.quote_asset_transacted = "0"
         self.last_quote_asset_transacted = event_data["quoteQty"]
-        self.quote_order_quantity = "0"
+        self.side = "BUY" if event_data["isBuyer"] else "SELL"
 
 
 def generate_signature(exchange, api_secret, data):
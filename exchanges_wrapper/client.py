@@ -1,12 +1,11 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
-import aiohttp
 from enum import Enum
 from typing import Union
 import decimal
-import math
 import asyncio
+import functools
 import random
 import logging
 import time
@@ -14,13 +13,17 @@ from collections import defaultdict
 
 
 from exchanges_wrapper.http_client import HttpClient
-from exchanges_wrapper.errors import ExchangePyError, RateLimitReached
+from exchanges_wrapper.http_session import get_session, release_session
+from exchanges_wrapper.exchange_info import get_exchange_info
+from exchanges_wrapper.kline_cache import get_kline_store
+from exchanges_wrapper import kline_columns
+from exchanges_wrapper.errors import ExchangePyError, ExchangeError, RateLimitReached
 from exchanges_wrapper.web_sockets import UserEventsDataStream,\
-                                            MarketEventsDataStream,\
                                             FtxPrivateEventsDataStream,\
                                             BfxPrivateEventsDataStream,\
-                                            HbpPrivateEventsDataStream
-from exchanges_wrapper.definitions import OrderType
+                                            HbpPrivateEventsDataStream,\
+                                            MarketStreamsManager
+from exchanges_wrapper.definitions import OrderType, TimeInForce
 from exchanges_wrapper.events import Events
 import exchanges_wrapper.ftx_parser as ftx
 import exchanges_wrapper.bitfinex_parser as bfx
@@ -29,11 +32,17 @@ import exchanges_wrapper.huobi_parser as hbp
 logger = logging.getLogger('exch_srv_logger')
 
 STATUS_TIMEOUT = 5  # sec
+BFX_BATCH_LIMIT = 75  # ops in order/multi
+HBP_BATCH_LIMIT = 10  # orders in batch-orders
+HBP_BATCH_CANCEL_LIMIT = 50  # order-ids in batchcancel
 BINANCE_ENDPOINT_WS = "wss://stream.binance.com:9443"
-
-
-def truncate(f, n):
-    return math.floor(f * 10 ** n) / 10 ** n
+# Valid depth for REST order book request
+ORDER_BOOK_LIMITS = {
+    'binance': (5, 10, 20, 50, 100, 500, 1000, 5000),
+    'ftx': (5, 10, 20, 50, 100),
+    'bitfinex': (1, 25, 100),
+    'huobi': (5, 10, 20),
+}
 
 
 class Client:
@@ -61,7 +70,8 @@ class Client:
         self.endpoint_ws_auth = endpoint_ws_auth
         self.ws_public_mbr = ws_public_mbr
         #
-        self.session = aiohttp.ClientSession()
+        self.session = get_session(exchange, endpoint_api_auth, proxy)
+        self.ws_session = get_session(exchange, endpoint_ws_public, proxy, ws=True)
         self.http = HttpClient(
             api_key,
             api_secret,
@@ -75,41 +85,52 @@ class Client:
         self.user_agent = user_agent
         self.proxy = proxy
         self.loaded = False
-        self.symbols = {}
         self.highest_precision = None
         self.rate_limits = None
         self.data_streams = defaultdict(set)
         self.active_orders = {}
         self.wss_buffer = {}
         self.stream_queue = defaultdict(set)
+        self.stream_queue_released = asyncio.Event()
         self.hbp_account_id = None
+        self.exchange_info = get_exchange_info(exchange, endpoint_api_auth)
+        self.market_streams = MarketStreamsManager(self,
+                                                   BINANCE_ENDPOINT_WS if exchange == 'binance' else endpoint_ws_public,
+                                                   user_agent,
+                                                   exchange)
 
     async def load(self):
-        infos = await self.fetch_exchange_info()
+        infos = await self.exchange_info.get(self.fetch_exchange_info)
         if infos.get('success') or infos.get('serverTime'):
-            # load available symbols
-            self.highest_precision = 8
-            original_symbol_infos = infos["symbols"]
-            for symbol_infos in original_symbol_infos:
-                symbol = symbol_infos.pop("symbol")
-                precision = symbol_infos["baseAssetPrecision"]
-                if precision > self.highest_precision:
-                    self.highest_precision = precision
-                symbol_infos["filters"] = dict(
-                    map(lambda x: (x.pop("filterType"), x), symbol_infos["filters"])
-                )
-                self.symbols[symbol] = symbol_infos
+            self.highest_precision = self.exchange_info.highest_precision
             decimal.getcontext().prec = (
                 self.highest_precision + 4
             )  # for operations and rounding
             # load rate limits
             self.rate_limits = infos["rateLimits"]
+            self.http.set_rate_limits(self.rate_limits)
+            if self.exchange == 'huobi' and self.hbp_account_id is None:
+                await self.fetch_hbp_account_id()
             self.loaded = True
         else:
             raise UserWarning("Can't get exchange info, check availability and operational status of the exchange")
 
+    @property
+    def symbols(self) -> {}:
+        """
+        Available symbols, shared with other accounts, read only. Read from cache on access,
+        background refresh replace it
+        """
+        return self.exchange_info.symbols_filters
+
+    @property
+    def quantizers(self) -> {}:
+        return self.exchange_info.quantizers
+
     async def close(self):
-        await self.session.close()
+        await self.market_streams.stop()
+        await release_session(self.session)
+        await release_session(self.ws_session)
 
     @property
     def events(self):
@@ -153,42 +174,38 @@ class Client:
 
     async def start_market_events_listener(self, _trade_id):
         _events = self.events.registered_streams.get(self.exchange, {}).get(_trade_id, set())
-        start_list = []
         logger.debug(f"Start '{self.exchange}' market events listener: ({', '.join(_events)}) for {_trade_id}")
-        if self.exchange == 'binance':
-            _endpoint = BINANCE_ENDPOINT_WS
-            market_data_stream = MarketEventsDataStream(self, _endpoint, self.user_agent, self.exchange, _trade_id)
-            self.data_streams[_trade_id] |= {market_data_stream}
-            start_list.append(market_data_stream.start())
-        else:
-            _endpoint = self.endpoint_ws_public
-            for channel in _events:
-                market_data_stream = MarketEventsDataStream(self,
-                                                            _endpoint,
-                                                            self.user_agent,
-                                                            self.exchange,
-                                                            _trade_id,
-                                                            channel)
-                self.data_streams[_trade_id] |= {market_data_stream}
-                start_list.append(market_data_stream.start())
-        await asyncio.gather(*start_list, return_exceptions=True)
+        await self.market_streams.subscribe(_trade_id, _events)
 
     async def stop_events_listener(self, _trade_id):
         logger.info(f"Stop events listener data streams for {_trade_id}")
         stopped_data_stream = self.data_streams.pop(_trade_id, set())
         for data_stream in stopped_data_stream:
             await data_stream.stop()
+        await self.market_streams.unsubscribe(_trade_id)
+
+    def release_stream_queue(self, trade_id, _queue):
+        self.stream_queue.get(trade_id, set()).discard(_queue)
+        self.stream_queue_released.set()
+
+    async def wait_stream_queues_released(self, trade_id):
+        while self.stream_queue.get(trade_id):
+            self.stream_queue_released.clear()
+            await self.stream_queue_released.wait()
 
     def assert_symbol_exists(self, symbol):
         if self.loaded and symbol not in self.symbols:
             raise ExchangePyError(f"Symbol {symbol} is not valid according to the loaded exchange infos.")
 
+    def get_symbol_info(self, symbol) -> {}:
+        return self.symbols.get(symbol)
+
     def symbol_to_ftx(self, symbol) -> str:
-        symbol_info = self.symbols.get(symbol)
+        symbol_info = self.get_symbol_info(symbol)
         return f"{symbol_info.get('baseAsset')}/{symbol_info.get('quoteAsset')}"
 
     def symbol_to_bfx(self, symbol) -> str:
-        symbol_info = self.symbols.get(symbol)
+        symbol_info = self.get_symbol_info(symbol)
         base_asset = symbol_info.get('baseAsset')
         quote_asset = symbol_info.get('quoteAsset')
         if len(base_asset) > 3 or len(quote_asset) > 3:
@@ -205,36 +222,27 @@ class Client:
             self.active_orders[order_id]['filledTime'] = limit_time + 60 * 30
 
     def refine_amount(self, symbol, amount: Union[str, decimal.Decimal], quote=False):
+        if self.loaded:
+            quantizer = self.quantizers[symbol]
+            return (quantizer.quote if quote else quantizer.amount)(amount)
         if type(amount) is str:  # to save time for developers
             amount = decimal.Decimal(amount)
-        if self.loaded:
-            precision = self.symbols[symbol]["baseAssetPrecision"]
-            lot_size_filter = self.symbols[symbol]["filters"]["LOT_SIZE"]
-            step_size = decimal.Decimal(lot_size_filter["stepSize"])
-            # noinspection PyStringFormat
-            amount = (
-                (f"%.{precision}f" % truncate(amount if quote else (amount - amount % step_size), precision))
-                .rstrip("0")
-                .rstrip(".")
-            )
         return amount
 
     def refine_price(self, symbol, price: Union[str, decimal.Decimal]) -> decimal.Decimal:
+        if self.loaded:
+            return self.quantizers[symbol].price(price)
         if isinstance(price, str):  # to save time for developers
             price = decimal.Decimal(price)
-
-        if self.loaded:
-            precision = self.symbols[symbol]["baseAssetPrecision"]
-            price_filter = self.symbols[symbol]["filters"]["PRICE_FILTER"]
-            price = price - (price % decimal.Decimal(price_filter["tickSize"]))
-            # noinspection PyStringFormat
-            price = (
-                (f"%.{precision}f" % truncate(price, precision))
-                .rstrip("0")
-                .rstrip(".")
-            )
         return price
 
+    def refine_amounts(self, symbol, amounts: [], quote=False) -> []:
+        quantizer = self.quantizers[symbol]
+        return (quantizer.quote if quote else quantizer.amount).many(amounts)
+
+    def refine_prices(self, symbol, prices: []) -> []:
+        return self.quantizers[symbol].price.many(prices)
+
     def assert_symbol(self, symbol):
         if not symbol:
             raise ValueError("This query requires a symbol.")
@@ -293,29 +301,29 @@ class Client:
         elif self.exchange == 'huobi':
             server_time = await self.fetch_server_time()
             trading_symbols = await self.http.send_api_call("v1/common/symbols", send_api_key=False)
-            if self.hbp_account_id is None:
-                accounts = await self.http.send_api_call("v1/account/accounts", signed=True)
-                for account in accounts:
-                    if account.get('type') == 'spot':
-                        self.hbp_account_id = account.get('id')
-                        break
             binance_res = hbp.exchange_info(server_time.get('serverTime'), trading_symbols)
         return binance_res
 
+    async def fetch_hbp_account_id(self):
+        accounts = await self.http.send_api_call("v1/account/accounts", signed=True)
+        for account in accounts:
+            if account.get('type') == 'spot':
+                self.hbp_account_id = account.get('id')
+                break
+
     # MARKET DATA ENDPOINTS
 
     # https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#order-book
+    def order_book_limit(self, depth: int) -> int:
+        """
+        The nearest valid limit for fetch_order_book not less than depth, the deepest one if depth is over it
+        """
+        valid_limits = ORDER_BOOK_LIMITS.get(self.exchange, ())
+        return next((i for i in valid_limits if i >= depth), valid_limits[-1] if valid_limits else depth)
+
     async def fetch_order_book(self, symbol, precision='P0', limit=100):
         self.assert_symbol(symbol)
-        valid_limits = []
-        if self.exchange == 'binance':
-            valid_limits = [5, 10, 20, 50, 100, 500, 1000, 5000]
-        elif self.exchange == 'ftx':
-            valid_limits = [5, 10, 20, 50, 100]
-        elif self.exchange == 'bitfinex':
-            valid_limits = [1, 25, 100]
-        elif self.exchange == 'huobi':
-            valid_limits = [5, 10, 20]
+        valid_limits = ORDER_BOOK_LIMITS.get(self.exchange, ())
         binance_res = {}
         if limit in valid_limits:
             if self.exchange == 'binance':
@@ -413,9 +421,14 @@ class Client:
         )
 
     # https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#klinecandlestick-data
-    async def fetch_klines(self, symbol, interval, start_time=None, end_time=None, limit=500):
+    async def fetch_klines(self, symbol, interval, start_time=None, end_time=None, limit=500, columnar=False):
+        """
+        :param columnar: if numpy is installed, return Klines with NumPy column per candle field,
+         else and by default list of Binance-like lists
+        """
         self.assert_symbol(symbol)
-        interval = str(self.enum_to_value(interval))
+        columnar = columnar and kline_columns.np is not None
+        interval = kline_interval = str(self.enum_to_value(interval))
         if self.exchange == 'ftx':
             interval = ftx.interval(interval)
         elif self.exchange == 'huobi':
@@ -424,7 +437,37 @@ class Client:
                 (self.exchange == 'bitfinex' and
                  interval not in ('1m', '5m', '15m', '30m', '1h', '3h', '6h', '12h', '1D', '1W', '14D', '1M'))):
             raise ValueError("This query requires correct interval value")
-
+        store = get_kline_store(self.exchange, self.endpoint_api_public, symbol, kline_interval)
+        if store is None:
+            return await self._fetch_klines(symbol, interval, start_time, end_time, limit, columnar)
+        return await store.get(start_time, end_time, limit, functools.partial(self._fetch_klines, symbol, interval),
+                               columnar)
+
+    def kline_update(self, event):
+        """
+        Candle from WSS to the klines cache, if it was requested by fetch_klines
+        """
+        store = get_kline_store(self.exchange, self.endpoint_api_public, event.symbol.upper(), event.kline_interval,
+                                create=False)
+        if store is not None:
+            store.update([event.kline_start_time,
+                          event.kline_open_price,
+                          event.kline_high_price,
+                          event.kline_low_price,
+                          event.kline_close_price,
+                          event.kline_base_asset_volume,
+                          event.kline_close_time,
+                          event.kline_quote_asset_volume,
+                          event.kline_trades_number,
+                          event.kline_taker_buy_base_asset_volume,
+                          event.kline_taker_buy_quote_asset_volume,
+                          event.kline_ignore],
+                         event.kline_closed)
+
+    async def _fetch_klines(self, symbol, interval, start_time, end_time, limit, columnar=False):
+        """
+        One REST page, interval as exchange resolution
+        """
         binance_res = []
         if self.exchange == 'binance':
             if limit == 500:
@@ -443,8 +486,8 @@ class Client:
                 "/api/v3/klines", params=params, signed=False
             )
         elif self.exchange == 'ftx':
-            end_time = int(time.time())
-            start_time = end_time - interval * limit - 1
+            end_time = end_time // 1000 if end_time else int(time.time())
+            start_time = start_time // 1000 if start_time else end_time - interval * limit - 1
             params = {
                 'resolution': interval,
                 'start_time': start_time,
@@ -454,7 +497,7 @@ class Client:
                 send_api_key=False,
                 **params,
             )
-            binance_res = ftx.klines(res, interval)
+            binance_res = ftx.klines_columns(res, interval) if columnar else ftx.klines(res, interval)
         elif self.exchange == 'bitfinex':
             params = {'limit': limit, 'sort': -1}
             if start_time:
@@ -469,17 +512,27 @@ class Client:
             if res and isinstance(res, list):
                 res.sort(reverse=False)
             if res:
-                binance_res = bfx.klines(res, interval)
+                binance_res = bfx.klines_columns(res, interval) if columnar else bfx.klines(res, interval)
         elif self.exchange == 'huobi':
             params = {'symbol': symbol.lower(),
                       'period': interval,
                       'size': limit}
+            if start_time:
+                # No time range for history, only the last candles, up to 2000
+                params['size'] = min(2000, (int(time.time() * 1000) - start_time)
+                                     // (hbp.interval2value(interval) * 1000) + 2)
             res = await self.http.send_api_call(
                 "market/history/kline",
                 **params,
             )
             # print(f"fetch_klines.res: {res[::-1]}")
-            binance_res = hbp.klines(res[::-1], interval)
+            if columnar:
+                binance_res = hbp.klines_columns(res[::-1], interval).between(start_time, end_time)
+            else:
+                binance_res = [i for i in hbp.klines(res[::-1], interval)
+                               if (not start_time or i[0] >= start_time) and (not end_time or i[0] <= end_time)]
+        if columnar and isinstance(binance_res, list):
+            binance_res = kline_columns.Klines.from_rows(binance_res)
         return binance_res
 
     # https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#current-average-price
@@ -709,20 +762,7 @@ class Client:
             )
             logger.debug(f"create_order.res: {res}")
             if res and isinstance(res, list) and res[6] == 'SUCCESS':
-                order_id = res[4][0][0]
-                ahead_ws = self.wss_buffer.pop(order_id, [])
-                logger.debug(f"create_order.ahead_ws: {ahead_ws}")
-                binance_res = bfx.order(res[4][0], response_type=False, wss_te=ahead_ws)
-                self.active_orders.update(
-                    {order_id:
-                        {'filledTime': int(),
-                         'origQty': quantity,
-                         'executedQty': "0",
-                         'lastEvent': (),
-                         'cancelled': False
-                         }
-                     }
-                )
+                binance_res = self._bfx_order_placed(res[4][0], quantity)
         elif self.exchange == 'huobi':
             params = {
                 'account-id': str(self.hbp_account_id),
@@ -859,18 +899,7 @@ class Client:
                 method="DELETE",
                 signed=True,
              )
-            order_cancelled = False
-            timeout = STATUS_TIMEOUT
-            while not order_cancelled and timeout:
-                timeout -= 1
-                binance_res = await self.fetch_order(symbol,
-                                                     order_id,
-                                                     origin_client_order_id,
-                                                     receive_window,
-                                                     response_type=True,
-                                                     )
-                order_cancelled = bool(binance_res.get('status') == 'CANCELED')
-                await asyncio.sleep(1)
+            binance_res = await self._wait_cancelled(symbol, order_id, receive_window)
         elif self.exchange == 'bitfinex':
             if not order_id:
                 raise ValueError(
@@ -884,31 +913,208 @@ class Client:
                 **params
             )
             if res and isinstance(res, list) and res[6] == 'SUCCESS':
-                timeout = STATUS_TIMEOUT / 0.1
-                while timeout:
-                    timeout -= 1
-                    if self.active_orders.get(order_id, {}).get('cancelled', False):
-                        binance_res = bfx.order(res[4], response_type=True)
-                        binance_res.update({"status": 'CANCELED'})
-                        break
-                    await asyncio.sleep(0.1)
-                logger.debug(f"cancel_order.bitfinex {order_id}: timeout: {timeout}")
+                binance_res = await self._bfx_wait_cancelled(order_id, res[4])
         elif self.exchange == 'huobi':
             res = await self.http.send_api_call(
                 f"v1/order/orders/{order_id}/submitcancel",
                 method="POST",
                 signed=True
             )
-            order_cancelled = False
-            timeout = STATUS_TIMEOUT
-            while res and not order_cancelled and timeout:
-                timeout -= 1
-                binance_res = await self.fetch_order(symbol, order_id=res, response_type=True)
-                order_cancelled = bool(binance_res.get('status') == 'CANCELED')
-                await asyncio.sleep(1)
+            if res:
+                binance_res = await self._wait_cancelled(symbol, res)
         logger.debug(f"cancel_order.binance_res: {binance_res}")
         return binance_res
 
+    def _bfx_order_placed(self, order: [], quantity) -> {}:
+        order_id = order[0]
+        ahead_ws = self.wss_buffer.pop(order_id, [])
+        logger.debug(f"create_order.ahead_ws: {ahead_ws}")
+        binance_res = bfx.order(order, response_type=False, wss_te=ahead_ws)
+        self.active_orders.update(
+            {order_id:
+                {'filledTime': int(),
+                 'origQty': quantity,
+                 'executedQty': "0",
+                 'lastEvent': (),
+                 'cancelled': False
+                 }
+             }
+        )
+        return binance_res
+
+    async def _bfx_wait_cancelled(self, order_id, order: []) -> {}:
+        # Bitfinex confirm cancellation over WSS only
+        binance_res = {}
+        timeout = STATUS_TIMEOUT / 0.1
+        while timeout:
+            timeout -= 1
+            if self.active_orders.get(order_id, {}).get('cancelled', False):
+                binance_res = bfx.order(order, response_type=True)
+                binance_res.update({"status": 'CANCELED'})
+                break
+            await asyncio.sleep(0.1)
+        logger.debug(f"cancel_order.bitfinex {order_id}: timeout: {timeout}")
+        return binance_res
+
+    async def _wait_cancelled(self, symbol, order_id, receive_window=None) -> {}:
+        binance_res = {}
+        timeout = STATUS_TIMEOUT
+        while timeout:
+            timeout -= 1
+            binance_res = await self.fetch_order(symbol, order_id, receive_window=receive_window, response_type=True)
+            if binance_res.get('status') == 'CANCELED':
+                break
+            await asyncio.sleep(1)
+        return binance_res
+
+    @staticmethod
+    async def _gather_chunks(batch, symbol, items: [], size) -> []:
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        results = await asyncio.gather(*[batch(symbol, chunk) for chunk in chunks], return_exceptions=True)
+        res = []
+        for chunk, result in zip(chunks, results):
+            res.extend([result] * len(chunk) if isinstance(result, Exception) else result)
+        return res
+
+    async def create_orders(self, symbol, orders: [], receive_window=None) -> []:
+        """
+        Batch of LIMIT GTC orders, use native batch endpoint if exist, else concurrent calls under rate limiter
+        :param orders: [{'side', 'quantity', 'price', 'new_client_order_id'}]
+        :return: list in the same order, item is order as create_order() result or Exception
+        """
+        self.assert_symbol(symbol)
+        if self.exchange == 'bitfinex':
+            return await self._gather_chunks(self._bfx_create_orders, symbol, orders, BFX_BATCH_LIMIT)
+        if self.exchange == 'huobi':
+            return await self._gather_chunks(self._hbp_create_orders, symbol, orders, HBP_BATCH_LIMIT)
+        return await asyncio.gather(
+            *[self.create_order(symbol,
+                                order['side'],
+                                OrderType.LIMIT,
+                                time_in_force=TimeInForce.GTC,
+                                quantity=order['quantity'],
+                                price=order['price'],
+                                new_client_order_id=order.get('new_client_order_id'),
+                                response_type='RESULT',
+                                receive_window=receive_window) for order in orders],
+            return_exceptions=True
+        )
+
+    # https://docs.bitfinex.com/reference/rest-auth-order-multi
+    async def _bfx_create_orders(self, symbol, orders: []) -> []:
+        ops = []
+        for order in orders:
+            side = self.enum_to_value(order['side'])
+            params = {
+                "type": "EXCHANGE LIMIT",
+                "symbol": self.symbol_to_bfx(symbol),
+                "price": order['price'],
+                "amount": str((float(order['quantity']) * (1 if side == 'BUY' else -1))),
+                "meta": {"aff_code": "v_4az2nCP"}
+            }
+            if order.get('new_client_order_id'):
+                params["cid"] = order['new_client_order_id']
+            ops.append(["on", params])
+        res = await self.http.send_api_call(
+            "v2/auth/w/order/multi",
+            method="POST",
+            signed=True,
+            ops=ops,
+        )
+        logger.debug(f"create_orders.res: {res}")
+        if not (res and isinstance(res, list) and res[6] == 'SUCCESS'):
+            raise ExchangeError(f"Bitfinex order/multi failed: {res}")
+        binance_res = []
+        for order, notification in zip(orders, res[4]):
+            if notification[6] == 'SUCCESS':
+                data = notification[4]
+                binance_res.append(self._bfx_order_placed(data[0] if isinstance(data[0], list) else data,
+                                                          order['quantity']))
+            else:
+                binance_res.append(ExchangeError(f"{notification[6]}: {notification[7]}"))
+        return binance_res
+
+    # https://huobiapi.github.io/docs/spot/v1/en/#place-a-batch-of-orders
+    async def _hbp_create_orders(self, symbol, orders: []) -> []:
+        payload = []
+        for order in orders:
+            params = {
+                'account-id': str(self.hbp_account_id),
+                'symbol': symbol.lower(),
+                'type': f"{self.enum_to_value(order['side']).lower()}-limit",
+                'amount': order['quantity'],
+                'price': order['price'],
+                'source': "spot-api"
+            }
+            if order.get('new_client_order_id'):
+                params["client-order-id"] = str(order['new_client_order_id'])
+            payload.append(params)
+        res = await self.http.send_api_call(
+            "v1/order/batch-orders",
+            method="POST",
+            signed=True,
+            timeout=STATUS_TIMEOUT,
+            payload=payload,
+        )
+        logger.debug(f"create_orders.res: {res}")
+        placed = [item.get('order-id') for item in res]
+        fetched = await asyncio.gather(
+            *[self.fetch_order(symbol, order_id=order_id, response_type=False) for order_id in placed if order_id],
+            return_exceptions=True
+        )
+        fetched = iter(fetched)
+        return [next(fetched) if order_id else ExchangeError(f"{item.get('err-code')}: {item.get('err-msg')}")
+                for order_id, item in zip(placed, res)]
+
+    async def cancel_orders(self, symbol, order_ids: [], receive_window=None) -> []:
+        """
+        Batch cancel, use native batch endpoint if exist, else concurrent calls under rate limiter
+        :return: list in the same order, item is order as cancel_order() result or Exception
+        """
+        self.assert_symbol(symbol)
+        if self.exchange == 'bitfinex':
+            return await self._gather_chunks(self._bfx_cancel_orders, symbol, order_ids, BFX_BATCH_LIMIT)
+        if self.exchange == 'huobi':
+            return await self._gather_chunks(self._hbp_cancel_orders, symbol, order_ids, HBP_BATCH_CANCEL_LIMIT)
+        return await asyncio.gather(
+            *[self.cancel_order(symbol, order_id=order_id, receive_window=receive_window) for order_id in order_ids],
+            return_exceptions=True
+        )
+
+    async def _bfx_cancel_orders(self, _symbol, order_ids: []) -> []:
+        res = await self.http.send_api_call(
+            "v2/auth/w/order/cancel/multi",
+            method="POST",
+            signed=True,
+            id=order_ids,
+        )
+        if not (res and res[6] == 'SUCCESS'):
+            raise ExchangeError(f"Bitfinex order/cancel/multi failed: {res}")
+        orders = {order[0]: order for order in res[4]}
+        cancelled = iter(await asyncio.gather(
+            *[self._bfx_wait_cancelled(order_id, orders[order_id]) for order_id in order_ids if order_id in orders],
+            return_exceptions=True
+        ))
+        return [next(cancelled) if order_id in orders else ExchangeError(f"Order {order_id} not cancelled")
+                for order_id in order_ids]
+
+    # https://huobiapi.github.io/docs/spot/v1/en/#submit-cancel-for-multiple-orders-by-ids
+    async def _hbp_cancel_orders(self, symbol, order_ids: []) -> []:
+        res = await self.http.send_api_call(
+            "v1/order/orders/batchcancel",
+            method="POST",
+            signed=True,
+            **{'order-ids': [str(order_id) for order_id in order_ids]},
+        )
+        failed = {str(item.get('order-id')): item for item in res.get('failed') or []}
+        cancelled = iter(await asyncio.gather(
+            *[self._wait_cancelled(symbol, order_id) for order_id in order_ids if str(order_id) not in failed],
+            return_exceptions=True
+        ))
+        return [ExchangeError(f"{failed[str(order_id)].get('err-code')}: {failed[str(order_id)].get('err-msg')}")
+                if str(order_id) in failed else next(cancelled)
+                for order_id in order_ids]
+
     # https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md#cancel-all-open-orders-on-a-symbol-trade
     async def cancel_all_orders(self, symbol, receive_window=None):
         self.assert_symbol(symbol)
@@ -4,36 +4,117 @@
 import asyncio
 import functools
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from exchanges_wrapper.errors import UnknownEventType
+from exchanges_wrapper.c_structures import field
 
 logger = logging.getLogger('exch_srv_logger')
 
 
+# Handler kinds, classified once per handler
+INLINE = 0  # sync non-blocking, called in event loop
+COROUTINE = 1  # awaited
+BLOCKING = 2  # sync, run in blocking executor
+
+BLOCKING_WORKERS = 4
+BLOCKING_PENDING = 1000  # over it events for blocking handlers are dropped
+
+
+def non_blocking(func):
+    """
+    Decorator for sync handler that is fast and never blocks, it is called inline in event loop
+    """
+    func.non_blocking = True
+    return func
+
+
+def handler_kind(func) -> int:
+    if asyncio.iscoroutinefunction(func):
+        return COROUTINE
+    target = func
+    while isinstance(target, functools.partial):
+        target = target.func
+    return INLINE if getattr(target, 'non_blocking', False) else BLOCKING
+
+
+class BlockingExecutor:
+    """
+    Bounded thread pool for blocking user handlers, shared by all Handlers
+    """
+    executor = None
+    pending = 0
+    dropped = 0
+
+    @classmethod
+    def submit(cls, func, args, kwargs) -> None:
+        if cls.pending >= BLOCKING_PENDING:
+            cls.dropped += 1
+            if cls.dropped & (cls.dropped - 1) == 0:  # 1, 2, 4, ...
+                logger.warning(f"BlockingExecutor: {cls.pending} handlers pending, dropped: {cls.dropped}")
+            return
+        if cls.executor is None:
+            cls.executor = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix='events_handler')
+        cls.pending += 1
+        future = asyncio.get_running_loop().run_in_executor(cls.executor, functools.partial(func, *args, **kwargs))
+        future.add_done_callback(cls._done)
+
+    @classmethod
+    def _done(cls, _future) -> None:
+        cls.pending -= 1
+
+
 # based on: https://stackoverflow.com/a/2022629/10144963
 class Handlers(list):
+    def __init__(self, *args, kinds=None):
+        super().__init__(*args)
+        self.kinds = {} if kinds is None else kinds  # handler: kind, shared by copies of the list
+
+    def append(self, func) -> None:
+        self.kinds[func] = handler_kind(func)
+        super().append(func)
+
     async def __call__(self, *args, **kwargs):
-        loop = asyncio.get_running_loop()
+        kinds = self.kinds
         for func in self:
-            if asyncio.iscoroutinefunction(func):
+            kind = kinds.get(func)
+            if kind is None:
+                kind = kinds[func] = handler_kind(func)
+            if kind == INLINE:
+                func(*args, **kwargs)
+            elif kind == COROUTINE:
                 await func(*args, **kwargs)
-                continue
-            if kwargs:
-                func = functools.partial(func, **kwargs)
-            loop.run_in_executor(None, func, *args)
+            else:
+                BlockingExecutor.submit(func, args, kwargs)
 
     def __repr__(self):
         return f"Handlers({list.__repr__(self)})"
 
 
 class Events:
+    """
+    Handlers lists are copy-on-write: register and unregister replace the list, so a dispatch in progress
+    keeps iterating the list it started with
+    """
     def __init__(self):
-        self.handlers = defaultdict(Handlers)
+        self.handlers = {}
+        self.routes = {}
+        self.trade_id_handlers = defaultdict(list)  # trade_id: [(event_type, handler)], for unregister
         self.registered_streams = defaultdict(lambda: defaultdict(set))
+        self.stream_registered = asyncio.Event()
+
+    def _add(self, event_type, listener, trade_id) -> None:
+        handlers = self.handlers.get(event_type)
+        handlers = Handlers() if handlers is None else Handlers(handlers, kinds=handlers.kinds)
+        handlers.append(listener)
+        self.handlers[event_type] = handlers
+        self._route(event_type)
+        if trade_id is not None:
+            self.trade_id_handlers[trade_id].append((event_type, listener))
 
-    def register_user_event(self, listener, event_type):
-        self.handlers[event_type].append(listener)
+    def register_user_event(self, listener, event_type, trade_id=None):
+        self._add(event_type, listener, trade_id)
 
     def register_event(self, listener, event_type, exchange, trade_id):
         logger.info(f"register: event_type: {event_type}, exchange: {exchange}")
@@ -42,56 +123,78 @@ class Events:
             event_type = f"{event_type.split('@')[0].replace('/', '').lower()}@{event_type.split('@')[1]}"
         elif exchange == 'bitfinex':
             event_type = f"{event_type.split('@')[0][1:].replace(':', '').lower()}@{event_type.split('@')[1]}"
-        self.handlers[event_type].append(listener)
+        self._add(event_type, listener, trade_id)
         logger.debug(f"register_event: registered_streams{self.registered_streams}")
+        self.stream_registered.set()
+
+    def streams_count(self, trade_id) -> int:
+        return sum(len(streams.get(trade_id, ())) for streams in self.registered_streams.values())
+
+    async def wait_streams(self, trade_id, count):
+        """
+        Wake up on each register_event until trade_id has at least count streams
+        """
+        while self.streams_count(trade_id) < count:
+            self.stream_registered.clear()
+            await self.stream_registered.wait()
 
     def unregister(self, exchange, trade_id):
+        """
+        Remove handlers of trade_id by index, only event types it registered are visited
+        """
         logger.info(f"Unregister events for {trade_id}")
-        _event_types = self.handlers.keys()
-        unregistered_event_types = []
-        for _event_type in _event_types:
-            _handlers = self.handlers.get(_event_type, [])
-            _handlers[:] = [i for i in _handlers if i.args[2] != trade_id]
+        removed = defaultdict(list)
+        for event_type, listener in self.trade_id_handlers.pop(trade_id, ()):
+            removed[event_type].append(listener)
+        for event_type, listeners in removed.items():
+            handlers = self.handlers.get(event_type)
+            if handlers is None:
+                continue
+            _handlers = Handlers(handlers, kinds=handlers.kinds)
+            for listener in listeners:
+                if listener in _handlers:
+                    _handlers.remove(listener)
+                _handlers.kinds.pop(listener, None)
             if _handlers:
-                self.handlers.update({_event_type: _handlers})
+                self.handlers[event_type] = _handlers
             else:
-                unregistered_event_types.append(_event_type)
-        for _event_type in unregistered_event_types:
-            self.handlers.pop(_event_type, None)
+                self.handlers.pop(event_type, None)
+            self._route(event_type)
         self.registered_streams.get(exchange, {}).pop(trade_id, None)
 
+    def _route(self, key) -> None:
+        """
+        Keep routing table in step with handlers: stream or event type -> (wrapper class, handlers)
+        """
+        wrapper = event_wrapper(key)
+        handlers = self.handlers.get(key)
+        if wrapper and handlers is not None:
+            self.routes[key] = (wrapper, handlers)
+        else:
+            self.routes.pop(key, None)
+
     def wrap_event(self, event_data):
         # print(f"wrap_event.event_data: {event_data}")
-        wrapper_by_type = {
-            "outboundAccountPosition": OutboundAccountPositionWrapper,
-            "balanceUpdate": BalanceUpdateWrapper,
-            "executionReport": OrderUpdateWrapper,
-            "listStatus": ListStatus,
-            "aggTrade": AggregateTradeWrapper,
-            "trade": TradeWrapper,
-            "kline": KlineWrapper,
-            "24hrMiniTicker": SymbolMiniTickerWrapper,
-            "24hrTicker": SymbolTickerWrapper,
-            "bookTicker": SymbolBookTickerWrapper,
-            "depth5": PartialBookDepthWrapper,
-            "depth10": PartialBookDepthWrapper,
-            "depth20": PartialBookDepthWrapper,
-            "depth": DiffDepthWrapper,
-        }
-
-        stream = event_data["stream"] if "stream" in event_data else False
-        event_type = event_data["e"] if "e" in event_data else stream
-        if "@" in event_type:  # lgtm [py/member-test-non-container]
-            event_type = event_type.split("@")[1]
-        if event_type.startswith("kline_"):
-            event_type = "kline"
-        if event_type not in wrapper_by_type:
-            raise UnknownEventType()
-        wrapper = wrapper_by_type[event_type]
-        return wrapper(event_data, self.handlers[stream if stream else event_type])
+        key = event_data.get("stream") or event_data.get("e")
+        route = self.routes.get(key)
+        if route is None:
+            # Not in routing table: late event after unregister, or stream name of unknown type
+            event_type = event_data.get("e")
+            wrapper = (key and event_wrapper(key)) or (event_type and event_wrapper(event_type))
+            if not wrapper:
+                raise UnknownEventType()
+            return wrapper(event_data, self.handlers.get(key) or Handlers())
+        return route[0](event_data, route[1])
 
 
 class EventWrapper:
+    """
+    Events that go to stream queues copy fields to slots and don't keep the source dict,
+    so only values are held while event wait for the consumer. On the hot path they set
+    handlers themselves, without super().__init__()
+    """
+    __slots__ = ('handlers', '__weakref__')
+
     def __init__(self, _event_data, handlers):
         self.handlers = handlers
 
@@ -100,44 +203,61 @@ class EventWrapper:
             await self.handlers(self)
 
 
+class LazyEventWrapper(EventWrapper):
+    """
+    Fields are read from the source event dict on access, see c_structures.field
+    """
+    __slots__ = ('event_data',)
+
+    def __init__(self, event_data, handlers):
+        super().__init__(event_data, handlers)
+        self.event_data = event_data
+
+
 # MARKET EVENTS
 
 
-class AggregateTradeWrapper(EventWrapper):
-    def __init__(self, event_data, handlers):  # lgtm [py/similar-function]
-        super().__init__(event_data, handlers)
-        self.event_type = event_data["e"]
-        self.event_time = event_data["E"]
-        self.symbol = event_data["s"]
-        self.aggregated_trade_id = event_data["a"]
-        self.price = event_data["p"]
-        self.quantity = event_data["q"]
-        self.first_trade_id = event_data["f"]
-        self.last_trade_id = event_data["l"]
-        self.trade_time = event_data["T"]
-        self.buyer_is_marker = event_data["m"]
-        self.ignore = event_data["M"]
-
-
-class TradeWrapper(EventWrapper):
-    def __init__(self, event_data, handlers):  # lgtm [py/similar-function]
-        super().__init__(event_data, handlers)
-        self.event_type = event_data["e"]
-        self.event_time = event_data["E"]
-        self.symbol = event_data["s"]
-        self.trade_id = event_data["t"]
-        self.price = event_data["p"]
-        self.quantity = event_data["q"]
-        self.buyer_order_id = event_data["b"]
-        self.seller_order_id = event_data["a"]
-        self.trade_time = event_data["T"]
-        self.buyer_is_marker = event_data["m"]
-        self.ignore = event_data["M"]
+class AggregateTradeWrapper(LazyEventWrapper):
+    __slots__ = ()
+
+    event_type = field("e")
+    event_time = field("E")
+    symbol = field("s")
+    aggregated_trade_id = field("a")
+    price = field("p")
+    quantity = field("q")
+    first_trade_id = field("f")
+    last_trade_id = field("l")
+    trade_time = field("T")
+    buyer_is_marker = field("m")
+    ignore = field("M")
+
+
+class TradeWrapper(LazyEventWrapper):
+    __slots__ = ()
+
+    event_type = field("e")
+    event_time = field("E")
+    symbol = field("s")
+    trade_id = field("t")
+    price = field("p")
+    quantity = field("q")
+    buyer_order_id = field("b")
+    seller_order_id = field("a")
+    trade_time = field("T")
+    buyer_is_marker = field("m")
+    ignore = field("M")
 
 
 class KlineWrapper(EventWrapper):
+    __slots__ = ('event_type', 'event_time', 'symbol', 'kline_start_time', 'kline_close_time', 'kline_symbol',
+                 'kline_interval', 'kline_first_trade_id', 'kline_last_trade_id', 'kline_open_price',
+                 'kline_close_price', 'kline_high_price', 'kline_low_price', 'kline_base_asset_volume',
+                 'kline_trades_number', 'kline_closed', 'kline_quote_asset_volume',
+                 'kline_taker_buy_base_asset_volume', 'kline_taker_buy_quote_asset_volume', 'kline_ignore')
+
     def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
+        self.handlers = handlers
         self.event_type = event_data["e"]
         self.event_time = event_data["E"]
         self.symbol = event_data["s"]
@@ -162,109 +282,123 @@ class KlineWrapper(EventWrapper):
 
 
 class SymbolMiniTickerWrapper(EventWrapper):
-    def __init__(self, event_data, handlers):  # lgtm [py/similar-function]
-        super().__init__(event_data, handlers)
-        self.event_type = event_data["e"]
-        self.event_time = event_data["E"]
-        self.symbol = event_data["s"]
-        self.close_price = event_data["c"]
-        self.open_price = event_data["o"]
-        self.high_price = event_data["h"]
-        self.low_price = event_data["l"]
-        self.total_traded_base_asset_volume = event_data["v"]
-        self.total_traded_quote_asset_volume = event_data["q"]
-
+    __slots__ = ('event_type', 'event_time', 'symbol', 'close_price', 'open_price', 'high_price', 'low_price',
+                 'total_traded_base_asset_volume', 'total_traded_quote_asset_volume')
 
-class SymbolTickerWrapper(EventWrapper):
     def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
+        self.handlers = handlers
         self.event_type = event_data["e"]
         self.event_time = event_data["E"]
         self.symbol = event_data["s"]
-        self.price_change = event_data["p"]
-        self.price_change_percent = event_data["P"]
-        self.weighted_average_price = event_data["w"]
-        self.first_trade_before_window = event_data["x"]
-        self.last_price = event_data["c"]
-        self.last_quantity = event_data["Q"]
-        self.best_bid_price = event_data["b"]
-        self.best_bid_quantity = event_data["B"]
-        self.best_ask_price = event_data["a"]
-        self.best_ask_quantity = event_data["A"]
+        self.close_price = event_data["c"]
         self.open_price = event_data["o"]
         self.high_price = event_data["h"]
         self.low_price = event_data["l"]
         self.total_traded_base_asset_volume = event_data["v"]
         self.total_traded_quote_asset_volume = event_data["q"]
-        self.statistics_open_time = event_data["O"]
-        self.statistics_close_time = event_data["C"]
-        self.first_trade_id = event_data["F"]
-        self.last_trade_id = event_data["L"]
-        self.total_trade_numbers = event_data["n"]
 
 
-class SymbolBookTickerWrapper(EventWrapper):
-    def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
-        self.order_book_updated = event_data["u"]
-        self.symbol = event_data["s"]
-        self.best_bid_price = event_data["b"]
-        self.best_bid_quantity = event_data["B"]
-        self.best_ask_price = event_data["a"]
-        self.best_ask_quantity = event_data["A"]
+class SymbolTickerWrapper(LazyEventWrapper):
+    __slots__ = ()
+
+    event_type = field("e")
+    event_time = field("E")
+    symbol = field("s")
+    price_change = field("p")
+    price_change_percent = field("P")
+    weighted_average_price = field("w")
+    first_trade_before_window = field("x")
+    last_price = field("c")
+    last_quantity = field("Q")
+    best_bid_price = field("b")
+    best_bid_quantity = field("B")
+    best_ask_price = field("a")
+    best_ask_quantity = field("A")
+    open_price = field("o")
+    high_price = field("h")
+    low_price = field("l")
+    total_traded_base_asset_volume = field("v")
+    total_traded_quote_asset_volume = field("q")
+    statistics_open_time = field("O")
+    statistics_close_time = field("C")
+    first_trade_id = field("F")
+    last_trade_id = field("L")
+    total_trade_numbers = field("n")
+
+
+class SymbolBookTickerWrapper(LazyEventWrapper):
+    __slots__ = ()
+
+    order_book_updated = field("u")
+    symbol = field("s")
+    best_bid_price = field("b")
+    best_bid_quantity = field("B")
+    best_ask_price = field("a")
+    best_ask_quantity = field("A")
 
 
 class PartialBookDepthWrapper(EventWrapper):
+    __slots__ = ('last_update_id', 'bids', 'asks', 'book')
+
     def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
+        self.handlers = handlers
         self.last_update_id = event_data["lastUpdateId"]
         self.bids = event_data["bids"]
         self.asks = event_data["asks"]
+        # Live local book if maintained by wrapper, for any depth on consumer side
+        self.book = event_data.get("book")
 
 
-class DiffDepthWrapper(EventWrapper):
-    def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
-        self.event_type = event_data["e"]
-        self.event_time = event_data["E"]
-        self.symbol = event_data["s"]
-        self.first_update_id = event_data["U"]
-        self.final_update_id = event_data["u"]
-        self.bids = event_data["b"]
-        self.asks = event_data["a"]
+class DiffDepthWrapper(LazyEventWrapper):
+    __slots__ = ()
+
+    event_type = field("e")
+    event_time = field("E")
+    symbol = field("s")
+    first_update_id = field("U")
+    final_update_id = field("u")
+    bids = field("b")
+    asks = field("a")
 
 
 # ACCOUNT UPDATE
 
 
 class OutboundAccountPositionWrapper(EventWrapper):
+    __slots__ = ('event_time', 'last_update', 'balances')
+
     def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
+        self.handlers = handlers
         self.event_time = event_data["E"]
         self.last_update = event_data["u"]
-        self.balances = dict(
-            map(lambda x: (x["a"], {"free": x["f"], "locked": x["l"]}), event_data["B"])
-        )
+        self.balances = {x["a"]: {"free": x["f"], "locked": x["l"]} for x in event_data["B"]}
 
 
 # BALANCE UPDATE
 
 
-class BalanceUpdateWrapper(EventWrapper):
-    def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
-        self.event_time = event_data["E"]
-        self.asset = event_data["a"]
-        self.balance_delta = event_data["d"]
-        self.clear_time = event_data["T"]
+class BalanceUpdateWrapper(LazyEventWrapper):
+    __slots__ = ()
+
+    event_time = field("E")
+    asset = field("a")
+    balance_delta = field("d")
+    clear_time = field("T")
 
 
 # ORDER UPDATE
 
 
 class OrderUpdateWrapper(EventWrapper):
+    __slots__ = ('event_time', 'symbol', 'client_order_id', 'side', 'order_type', 'time_in_force', 'order_quantity',
+                 'order_price', 'stop_price', 'iceberg_quantity', 'order_list_id', 'original_client_id',
+                 'execution_type', 'order_status', 'order_reject_reason', 'order_id', 'last_executed_quantity',
+                 'cumulative_filled_quantity', 'last_executed_price', 'commission_amount', 'commission_asset',
+                 'transaction_time', 'trade_id', 'ignore_a', 'in_order_book', 'is_maker_side', 'ignore_b',
+                 'order_creation_time', 'quote_asset_transacted', 'last_quote_asset_transacted', 'quote_order_quantity')
+
     def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
+        self.handlers = handlers
         self.event_time = event_data["E"]
         self.symbol = event_data["s"]
         self.client_order_id = event_data["c"]
@@ -298,19 +432,50 @@ class OrderUpdateWrapper(EventWrapper):
         self.quote_order_quantity = event_data["Q"]
 
 
-class ListStatus(EventWrapper):
-    def __init__(self, event_data, handlers):
-        super().__init__(event_data, handlers)
-        self.event_time = event_data["E"]
-        self.symbol = event_data["s"]
-        self.order_list_id = event_data["g"]
-        self.contingency_type = event_data["c"]
-        self.list_status_type = event_data["l"]
-        self.list_order_status = event_data["L"]
-        self.list_reject_reason = event_data["r"]
-        self.list_client_order_id = event_data["C"]
-        # noinspection PyArgumentList
-        self.orders = dict(
-            map(lambda x: (x["s"], {"orderId": x["i"], "clientOrderId": x["c"]})),
-            event_data["O"],
-        )
+class ListStatus(LazyEventWrapper):
+    __slots__ = ()
+
+    event_time = field("E")
+    symbol = field("s")
+    order_list_id = field("g")
+    contingency_type = field("c")
+    list_status_type = field("l")
+    list_order_status = field("L")
+    list_reject_reason = field("r")
+    list_client_order_id = field("C")
+
+    @property
+    def orders(self) -> {}:
+        return {x["s"]: {"orderId": x["i"], "clientOrderId": x["c"]} for x in self.event_data["O"]}
+
+
+WRAPPER_BY_TYPE = {
+    "outboundAccountPosition": OutboundAccountPositionWrapper,
+    "balanceUpdate": BalanceUpdateWrapper,
+    "executionReport": OrderUpdateWrapper,
+    "listStatus": ListStatus,
+    "aggTrade": AggregateTradeWrapper,
+    "trade": TradeWrapper,
+    "kline": KlineWrapper,
+    "24hrMiniTicker": SymbolMiniTickerWrapper,
+    "miniTicker": SymbolMiniTickerWrapper,  # stream name of 24hrMiniTicker
+    "24hrTicker": SymbolTickerWrapper,
+    "ticker": SymbolTickerWrapper,
+    "bookTicker": SymbolBookTickerWrapper,
+    "depth5": PartialBookDepthWrapper,
+    "depth10": PartialBookDepthWrapper,
+    "depth20": PartialBookDepthWrapper,
+    "depth": DiffDepthWrapper,
+    "depthUpdate": DiffDepthWrapper,
+}
+
+
+def event_wrapper(event_type: str):
+    """
+    Wrapper class for stream name (symbol@type) or event type, None if unknown
+    """
+    if "@" in event_type:
+        event_type = event_type.split("@")[1]
+    if event_type.startswith("kline_"):
+        event_type = "kline"
+    return WRAPPER_BY_TYPE.get(event_type)
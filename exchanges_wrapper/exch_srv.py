@@ -2,29 +2,46 @@
 # -*- coding: utf-8 -*-
 from exchanges_wrapper import __version__
 
-import time
 import weakref
 import gc
 import traceback
+import secrets
+import time
 
 import asyncio
 import functools
-import json
 import logging.handlers
 import toml
 # noinspection PyPackageRequirements
 import grpc
-# noinspection PyPackageRequirements
-from google.protobuf import json_format
 #
-from exchanges_wrapper import events, errors, ftx_parser as ftx, api_pb2, api_pb2_grpc
+from exchanges_wrapper import events, errors, json_codec, kline_cache, ftx_parser as ftx, api_pb2, api_pb2_grpc
 from exchanges_wrapper.client import Client
 from exchanges_wrapper.definitions import Side, OrderType, TimeInForce, ResponseType
 from exchanges_wrapper.c_structures import OrderUpdateEvent, OrderTradesEvent
+from exchanges_wrapper.stream_queue import ConflatingQueue, LosslessQueue
+from exchanges_wrapper.order_book import BookView
+from exchanges_wrapper.proto_codec import get_converter
 from exchanges_wrapper import WORK_PATH, CONFIG_FILE, LOG_FILE
 #
 HEARTBEAT = 1  # Sec
 MAX_QUEUE_SIZE = 50
+ORDER_BOOK_DEPTH = 5  # Default depth for OnOrderBookUpdate in diff mode
+# Stream queue size per RPC, events; can be changed in [queue_size] of exch_srv_cfg.toml
+QUEUE_SIZE = {
+    'OnKlinesUpdate': MAX_QUEUE_SIZE,
+    'OnTickerUpdate': MAX_QUEUE_SIZE,
+    'OnOrderBookUpdate': MAX_QUEUE_SIZE * 10,
+    'OnFundsUpdate': MAX_QUEUE_SIZE,
+    'OnOrderUpdate': MAX_QUEUE_SIZE,
+}
+
+
+def load_srv_config():
+    config = toml.load(str(CONFIG_FILE))
+    QUEUE_SIZE.update(config.get('queue_size', {}))
+    kline_cache.configure(config.get('kline_cache', {}))
+    OpenClient.idle_timeout = config.get('open_client', {}).get('idle_timeout', OpenClient.idle_timeout)
 
 
 def get_account(_account_name: str) -> ():
@@ -63,7 +80,14 @@ def get_account(_account_name: str) -> ():
 
 
 class OpenClient:
-    open_clients = []
+    """
+    Registry of account connections: opaque handle (client_id) -> OpenClient, account name -> handle.
+    Handle is random, not id() of the object, so stale client_id from a bot does not reach other account
+    """
+    clients = {}  # handle: OpenClient
+    ids = {}  # account name: handle
+    locks = {}  # account name: asyncio.Lock, for creation
+    idle_timeout = 21600  # sec, 0 - never evicted
 
     def __init__(self, _account_name: str):
         account = get_account(_account_name)
@@ -82,32 +106,87 @@ class OpenClient:
                 account[9],     # ws_public_mbr
             )
             self.on_order_update_queues = {}
-            OpenClient.open_clients.append(self)
+            self.client_id = 0
+            self.last_used = time.monotonic()
         else:
             raise UserWarning
 
-    @classmethod
-    def get_id(cls, _account_name):
+    def register(self) -> int:
+        """
+        Add loaded client to registry
+        """
         _id = 0
-        for open_client in cls.open_clients:
-            if open_client.name == _account_name:
-                _id = id(open_client)
-                break
+        while not _id or _id in OpenClient.clients:
+            _id = secrets.randbits(62)
+        self.client_id = _id
+        OpenClient.clients[_id] = self
+        OpenClient.ids[self.name] = _id
         return _id
 
+    def busy(self) -> bool:
+        """
+        Has stream queues, user or market streams
+        """
+        client = self.client
+        return bool(any(client.stream_queue.values()) or self.on_order_update_queues
+                    or any(client.data_streams.values()) or client.market_streams.channels)
+
+    @classmethod
+    def lock(cls, _account_name) -> asyncio.Lock:
+        _lock = cls.locks.get(_account_name)
+        if _lock is None:
+            _lock = cls.locks[_account_name] = asyncio.Lock()
+        return _lock
+
+    @classmethod
+    def get_id(cls, _account_name):
+        return cls.ids.get(_account_name, 0)
+
     @classmethod
     def get_client(cls, _id):
-        _client = None
-        for open_client in cls.open_clients:
-            if id(open_client) == _id:
-                _client = open_client
-                break
-        return _client
+        open_client = cls.clients.get(_id)
+        if open_client is not None:
+            open_client.last_used = time.monotonic()
+        return open_client
+
+    @classmethod
+    async def get_client_or_abort(cls, _id, _context):
+        """
+        Client for gRPC call, unknown or evicted client_id aborts the call with NOT_FOUND:
+        the bot must call OpenClientConnection again
+        """
+        open_client = cls.get_client(_id)
+        if open_client is None:
+            await _context.abort(grpc.StatusCode.NOT_FOUND,
+                                 f"Client {_id} not found or closed as idle, call OpenClientConnection")
+        return open_client
+
+    @classmethod
+    async def evict_idle(cls):
+        """
+        Close connections without gRPC calls and streams for idle_timeout, the next
+        OpenClientConnection for the account creates new one
+        """
+        while True:
+            await asyncio.sleep(max(cls.idle_timeout / 10, HEARTBEAT * 60) if cls.idle_timeout else HEARTBEAT * 600)
+            if not cls.idle_timeout:
+                continue
+            expired = time.monotonic() - cls.idle_timeout
+            for open_client in [i for i in cls.clients.values() if i.last_used < expired and not i.busy()]:
+                async with cls.lock(open_client.name):
+                    if open_client.last_used >= expired or open_client.busy():
+                        continue
+                    cls.clients.pop(open_client.client_id, None)
+                    cls.ids.pop(open_client.name, None)
+                    logger.info(f"Close idle connection for '{open_client.name}'")
+                    try:
+                        await open_client.client.close()
+                    except Exception as ex:
+                        logger.warning(f"Close connection for '{open_client.name}' exception: {ex}")
 
 
 # noinspection PyPep8Naming,PyMethodMayBeStatic
 class Martin(api_pb2_grpc.MartinServicer):
-    rate_limit_reached_time = None
     rate_limiter = None
 
     async def OpenClientConnection(self, request: api_pb2.OpenClientConnectionRequest,
@@ -118,24 +197,9 @@ class Martin(api_pb2_grpc.MartinServicer):
             logger.error("Unique identifier not specified")
         client_id = OpenClient.get_id(request.account_name)
         if not client_id:
-            try:
-                open_client = OpenClient(request.account_name)
-            except UserWarning:
-                _context.set_details(f"Account {request.account_name} not registered into"
-                                     f" {WORK_PATH}/config/exch_srv_cfg.toml")
-                _context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
-            else:
-                try:
-                    await open_client.client.load()
-                    client_id = id(open_client)
-                except asyncio.CancelledError:
-                    pass  # Task cancellation should not be logged as an error
-                except Exception as ex:
-                    logger.warning(f"OpenClientConnection for '{open_client.name}' exception: {ex}")
-                    _context.set_details(f"{ex}")
-                    _context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
-        else:
-            OpenClient.get_client(client_id).client.http.rate_limit_reached = False
+            # Concurrent calls for the same account wait for the first one and share its client
+            async with OpenClient.lock(request.account_name):
+                client_id = OpenClient.get_id(request.account_name) or await self.open_client(request, _context)
         exchange = None
         if client_id:
             exchange = OpenClient.get_client(client_id).client.exchange
@@ -144,9 +208,30 @@ class Martin(api_pb2_grpc.MartinServicer):
 
         return api_pb2.OpenClientConnectionId(client_id=client_id, srv_version=__version__, exchange=exchange)
 
+    async def open_client(self, request, _context) -> int:
+        try:
+            open_client = OpenClient(request.account_name)
+        except UserWarning:
+            _context.set_details(f"Account {request.account_name} not registered into"
+                                 f" {WORK_PATH}/config/exch_srv_cfg.toml")
+            _context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            return 0
+        try:
+            await open_client.client.load()
+            return open_client.register()
+        except asyncio.CancelledError:
+            await open_client.client.close()
+            raise  # Task cancellation should not be logged as an error
+        except Exception as ex:
+            logger.warning(f"OpenClientConnection for '{open_client.name}' exception: {ex}")
+            _context.set_details(f"{ex}")
+            _context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            await open_client.client.close()
+        return 0
+
     async def FetchServerTime(self, request: api_pb2.OpenClientConnectionId,
                               _context: grpc.aio.ServicerContext) -> api_pb2.FetchServerTimeResponse:
-        client = OpenClient.get_client(request.client_id).client
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
         try:
             res = await client.fetch_server_time()
         except Exception as ex:
@@ -160,33 +245,24 @@ class Martin(api_pb2_grpc.MartinServicer):
     async def ResetRateLimit(self, request: api_pb2.OpenClientConnectionId,
                              _context: grpc.aio.ServicerContext) -> api_pb2.SimpleResponse:
         Martin.rate_limiter = max(Martin.rate_limiter if Martin.rate_limiter else 0, request.rate_limiter)
-        _success = False
-        client = OpenClient.get_client(request.client_id).client
-        if Martin.rate_limit_reached_time:
-            if time.time() - Martin.rate_limit_reached_time > 30:
-                client.http.rate_limit_reached = False
-                Martin.rate_limit_reached_time = None
-                logger.info("ResetRateLimit error clear, trying one else time")
-                _success = True
-        else:
-            if client.http.rate_limit_reached:
-                Martin.rate_limit_reached_time = time.time()
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
+        # Pause after 429/418 expires by itself in the rate limiter, Retry-After or default time
+        _success = not client.http.rate_limit_reached
+        if _success:
+            logger.info("ResetRateLimit error clear, trying one else time")
         return api_pb2.SimpleResponse(success=_success)
 
     async def FetchOpenOrders(self, request: api_pb2.MarketRequest,
                               _context: grpc.aio.ServicerContext) -> api_pb2.FetchOpenOrdersResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         # message list
         response = api_pb2.FetchOpenOrdersResponse()
-        # Nested dict
-        response_order = api_pb2.FetchOpenOrdersResponse.Order()
         try:
             res = await client.fetch_open_orders(symbol=request.symbol, receive_window=None)
         except asyncio.CancelledError:
             pass  # Task cancellation should not be logged as an error
-        except errors.RateLimitReached as ex:
-            Martin.rate_limit_reached_time = time.time()
+        except (errors.RateLimitReached, errors.QueryCanceled) as ex:
             logger.warning(f"FetchOpenOrders for {open_client.name}:{request.symbol} exception: {ex}")
             _context.set_details(f"{ex}")
             _context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
@@ -202,11 +278,9 @@ class Martin(api_pb2_grpc.MartinServicer):
         else:
             # logger.debug(f"FetchOpenOrders.res: {res}")
             active_orders = []
+            get_converter(api_pb2.FetchOpenOrdersResponse.Order).extend(response.items, res)
             for order in res:
                 active_orders.append(order['orderId'])
-                new_order = json_format.ParseDict(order, response_order)
-                # logger.debug(f"FetchOpenOrders.new_order: {new_order}")
-                response.items.append(new_order)
                 if client.exchange == 'bitfinex':
                     client.active_orders.update(
                         {order['orderId']:
@@ -225,7 +299,7 @@ class Martin(api_pb2_grpc.MartinServicer):
 
     async def FetchOrder(self, request: api_pb2.FetchOrderRequest,
                          _context: grpc.aio.ServicerContext) -> api_pb2.FetchOrderResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         _queue = open_client.on_order_update_queues.get(request.trade_id, None)
         response = api_pb2.FetchOrderResponse()
@@ -244,8 +318,7 @@ class Martin(api_pb2_grpc.MartinServicer):
                     event = OrderUpdateEvent(res)
                     logger.info(f"FetchOrder.event: {open_client.name}:{event.symbol}:{int(event.order_id)}:"
                                 f"{event.order_status}")
-                    _event = weakref.ref(event)
-                    await _queue.put(_event())
+                    put_event(_queue, client, request.trade_id, 'executionReport', event)
                 elif res.get('status') == 'PARTIALLY_FILLED':
                     try:
                         trades = await client.fetch_order_trade_list(symbol=request.symbol, order_id=request.order_id)
@@ -256,20 +329,16 @@ class Martin(api_pb2_grpc.MartinServicer):
                     else:
                         logger.debug(f"FetchOrder.trades: {trades}")
                         for trade in trades:
-                            event = OrderTradesEvent(trade)
-                            _event = weakref.ref(event)
-                            await _queue.put(_event())
-            json_format.ParseDict(res, response)
+                            put_event(_queue, client, request.trade_id, 'executionReport', OrderTradesEvent(trade))
+            response = get_converter(api_pb2.FetchOrderResponse)(res)
         return response
 
     async def CancelAllOrders(self, request: api_pb2.MarketRequest,
                               _context: grpc.aio.ServicerContext) -> api_pb2.CancelAllOrdersResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         # message list
         response = api_pb2.CancelAllOrdersResponse()
-        # Nested dict
-        response_order = api_pb2.CancelAllOrdersResponse.CancelOrder()
         try:
             res = await client.cancel_all_orders(symbol=request.symbol, receive_window=None)
             # logger.info(f"CancelAllOrders: {res}")
@@ -280,74 +349,38 @@ class Martin(api_pb2_grpc.MartinServicer):
             _context.set_details(f"{ex}")
             _context.set_code(grpc.StatusCode.UNKNOWN)
         else:
-            for order in res:
-                cancel_order = json_format.ParseDict(order, response_order)
-                response.items.append(cancel_order)
+            get_converter(api_pb2.CancelAllOrdersResponse.CancelOrder).extend(response.items, res)
         return response
 
     async def FetchExchangeInfoSymbol(self, request: api_pb2.MarketRequest,
                                       _context: grpc.aio.ServicerContext
                                       ) -> api_pb2.FetchExchangeInfoSymbolResponse:
-        client = OpenClient.get_client(request.client_id).client
-        response = api_pb2.FetchExchangeInfoSymbolResponse()
-        exchange_info = await client.fetch_exchange_info()
-        exchange_info_symbol = {}
-        try:
-            exchange_info_symbol = next(item for item in exchange_info.get('symbols')
-                                        if item["symbol"] == request.symbol)
-        except StopIteration:
-            logger.info("FetchExchangeInfoSymbol.exchange_info_symbol: None")
-        # logger.info(f"exchange_info_symbol: {exchange_info_symbol}")
-        filters_res = exchange_info_symbol.pop('filters', [])
-        json_format.ParseDict(exchange_info_symbol, response)
-        # logger.info(f"filters: {filters_res}")
-        filters = response.filters
-        for _filter in filters_res:
-            if _filter.get('filterType') == 'PRICE_FILTER':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.PriceFilter()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.price_filter.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'PERCENT_PRICE':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.PercentPrice()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.percent_price.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'LOT_SIZE':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.LotSize()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.lot_size.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'MIN_NOTIONAL':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.MinNotional()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.min_notional.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'ICEBERG_PARTS':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.IcebergParts()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.iceberg_parts.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'MARKET_LOT_SIZE':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.MarketLotSize()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.market_lot_size.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'MAX_NUM_ORDERS':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.MaxNumOrders()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.max_num_orders.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'MAX_NUM_ICEBERG_ORDERS':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.MaxNumIcebergOrders()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.max_num_iceberg_orders.CopyFrom(new_filter)
-            elif _filter.get('filterType') == 'MAX_POSITION':
-                new_filter_template = api_pb2.FetchExchangeInfoSymbolResponse.Filters.MaxPosition()
-                new_filter = json_format.ParseDict(_filter, new_filter_template)
-                filters.max_position.CopyFrom(new_filter)
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
+        await client.exchange_info.get(client.fetch_exchange_info)
+        # Prebuilt response is valid until exchange info refresh, shared read only
+        response = client.exchange_info.responses.get(request.symbol)
+        if response is None:
+            exchange_info_symbol = client.exchange_info.symbol(request.symbol)
+            if exchange_info_symbol is None:
+                logger.info("FetchExchangeInfoSymbol.exchange_info_symbol: None")
+                return api_pb2.FetchExchangeInfoSymbolResponse()
+            response = self._exchange_info_symbol(exchange_info_symbol)
+            client.exchange_info.responses[request.symbol] = response
         return response
 
+    @staticmethod
+    def _exchange_info_symbol(exchange_info_symbol: {}) -> api_pb2.FetchExchangeInfoSymbolResponse:
+        # Filters message has field for each filterType in lower case, as price_filter for PRICE_FILTER
+        filters = {_filter.get('filterType', '').lower(): _filter
+                   for _filter in exchange_info_symbol.get('filters', [])}
+        return get_converter(api_pb2.FetchExchangeInfoSymbolResponse)(dict(exchange_info_symbol, filters=filters))
+
     async def FetchAccountInformation(self, request: api_pb2.OpenClientConnectionId,
                                       _context: grpc.aio.ServicerContext
                                       ) -> api_pb2.FetchAccountBalanceResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         response = api_pb2.FetchAccountBalanceResponse()
-        response_balance = api_pb2.FetchAccountBalanceResponse.Balances()
         account_information = await client.fetch_account_information(receive_window=None)
         # Send only balances
         res = account_information.get('balances', [])
@@ -359,17 +392,14 @@ class Martin(api_pb2_grpc.MartinServicer):
             if _free or _locked:
                 balances.append({'asset': i.get('asset'), 'free': i.get('free'), 'locked': i.get('locked')})
         # logger.debug(f"account_information.balances: {balances}")
-        for balance in balances:
-            new_balance = json_format.ParseDict(balance, response_balance)
-            response.balances.extend([new_balance])
+        get_converter(api_pb2.FetchAccountBalanceResponse.Balances).extend(response.balances, balances)
         return response
 
     async def FetchFundingWallet(self, request: api_pb2.FetchFundingWalletRequest,
                                  _context: grpc.aio.ServicerContext) -> api_pb2.FetchFundingWalletResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         response = api_pb2.FetchFundingWalletResponse()
-        response_balance = api_pb2.FetchFundingWalletResponse.Balances()
         res = []
         if client.exchange == 'bitfinex' or (open_client.real_market and client.exchange in ('binance', 'ftx')):
             try:
@@ -379,47 +409,53 @@ class Martin(api_pb2_grpc.MartinServicer):
             except AttributeError:
                 logger.error("Can't get Funding Wallet balances")
         logger.debug(f"funding_wallet: {res}")
-        for balance in res:
-            new_balance = json_format.ParseDict(balance, response_balance)
-            response.balances.extend([new_balance])
+        get_converter(api_pb2.FetchFundingWalletResponse.Balances).extend(response.balances, res)
         return response
 
     async def FetchOrderBook(self, request: api_pb2.MarketRequest,
                              _context: grpc.aio.ServicerContext) -> api_pb2.FetchOrderBookResponse:
-        client = OpenClient.get_client(request.client_id).client
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
         response = api_pb2.FetchOrderBookResponse()
-        limit = 1 if client.exchange == 'bitfinex' else 5
-        res = await client.fetch_order_book(symbol=request.symbol, limit=limit)
-        res_bids = res.get('bids', [])
-        res_asks = res.get('asks', [])
-        response.lastUpdateId = res.get('lastUpdateId')
+        # Depth is rounded up to the exchange valid limit, the book is cut back to it
+        depth = request.depth or (1 if client.exchange == 'bitfinex' else 5)
+        res = await client.fetch_order_book(symbol=request.symbol, limit=client.order_book_limit(depth))
+        if not res or res.get('lastUpdateId') is None:
+            _context.set_details(f"FetchOrderBook for {request.symbol} depth {depth}: empty order book")
+            _context.set_code(grpc.StatusCode.UNAVAILABLE)
+            return response
+        res_bids = res.get('bids', [])[:depth]
+        res_asks = res.get('asks', [])[:depth]
+        response.lastUpdateId = res['lastUpdateId']
+        if request.typed:
+            response.snapshot = True
+            response.bid_levels.extend(api_pb2.PriceLevel(price=str(price), quantity=str(qty))
+                                       for price, qty in res_bids)
+            response.ask_levels.extend(api_pb2.PriceLevel(price=str(price), quantity=str(qty))
+                                       for price, qty in res_asks)
+            return response
         for bid in res_bids:
-            response.bids.append(json.dumps(bid))
+            response.bids.append(json_codec.dumps(bid))
         for ask in res_asks:
-            response.asks.append(json.dumps(ask))
+            response.asks.append(json_codec.dumps(ask))
         return response
 
     async def FetchSymbolPriceTicker(
             self, request: api_pb2.MarketRequest,
             _context: grpc.aio.ServicerContext) -> api_pb2.FetchSymbolPriceTickerResponse:
-        client = OpenClient.get_client(request.client_id).client
-        response = api_pb2.FetchSymbolPriceTickerResponse()
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
         res = await client.fetch_symbol_price_ticker(symbol=request.symbol)
-        json_format.ParseDict(res, response)
-        return response
+        return get_converter(api_pb2.FetchSymbolPriceTickerResponse)(res)
 
     async def FetchTickerPriceChangeStatistics(
             self, request: api_pb2.MarketRequest,
             _context: grpc.aio.ServicerContext) -> api_pb2.FetchTickerPriceChangeStatisticsResponse:
-        client = OpenClient.get_client(request.client_id).client
-        response = api_pb2.FetchTickerPriceChangeStatisticsResponse()
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
         res = await client.fetch_ticker_price_change_statistics(symbol=request.symbol)
-        json_format.ParseDict(res, response)
-        return response
+        return get_converter(api_pb2.FetchTickerPriceChangeStatisticsResponse)(res)
 
     async def FetchKlines(self, request: api_pb2.FetchKlinesRequest,
                           _context: grpc.aio.ServicerContext) -> api_pb2.FetchKlinesResponse:
-        client = OpenClient.get_client(request.client_id).client
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
         response = api_pb2.FetchKlinesResponse()
         try:
             res = await client.fetch_klines(symbol=request.symbol, interval=request.interval,
@@ -430,18 +466,23 @@ class Martin(api_pb2_grpc.MartinServicer):
             logger.error(f"FetchKlines for {request.symbol} interval: {request.interval}, exception: {_ex}")
         else:
             # logger.debug(res)
-            for candle in res:
-                response.klines.append(json.dumps(candle))
+            if request.typed:
+                response.candles.extend(map(candle_message, res))
+            else:
+                for candle in res:
+                    response.klines.append(json_codec.dumps(candle))
         return response
 
     async def OnKlinesUpdate(self, request: api_pb2.FetchKlinesRequest,
                              _context: grpc.aio.ServicerContext) -> api_pb2.OnKlinesUpdateResponse:
         response = api_pb2.OnKlinesUpdateResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
-        _queue = asyncio.Queue(MAX_QUEUE_SIZE)
+        # Only the last update of candle in progress is needed
+        _queue = ConflatingQueue(QUEUE_SIZE['OnKlinesUpdate'],
+                                 key=lambda _event: (_event.kline_interval, _event.kline_start_time))
         client.stream_queue[request.trade_id] |= {_queue}
-        _intervals = json.loads(request.interval)
+        _intervals = json_codec.loads(request.interval)
         event_types = []
         # Register streams for intervals
         if client.exchange == 'bitfinex':
@@ -456,38 +497,48 @@ class Martin(api_pb2_grpc.MartinServicer):
             client.events.register_event(functools.partial(
                 event_handler, _queue, client, request.trade_id, _event_type),
                 _event_type, exchange, request.trade_id)
-        while True:
-            _event = await _queue.get()
-            if isinstance(_event, str) and _event == request.trade_id:
-                client.stream_queue.get(request.trade_id, set()).discard(_queue)
-                logger.info(f"OnKlinesUpdate: Stop market stream for {open_client.name}:{request.symbol}:"
-                            f"{_intervals}")
-                return
-            else:
-                # logger.info(f"OnKlinesUpdate.event: {exchange}:{_event.symbol}:{_event.kline_interval}")
-                response.symbol = _event.symbol
-                response.interval = _event.kline_interval
-                candle = [_event.kline_start_time,
-                          _event.kline_open_price,
-                          _event.kline_high_price,
-                          _event.kline_low_price,
-                          _event.kline_close_price,
-                          _event.kline_base_asset_volume,
-                          _event.kline_close_time,
-                          _event.kline_quote_asset_volume,
-                          _event.kline_trades_number,
-                          _event.kline_taker_buy_base_asset_volume,
-                          _event.kline_taker_buy_quote_asset_volume,
-                          _event.kline_ignore
-                          ]
-                response.candle = json.dumps(candle)
+        async for _event in stream_events(client, request.trade_id, _queue):
+            # logger.info(f"OnKlinesUpdate.event: {exchange}:{_event.symbol}:{_event.kline_interval}")
+            response.symbol = _event.symbol
+            response.interval = _event.kline_interval
+            if request.typed:
+                kline = response.kline
+                kline.open_time = _event.kline_start_time
+                kline.open = _event.kline_open_price
+                kline.high = _event.kline_high_price
+                kline.low = _event.kline_low_price
+                kline.close = _event.kline_close_price
+                kline.volume = _event.kline_base_asset_volume
+                kline.close_time = _event.kline_close_time
+                kline.quote_asset_volume = _event.kline_quote_asset_volume
+                kline.trades_number = _event.kline_trades_number or 0
+                kline.taker_buy_base_asset_volume = _event.kline_taker_buy_base_asset_volume
+                kline.taker_buy_quote_asset_volume = _event.kline_taker_buy_quote_asset_volume
+                kline.closed = _event.kline_closed
                 yield response
+                continue
+            candle = [_event.kline_start_time,
+                      _event.kline_open_price,
+                      _event.kline_high_price,
+                      _event.kline_low_price,
+                      _event.kline_close_price,
+                      _event.kline_base_asset_volume,
+                      _event.kline_close_time,
+                      _event.kline_quote_asset_volume,
+                      _event.kline_trades_number,
+                      _event.kline_taker_buy_base_asset_volume,
+                      _event.kline_taker_buy_quote_asset_volume,
+                      _event.kline_ignore
+                      ]
+            response.candle = json_codec.dumps(candle)
+            yield response
+        logger.info(f"OnKlinesUpdate: Stop market stream for {open_client.name}:{request.symbol}:"
+                    f"{_intervals}")
 
     async def FetchAccountTradeList(self, request: api_pb2.AccountTradeListRequest,
                                     _context: grpc.aio.ServicerContext) -> api_pb2.AccountTradeListResponse:
-        client = OpenClient.get_client(request.client_id).client
+        client = (await OpenClient.get_client_or_abort(request.client_id, _context)).client
         response = api_pb2.AccountTradeListResponse()
-        response_trade = api_pb2.AccountTradeListResponse.Trade()
         res = await client.fetch_account_trade_list(
             symbol=request.symbol,
             start_time=request.start_time,
@@ -496,17 +547,15 @@ class Martin(api_pb2_grpc.MartinServicer):
             limit=request.limit,
             receive_window=None)
         # logger.info(f"FetchAccountTradeList: {res}")
-        for trade in res:
-            trade_order = json_format.ParseDict(trade, response_trade)
-            response.items.append(trade_order)
+        get_converter(api_pb2.AccountTradeListResponse.Trade).extend(response.items, res)
         return response
 
     async def OnTickerUpdate(self, request: api_pb2.MarketRequest,
                              _context: grpc.aio.ServicerContext) -> api_pb2.OnTickerUpdateResponse:
         response = api_pb2.OnTickerUpdateResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
-        _queue = asyncio.Queue(MAX_QUEUE_SIZE)
+        _queue = ConflatingQueue(QUEUE_SIZE['OnTickerUpdate'], key=lambda _event: _event.symbol)
         client.stream_queue[request.trade_id] |= {_queue}
         if client.exchange == 'ftx':
             _symbol = client.symbol_to_ftx(request.symbol)
@@ -517,27 +566,21 @@ class Martin(api_pb2_grpc.MartinServicer):
         _event_type = f"{_symbol}@miniTicker"
         client.events.register_event(functools.partial(event_handler, _queue, client, request.trade_id, _event_type),
                                      _event_type, client.exchange, request.trade_id)
-        while True:
-            _event = await _queue.get()
-            if isinstance(_event, str) and _event == request.trade_id:
-                client.stream_queue.get(request.trade_id, set()).discard(_queue)
-                logger.info(f"OnTickerUpdate: Stop market stream for {open_client.name}: {request.symbol}")
-                return
-            else:
-                # logger.info(f"OnTickerUpdate.event: {_event.symbol}, _event.close_price: {_event.close_price}")
-                ticker_24h = {'symbol': _event.symbol,
-                              'open_price': _event.open_price,
-                              'close_price': _event.close_price,
-                              'event_time': _event.event_time}
-                json_format.ParseDict(ticker_24h, response)
-                yield response
+        async for _event in stream_events(client, request.trade_id, _queue):
+            # logger.info(f"OnTickerUpdate.event: {_event.symbol}, _event.close_price: {_event.close_price}")
+            response.symbol = _event.symbol
+            response.open_price = _event.open_price
+            response.close_price = _event.close_price
+            response.event_time = _event.event_time
+            yield response
+        logger.info(f"OnTickerUpdate: Stop market stream for {open_client.name}: {request.symbol}")
 
     async def OnOrderBookUpdate(self, request: api_pb2.MarketRequest,
                                 _context: grpc.aio.ServicerContext) -> api_pb2.FetchOrderBookResponse:
         response = api_pb2.FetchOrderBookResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
-        _queue = asyncio.Queue(MAX_QUEUE_SIZE * 10)
+        _queue = ConflatingQueue(QUEUE_SIZE['OnOrderBookUpdate'], key=lambda _event: 'depth')
         client.stream_queue[request.trade_id] |= {_queue}
         if client.exchange == 'ftx':
             _symbol = client.symbol_to_ftx(request.symbol)
@@ -548,43 +591,56 @@ class Martin(api_pb2_grpc.MartinServicer):
         _event_type = f"{_symbol}@depth5"
         client.events.register_event(functools.partial(event_handler, _queue, client, request.trade_id, _event_type),
                                      _event_type, client.exchange, request.trade_id)
-        while True:
-            _event = await _queue.get()
-            if isinstance(_event, str) and _event == request.trade_id:
-                client.stream_queue.get(request.trade_id, set()).discard(_queue)
-                logger.info(f"OnOrderBookUpdate: Stop market stream for {open_client.name}: {request.symbol}")
-                return
+        # typed and diff not set: legacy snapshot with JSON string levels, depth5 if depth not set
+        typed = request.typed or request.diff  # diff is sent as typed levels only
+        depth = request.depth or (ORDER_BOOK_DEPTH if typed else 0)
+        view = BookView(depth) if typed else None
+        async for _event in stream_events(client, request.trade_id, _queue):
+            response.Clear()
+            response.lastUpdateId = _event.last_update_id
+            if not depth:
+                bids = _event.bids
+                asks = _event.asks
+            elif _event.book is None:
+                bids = _event.bids[:depth]
+                asks = _event.asks[:depth]
             else:
-                response.Clear()
-                response.lastUpdateId = _event.last_update_id
-                for bid in _event.bids:
-                    response.bids.append(json.dumps(bid))
-                for ask in _event.asks:
-                    response.asks.append(json.dumps(ask))
+                bids = _event.book.bids.top(depth)
+                asks = _event.book.asks.top(depth)
+            if view is None:
+                for bid in bids:
+                    response.bids.append(json_codec.dumps(bid))
+                for ask in asks:
+                    response.asks.append(json_codec.dumps(ask))
                 yield response
+                continue
+            if request.diff and view.sequence:
+                bids, asks = view.diff(bids, asks)
+                if not (bids or asks):
+                    continue
+            else:
+                bids, asks = view.snapshot(bids, asks)
+                response.snapshot = True
+            response.sequence = view.sequence
+            response.bid_levels.extend(api_pb2.PriceLevel(price=price, quantity=qty) for price, qty in bids)
+            response.ask_levels.extend(api_pb2.PriceLevel(price=price, quantity=qty) for price, qty in asks)
+            yield response
+        logger.info(f"OnOrderBookUpdate: Stop market stream for {open_client.name}: {request.symbol}")
 
     async def OnFundsUpdate(self, request: api_pb2.OnFundsUpdateRequest,
                             _context: grpc.aio.ServicerContext) -> api_pb2.OnFundsUpdateResponse:
         response = api_pb2.OnFundsUpdateResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
-        _queue = asyncio.Queue(MAX_QUEUE_SIZE)
+        _queue = LosslessQueue(QUEUE_SIZE['OnFundsUpdate'])
         client.stream_queue[request.trade_id] |= {_queue}
         if client.exchange in ('binance', 'bitfinex', 'huobi'):
             client.events.register_user_event(functools.partial(
                 event_handler, _queue, client, request.trade_id, 'outboundAccountPosition'),
-                'outboundAccountPosition')
+                'outboundAccountPosition', request.trade_id)
         balances_prev = []
         assets = [request.base_asset, request.quote_asset]
-        while True:
-            try:
-                _event = await asyncio.wait_for(_queue.get(), timeout=HEARTBEAT * 3)
-            except asyncio.TimeoutError:
-                _event = None
-            if isinstance(_event, str) and _event == request.trade_id:
-                client.stream_queue.get(request.trade_id, set()).discard(_queue)
-                logger.info(f"OnFundsUpdate: Stop user stream for {open_client.name}: {request.symbol}")
-                return
+        async for _event in stream_events(client, request.trade_id, _queue, timeout=HEARTBEAT * 3):
             if client.exchange == 'ftx':
                 try:
                     account_information = await client.fetch_account_information(receive_window=None)
@@ -601,64 +657,66 @@ class Martin(api_pb2_grpc.MartinServicer):
                         _event = client.events.wrap_event(content)
             elif isinstance(_event, events.OutboundAccountPositionWrapper):
                 logger.debug(f"OnFundsUpdate: {_event.balances.items()}")
-                response.funds = json.dumps(_event.balances)
+                if request.typed:
+                    del response.balances[:]
+                    response.balances.extend(
+                        api_pb2.Balance(asset=asset, free=str(balance['free']), locked=str(balance['locked']))
+                        for asset, balance in _event.balances.items())
+                else:
+                    response.funds = json_codec.dumps(_event.balances)
                 yield response
+        logger.info(f"OnFundsUpdate: Stop user stream for {open_client.name}: {request.symbol}")
 
     async def OnOrderUpdate(self, request: api_pb2.MarketRequest,
                             _context: grpc.aio.ServicerContext) -> api_pb2.OnOrderUpdateResponse:
         response = api_pb2.OnOrderUpdateResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
-        _queue = asyncio.Queue(MAX_QUEUE_SIZE)
+        _queue = LosslessQueue(QUEUE_SIZE['OnOrderUpdate'])
         open_client.on_order_update_queues.update({request.trade_id: _queue})
         client.stream_queue[request.trade_id] |= {_queue}
         client.events.register_user_event(functools.partial(
             event_handler, _queue, client, request.trade_id, 'executionReport'),
-            'executionReport')
-        while True:
-            _event = await _queue.get()
-            if isinstance(_event, str) and _event == request.trade_id:
-                client.stream_queue.get(request.trade_id, set()).discard(_queue)
-                logger.info(f"OnOrderUpdate: Stop user stream for {open_client.name}: {request.symbol}")
-                return
-            else:
-                # logger.info(f"OnOrderUpdate:{_event.symbol}:{int(_event.order_id)}:{_event.order_status}")
-                response.symbol = _event.symbol
-                response.client_order_id = _event.client_order_id
-                response.side = _event.side
-                response.order_type = _event.order_type
-                response.time_in_force = _event.time_in_force
-                response.order_quantity = _event.order_quantity
-                response.order_price = _event.order_price
-                response.stop_price = _event.stop_price
-                response.iceberg_quantity = _event.iceberg_quantity
-                response.order_list_id = int(_event.order_list_id)
-                response.original_client_id = _event.original_client_id
-                response.execution_type = _event.execution_type
-                response.order_status = _event.order_status
-                response.order_reject_reason = _event.order_reject_reason
-                response.order_id = int(_event.order_id)
-                response.last_executed_quantity = _event.last_executed_quantity
-                response.cumulative_filled_quantity = _event.cumulative_filled_quantity
-                response.last_executed_price = _event.last_executed_price
-                response.commission_amount = _event.commission_amount
-                response.commission_asset = _event.commission_asset or str()
-                response.transaction_time = int(_event.transaction_time)
-                response.trade_id = int(_event.trade_id)
-                response.ignore_a = _event.ignore_a
-                response.in_order_book = _event.in_order_book
-                response.is_maker_side = bool(_event.is_maker_side)
-                response.ignore_b = _event.ignore_b
-                response.order_creation_time = int(_event.order_creation_time)
-                response.quote_asset_transacted = _event.quote_asset_transacted
-                response.last_quote_asset_transacted = _event.last_quote_asset_transacted
-                response.quote_order_quantity = _event.quote_order_quantity
-                yield response
+            'executionReport', request.trade_id)
+        async for _event in stream_events(client, request.trade_id, _queue):
+            # logger.info(f"OnOrderUpdate:{_event.symbol}:{int(_event.order_id)}:{_event.order_status}")
+            response.symbol = _event.symbol
+            response.client_order_id = _event.client_order_id
+            response.side = _event.side
+            response.order_type = _event.order_type
+            response.time_in_force = _event.time_in_force
+            response.order_quantity = _event.order_quantity
+            response.order_price = _event.order_price
+            response.stop_price = _event.stop_price
+            response.iceberg_quantity = _event.iceberg_quantity
+            response.order_list_id = int(_event.order_list_id)
+            response.original_client_id = _event.original_client_id
+            response.execution_type = _event.execution_type
+            response.order_status = _event.order_status
+            response.order_reject_reason = _event.order_reject_reason
+            response.order_id = int(_event.order_id)
+            response.last_executed_quantity = _event.last_executed_quantity
+            response.cumulative_filled_quantity = _event.cumulative_filled_quantity
+            response.last_executed_price = _event.last_executed_price
+            response.commission_amount = _event.commission_amount
+            response.commission_asset = _event.commission_asset or str()
+            response.transaction_time = int(_event.transaction_time)
+            response.trade_id = int(_event.trade_id)
+            response.ignore_a = _event.ignore_a
+            response.in_order_book = _event.in_order_book
+            response.is_maker_side = bool(_event.is_maker_side)
+            response.ignore_b = _event.ignore_b
+            response.order_creation_time = int(_event.order_creation_time)
+            response.quote_asset_transacted = _event.quote_asset_transacted
+            response.last_quote_asset_transacted = _event.last_quote_asset_transacted
+            response.quote_order_quantity = _event.quote_order_quantity
+            yield response
+        logger.info(f"OnOrderUpdate: Stop user stream for {open_client.name}: {request.symbol}")
 
     async def CreateLimitOrder(self, request: api_pb2.CreateLimitOrderRequest,
                                _context: grpc.aio.ServicerContext) -> api_pb2.CreateLimitOrderResponse:
         response = api_pb2.CreateLimitOrderResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         # logger.info(f"CreateLimitOrder: quantity: {request.quantity}, price: {request.price}")
         try:
@@ -687,14 +745,14 @@ class Martin(api_pb2_grpc.MartinServicer):
             _context.set_details(f"{ex}")
             _context.set_code(grpc.StatusCode.UNKNOWN)
         else:
-            json_format.ParseDict(res, response)
+            response = get_converter(api_pb2.CreateLimitOrderResponse)(res)
             logger.debug(f"CreateLimitOrder: created: {res.get('orderId')}")
         return response
 
     async def CancelOrder(self, request: api_pb2.CancelOrderRequest,
                           _context: grpc.aio.ServicerContext) -> api_pb2.CancelOrderResponse:
         response = api_pb2.CancelOrderResponse()
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         try:
             res = await client.cancel_order(
@@ -705,8 +763,7 @@ class Martin(api_pb2_grpc.MartinServicer):
                 receive_window=None)
         except asyncio.CancelledError:
             pass  # Task cancellation should not be logged as an error
-        except errors.RateLimitReached as ex:
-            Martin.rate_limit_reached_time = time.time()
+        except (errors.RateLimitReached, errors.QueryCanceled) as ex:
             logger.warning(f"CancelOrder for {open_client.name}:{request.symbol} exception: {ex}")
             _context.set_details(f"{ex}")
             _context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
@@ -715,19 +772,70 @@ class Martin(api_pb2_grpc.MartinServicer):
             _context.set_details(f"{ex}")
             _context.set_code(grpc.StatusCode.UNKNOWN)
         else:
-            json_format.ParseDict(res, response)
+            response = get_converter(api_pb2.CancelOrderResponse)(res)
+        return response
+
+    async def CreateLimitOrders(self, request: api_pb2.CreateLimitOrdersRequest,
+                                _context: grpc.aio.ServicerContext) -> api_pb2.CreateLimitOrdersResponse:
+        response = api_pb2.CreateLimitOrdersResponse()
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
+        client = open_client.client
+        orders = [{'side': Side.BUY if order.buy_side else Side.SELL,
+                   'quantity': order.quantity,
+                   'price': order.price,
+                   'new_client_order_id': order.new_client_order_id} for order in request.orders]
+        try:
+            res = await client.create_orders(request.symbol, orders)
+        except Exception as ex:
+            logger.error(f"CreateLimitOrders for {open_client.name}:{request.symbol} exception:"
+                         f" {ex}\n{traceback.format_exc()}")
+            _context.set_details(f"{ex}")
+            _context.set_code(grpc.StatusCode.UNKNOWN)
+        else:
+            for order, result in zip(request.orders, res):
+                item = response.items.add(new_client_order_id=order.new_client_order_id)
+                if isinstance(result, Exception):
+                    logger.error(f"CreateLimitOrders for {open_client.name}:{request.symbol}:"
+                                 f"{order.new_client_order_id} exception: {result}")
+                    item.error = f"{result}"
+                elif result:
+                    get_converter(api_pb2.CreateLimitOrderResponse).merge(item.order, result)
+                    item.success = True
+            logger.debug(f"CreateLimitOrders: created: {sum(item.success for item in response.items)}"
+                         f" of {len(request.orders)}")
+        return response
+
+    async def CancelOrders(self, request: api_pb2.CancelOrdersRequest,
+                           _context: grpc.aio.ServicerContext) -> api_pb2.CancelOrdersResponse:
+        response = api_pb2.CancelOrdersResponse()
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
+        client = open_client.client
+        try:
+            res = await client.cancel_orders(request.symbol, list(request.order_ids))
+        except asyncio.CancelledError:
+            pass  # Task cancellation should not be logged as an error
+        except Exception as ex:
+            logger.error(f"CancelOrders for {open_client.name}:{request.symbol} exception: {ex}")
+            _context.set_details(f"{ex}")
+            _context.set_code(grpc.StatusCode.UNKNOWN)
+        else:
+            for order_id, result in zip(request.order_ids, res):
+                item = response.items.add(order_id=order_id)
+                if isinstance(result, Exception):
+                    logger.warning(f"CancelOrders for {open_client.name}:{request.symbol}:{order_id}"
+                                   f" exception: {result}")
+                    item.error = f"{result}"
+                elif result:
+                    get_converter(api_pb2.CancelOrderResponse).merge(item.order, result)
+                    item.success = True
         return response
 
     async def StartStream(self, request: api_pb2.StartStreamRequest,
                           _context: grpc.aio.ServicerContext) -> api_pb2.SimpleResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         response = api_pb2.SimpleResponse()
-        _market_stream_count = 0
-        while _market_stream_count < request.market_stream_count:
-            await asyncio.sleep(HEARTBEAT)
-            _market_stream_count = sum(len(k) for k in ([list(i.get(request.trade_id, []))
-                                                         for i in list(client.events.registered_streams.values())]))
+        await client.events.wait_streams(request.trade_id, request.market_stream_count)
         logger.info(f"Start WS streams for {open_client.name}")
         asyncio.create_task(open_client.client.start_market_events_listener(request.trade_id))
         asyncio.create_task(open_client.client.start_user_events_listener(request.trade_id, request.symbol))
@@ -736,20 +844,14 @@ class Martin(api_pb2_grpc.MartinServicer):
 
     async def StopStream(self, request: api_pb2.MarketRequest,
                          _context: grpc.aio.ServicerContext) -> api_pb2.SimpleResponse:
-        open_client = OpenClient.get_client(request.client_id)
+        open_client = await OpenClient.get_client_or_abort(request.client_id, _context)
         client = open_client.client
         logger.info(f"StopStream request for {request.symbol} on {client.exchange}")
         response = api_pb2.SimpleResponse()
         await stop_stream(client, request.trade_id)
-        [await _queue.put(request.trade_id) for _queue in client.stream_queue.get(request.trade_id, [])]
-        not_empty = True
-        while not_empty:
-            await asyncio.sleep(HEARTBEAT)
-            not_empty = False
-            for q in client.stream_queue.get(request.trade_id, []):
-                if isinstance(q, asyncio.Queue) and not q.empty():
-                    not_empty = True
-                    break
+        [await _queue.put(request.trade_id) for _queue in list(client.stream_queue.get(request.trade_id, []))]
+        # Consumers drain the queue up to the stop mark and release it
+        await client.wait_stream_queues_released(request.trade_id)
         open_client.on_order_update_queues.pop(request.trade_id, None)
         client.stream_queue.pop(request.trade_id, None)
         response.success = True
@@ -762,13 +864,59 @@ async def stop_stream(client, trade_id):
     gc.collect(generation=2)
 
 
-async def event_handler(_queue, client, trade_id, _event_type, event):
-    _event = weakref.ref(event)
+async def stream_events(client, trade_id, _queue, timeout=None):
+    """
+    Events from stream queue up to the StopStream mark, None on timeout.
+    The queue is released on any exit, also if gRPC call was cancelled
+    """
+    try:
+        while True:
+            if timeout:
+                try:
+                    _event = await asyncio.wait_for(_queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    _event = None
+            else:
+                _event = await _queue.get()
+            if isinstance(_event, str) and _event == trade_id:
+                return
+            yield _event
+    finally:
+        client.release_stream_queue(trade_id, _queue)
+        logger.info(f"Stream queue for {trade_id} released, {_queue.stats}")
+
+
+def candle_message(candle: []) -> api_pb2.Candle:
+    """
+    Binance-like kline list to typed Candle
+    """
+    return api_pb2.Candle(open_time=candle[0],
+                          open=candle[1],
+                          high=candle[2],
+                          low=candle[3],
+                          close=candle[4],
+                          volume=candle[5],
+                          close_time=candle[6],
+                          quote_asset_volume=candle[7],
+                          trades_number=candle[8] or 0,
+                          taker_buy_base_asset_volume=candle[9],
+                          taker_buy_quote_asset_volume=candle[10])
+
+
+def put_event(_queue, client, trade_id, _event_type, event):
     try:
-        _queue.put_nowait(_event())
+        _queue.put_nowait(event)
     except asyncio.QueueFull:
-        logger.warning(f"For {_event_type} asyncio queue full and wold be closed")
-        await stop_stream(client, trade_id)
+        # Only lossless queue overflow, consumer must be resynced. Stop once, not from inside of dispatch
+        if _queue.stats.dropped == 1:
+            logger.warning(f"For {_event_type} asyncio queue full and wold be closed, {_queue.stats}")
+            asyncio.ensure_future(stop_stream(client, trade_id))
+
+
+@events.non_blocking
+def event_handler(_queue, client, trade_id, _event_type, event):
+    _event = weakref.ref(event)
+    put_event(_queue, client, trade_id, _event_type, _event())
 
 
 def is_port_in_use(port: int) -> bool:
@@ -783,10 +931,12 @@ async def serve() -> None:
     listen_addr = f"localhost:{port}"
     if is_port_in_use(port):
         raise SystemExit(f"gRPC server port {port} already used")
+    load_srv_config()
+    asyncio.create_task(OpenClient.evict_idle())
     server = grpc.aio.server()
     api_pb2_grpc.add_MartinServicer_to_server(Martin(), server)
     server.add_insecure_port(listen_addr)
-    logger.info(f"Starting server on {listen_addr}")
+    logger.info(f"Starting server on {listen_addr}, JSON codec: {json_codec.NAME}")
     await server.start()
     await server.wait_for_termination()
 
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Exchange info cache shared by all accounts on the same exchange endpoint.
+Stale data is served while refresh run in background, cached data is never mutated
+"""
+import asyncio
+import logging
+import time
+
+from exchanges_wrapper.quantizer import SymbolQuantizer
+
+logger = logging.getLogger('exch_srv_logger')
+
+TTL = 600  # sec
+
+
+class ExchangeInfo:
+    def __init__(self, key) -> None:
+        self.key = key
+        self.info = {}
+        self.version = 0
+        self.symbols = {}  # symbol -> item from info['symbols']
+        self.symbols_filters = {}  # symbol -> item without 'symbol' and with filters by filterType, for Client
+        self.highest_precision = 8
+        self.quantizers = {}  # symbol -> SymbolQuantizer
+        self.responses = {}  # symbol -> prebuilt response for this version, filled by consumer
+        self.updated = 0.0
+        self.lock = asyncio.Lock()
+        self.refresh_task = None
+
+    def valid(self) -> bool:
+        return bool(self.info.get('success') or self.info.get('serverTime'))
+
+    async def get(self, fetch) -> dict:
+        """
+        :param fetch: coroutine function that download exchange info, as Client.fetch_exchange_info
+        """
+        if not self.valid():
+            async with self.lock:
+                if not self.valid():
+                    await self._load(fetch)
+        elif time.monotonic() - self.updated > TTL and (self.refresh_task is None or self.refresh_task.done()):
+            self.refresh_task = asyncio.ensure_future(self._refresh(fetch))
+        return self.info
+
+    def symbol(self, symbol) -> dict:
+        return self.symbols.get(symbol)
+
+    async def _refresh(self, fetch) -> None:
+        try:
+            await self._load(fetch)
+        except asyncio.CancelledError:
+            pass
+        except Exception as ex:
+            logger.warning(f"ExchangeInfo {self.key} refresh exception: {ex}")
+
+    async def _load(self, fetch) -> None:
+        info = await fetch()
+        if not (info.get('success') or info.get('serverTime')):
+            return
+        symbols = {}
+        symbols_filters = {}
+        quantizers = {}
+        highest_precision = 8
+        for item in info.get('symbols', []):
+            symbols[item['symbol']] = item
+            _item = {k: v for k, v in item.items() if k not in ('symbol', 'filters')}
+            _item['filters'] = {_filter['filterType']: {k: v for k, v in _filter.items() if k != 'filterType'}
+                                for _filter in item.get('filters', [])}
+            symbols_filters[item['symbol']] = _item
+            quantizers[item['symbol']] = SymbolQuantizer(_item)
+            highest_precision = max(highest_precision, item['baseAssetPrecision'])
+        self.info = info
+        self.symbols = symbols
+        self.symbols_filters = symbols_filters
+        self.quantizers = quantizers
+        self.highest_precision = highest_precision
+        self.responses = {}
+        self.version += 1
+        self.updated = time.monotonic()
+        logger.info(f"ExchangeInfo {self.key}: loaded {len(symbols)} symbols, version {self.version}")
+
+
+exchange_infos = {}
+
+
+def get_exchange_info(exchange, endpoint) -> ExchangeInfo:
+    key = (exchange, endpoint)
+    if key not in exchange_infos:
+        exchange_infos[key] = ExchangeInfo(key)
+    return exchange_infos[key]
@@ -8,6 +8,10 @@ import datetime
 from decimal import Decimal
 import logging
 import zlib
+from itertools import chain, zip_longest
+
+import exchanges_wrapper.order_book as book
+from exchanges_wrapper.kline_columns import Klines
 
 logger = logging.getLogger('exch_srv_logger')
 
@@ -16,69 +20,45 @@ CH_KEY = {
     'depth5': ['bid', 'ask'],
 }
 TIMESTAMP_PATTERN = "%Y-%m-%dT%H:%M:%S.%f"
+CHECKSUM_DEPTH = 100
 
 
-class OrderBook:
+class OrderBook(book.OrderBook):
     def __init__(self, _order_book, symbol) -> None:
-        self.symbol = symbol.replace('/', '').lower()
-        self.last_update_id = int(_order_book.get('time', 0) * 1000)
-        self.asks = {}
-        self.bids = {}
-        for i in _order_book.get('bids', []):
-            self.bids[str(i[0])] = str(i[1])
-        for i in _order_book.get('asks', []):
-            self.asks[str(i[0])] = str(i[1])
-
-    def sort_order_book(self) -> ():
-        bids = list(map(list, self.bids.items()))
-        bids.sort(key=lambda x: float(x[0]), reverse=True)
-        asks = list(map(list, self.asks.items()))
-        asks.sort(key=lambda x: float(x[0]), reverse=False)
-        return bids, asks
-
-    def get_book(self) -> dict:
-        bids, asks = self.sort_order_book()
-        return {
-            'stream': f"{self.symbol}@depth5",
-            'data': {'lastUpdateId': self.last_update_id,
-                     'bids': bids[0:5],
-                     'asks': asks[0:5],
-                     }
-        }
+        super().__init__(symbol.replace('/', '').lower(), int(_order_book.get('time', 0) * 1000))
+        self.bids.reset(_order_book.get('bids', []))
+        self.asks.reset(_order_book.get('asks', []))
+        # Preformatted 'price:qty' for each level, used for checksum
+        self.bids_raw = {k: f"{v[0]}:{v[1]}" for k, v in self.bids.levels.items()}
+        self.asks_raw = {k: f"{v[0]}:{v[1]}" for k, v in self.asks.levels.items()}
+        self._checksum = None
 
     def checksum(self) -> int:
-        raw = str()
-        bids, asks = self.sort_order_book()
-        bids_max = len(bids)
-        asks_max = len(asks)
-        for i in range(max(bids_max, asks_max)):
-            if i < bids_max:
-                raw += f"{':' if i else ''}{bids[i][0]}:{bids[i][1]}"
-            if i < asks_max:
-                raw += f":{asks[i][0]}:{asks[i][1]}"
-        res = zlib.crc32(raw.encode('utf8'))
-        return res
+        if self._checksum is None:
+            bids = map(self.bids_raw.__getitem__, self.bids.levels.islice(0, CHECKSUM_DEPTH))
+            asks = map(self.asks_raw.__getitem__, self.asks.levels.islice(0, CHECKSUM_DEPTH))
+            raw = ':'.join(filter(None, chain.from_iterable(zip_longest(bids, asks))))
+            self._checksum = zlib.crc32(raw.encode('utf8'))
+        return self._checksum
+
+    def _update_side(self, side, side_raw, levels) -> None:
+        for price, qty in levels:
+            _price = float(price)
+            if self._checksum is not None and side.in_top(_price, CHECKSUM_DEPTH):
+                self._checksum = None
+            if qty:
+                side.set(price, qty)
+                side_raw[_price] = f"{price}:{qty}"
+            else:
+                side.remove(price)
+                side_raw.pop(_price, None)
 
     def update_book(self, _update) -> int:
         self.last_update_id = int(_update.get('time', 0) * 1000)
-        bids = _update.get('bids', [])
-        for bid in bids:
-            if bid[1]:
-                self.bids[str(bid[0])] = str(bid[1])
-            else:
-                self.bids.pop(str(bid[0]), None)
-
-        asks = _update.get('asks', [])
-        for ask in asks:
-            if ask[1]:
-                self.asks[str(ask[0])] = str(ask[1])
-            else:
-                self.asks.pop(str(ask[0]), None)
+        self._update_side(self.bids, self.bids_raw, _update.get('bids', []))
+        self._update_side(self.asks, self.asks_raw, _update.get('asks', []))
         return self.checksum()
 
-    def __call__(self):
-        return self
-
 
 def on_funds_update(res: []) -> {}:
     binance_funds = {
@@ -175,7 +155,9 @@ def exchange_info(res: []) -> {}:
     _binance_res = {
         "timezone": "UTC",
         "serverTime": int(time.time() * 1000),
-        "rateLimits": [],
+        "rateLimits": [
+            {"rateLimitType": "REQUEST_WEIGHT", "interval": "SECOND", "intervalNum": 1, "limit": 30}
+        ],
         "exchangeFilters": [],
         "symbols": symbols,
     }
@@ -412,6 +394,11 @@ def klines(res: [], _interval: int) -> []:
     return binance_klines
 
 
+def klines_columns(res: [], _interval: int) -> Klines:
+    return Klines.from_records(res, ('time', 'open', 'high', 'low', 'close', 'volume'), _interval * 1000,
+                               close_offset=0)
+
+
 def account_trade_list(res: []) -> []:
     binance_trade_list = []
     for trade in res:
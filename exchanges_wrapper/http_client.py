@@ -1,20 +1,22 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
 
+import asyncio
+import copy
 import json
 from urllib.parse import urlencode, urlparse
-from exchanges_wrapper import __version__
+from exchanges_wrapper import __version__, json_codec
 import logging
 import time
 from datetime import datetime
 from exchanges_wrapper.c_structures import generate_signature
+from exchanges_wrapper import rate_limiter
 from exchanges_wrapper.errors import (
     RateLimitReached,
     ExchangeError,
     WAFLimitViolated,
     IPAddressBanned,
     HTTPError,
-    QueryCanceled,
 )
 
 logger = logging.getLogger('exch_srv_logger')
@@ -33,7 +35,6 @@ class HttpClient:
         self.api_key = api_key
         self.api_secret = api_secret
         self.endpoint = endpoint
-        self.rate_limit_reached = False
         if user_agent:
             self.user_agent = user_agent
         else:
@@ -42,15 +43,53 @@ class HttpClient:
         self.session = session
         self.exchange = exchange
         self.sub_account = sub_account
+        self.ip_limiter = rate_limiter.get_ip_limiter(exchange, proxy)
+        self.account_limiter = rate_limiter.RateLimiter(f"{exchange}:account", rate_limiter.ACCOUNT_LIMITS)
+        self.in_flight = {}  # key -> [future, followers count]
 
-    async def handle_errors(self, response):
+    @property
+    def rate_limit_reached(self) -> bool:
+        return self.ip_limiter.paused() or self.account_limiter.paused()
+
+    def set_rate_limits(self, rate_limits: []) -> None:
+        """
+        Only Binance rateLimits are real IP and account budgets. Other exchanges limit per endpoint,
+        their placeholder rateLimits are not enforced: they rely on pause after 429 only
+        """
+        if self.exchange != 'binance':
+            return
+        self.ip_limiter.update(rate_limits)
+        self.account_limiter.update(rate_limits)
+
+    def _pause(self, response, path, payload=None) -> None:
+        """
+        Pause only the exceeded limit: Binance order count - orders of this account, Bitfinex - this
+        endpoint, other - all queries from IP
+        """
+        retry_after = response.headers.get('Retry-After')
+        seconds = (int(retry_after) if retry_after and retry_after.isdigit()
+                   else rate_limiter.PAUSE_DEFAULT.get(self.exchange, rate_limiter.PAUSE_DEFAULT_OTHER))
+        if self.exchange == 'binance' and response.status == 429 and payload and payload.get('code') == -1015:
+            self.account_limiter.pause(seconds, rate_limiter.ORDERS)
+        elif self.exchange == 'bitfinex' and response.status != 418:
+            self.ip_limiter.pause(seconds, path)
+        else:
+            self.ip_limiter.pause(seconds)
+
+    async def handle_errors(self, response, path=None):
         if response.status >= 500:
             raise ExchangeError(f"An issue occurred on exchange's side: {response.status}: {response.url}:"
                                 f" {response.reason}")
+        self.ip_limiter.sync(response.headers)
+        self.account_limiter.sync(response.headers)
         if response.status == 429:
-            self.rate_limit_reached = True if self.exchange == 'binance' else None
+            try:
+                payload = await response.json(loads=json_codec.loads, content_type=None)
+            except Exception:  # skipcq: PYL-W0703
+                payload = None
+            self._pause(response, path, payload if isinstance(payload, dict) else None)
             raise RateLimitReached(RateLimitReached.message)
-        payload = await response.json()
+        payload = await response.json(loads=json_codec.loads)
         if payload and "code" in payload:
             # as defined here: https://github.com/binance/binance-spot-api-docs/blob/
             # master/errors.md#error-codes-for-binance-2019-09-25
@@ -58,10 +97,12 @@ class HttpClient:
         if response.status >= 400:
             logger.debug(f"handle_errors.response.status >= 400: {payload}")
             if response.status == 400 and payload and payload.get("error", str()) == "ERR_RATE_LIMIT":
+                self._pause(response, path)
                 raise RateLimitReached(RateLimitReached.message)
             elif response.status == 403:
                 raise WAFLimitViolated(WAFLimitViolated.message)
             elif response.status == 418:
+                self._pause(response, path)
                 raise IPAddressBanned(IPAddressBanned.message)
             else:
                 raise HTTPError(f"Malformed request: {payload}")
@@ -74,6 +115,9 @@ class HttpClient:
         else:
             raise HTTPError(f"API request failed: {payload}")
 
+    def _read_only(self, path, method) -> bool:
+        return method == 'GET' or (self.exchange == 'bitfinex' and '/auth/r/' in path)
+
     async def send_api_call(self,
                             path,
                             method="GET",
@@ -82,11 +126,44 @@ class HttpClient:
                             endpoint=None,
                             timeout=None,
                             **kwargs):
-        # print(f"send_api_call.request: path: {path}, kwargs: {kwargs}")
-        if self.rate_limit_reached:
-            raise QueryCanceled(
-                "Rate limit reached, to avoid an IP ban, this query has been cancelled"
+        """
+        Single-flight: identical concurrent read-only calls of this account share one HTTP request
+        """
+        if not self._read_only(path, method):
+            return await self._send_api_call(path, method, signed, send_api_key, endpoint, timeout, **kwargs)
+        # Key before signing, it mutates params
+        key = (method, path, endpoint, signed, _freeze(kwargs))
+        flight = self.in_flight.get(key)
+        if flight is None:
+            future = asyncio.ensure_future(
+                self._send_api_call(path, method, signed, send_api_key, endpoint, timeout, **kwargs)
             )
+            flight = self.in_flight[key] = [future, 0]
+            future.add_done_callback(lambda f: self._landed(key, f))
+        else:
+            flight[1] += 1
+        res = await asyncio.shield(flight[0])
+        # Result was shared, nobody gets the original, parsers mutate it
+        return copy.deepcopy(res) if flight[1] else res
+
+    def _landed(self, key, future) -> None:
+        self.in_flight.pop(key, None)
+        if not future.cancelled():
+            future.exception()  # Retrieved, if all callers were cancelled
+
+    async def _send_api_call(self,
+                             path,
+                             method="GET",
+                             signed=False,
+                             send_api_key=True,
+                             endpoint=None,
+                             timeout=None,
+                             payload=None,
+                             **kwargs):
+        # print(f"send_api_call.request: path: {path}, kwargs: {kwargs}")
+        weight, orders = rate_limiter.request_cost(self.exchange, path, method,
+                                                   kwargs.get('params', kwargs.get('data')))
+        await rate_limiter.acquire((self.account_limiter, self.ip_limiter), weight, orders, path)
         _endpoint = endpoint or self.endpoint
         query_kwargs = {}
         _params = {}
@@ -107,7 +184,8 @@ class HttpClient:
                 if method == 'GET':
                     _params.update(**kwargs)
                 else:
-                    query_kwargs.update({'json': kwargs})
+                    # payload: JSON array body for batch endpoints
+                    query_kwargs.update({'json': kwargs if payload is None else payload})
                 signature_payload = f"{method}\n{urlparse(_endpoint).hostname}\n/{path}\n{urlencode(_params)}"
                 signature = generate_signature(self.exchange, self.api_secret, signature_payload)
                 _params.update({'Signature': signature})
@@ -177,4 +255,12 @@ class HttpClient:
         # print(f"send_api_call.request: url: {url}, query_kwargs: {query_kwargs}")
         async with self.session.request(method, url, timeout=timeout, **query_kwargs) as response:
             # print(f"send_api_call.response: url: {response.url}, status: {response.status}")
-            return await self.handle_errors(response)
+            return await self.handle_errors(response, path)
+
+
+def _freeze(obj):
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(map(_freeze, obj))
+    return obj
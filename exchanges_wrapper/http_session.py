@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+aiohttp sessions shared by all accounts with the same exchange host and proxy: one connection pool,
+DNS cache and TLS context instead of one per Client. REST and WSS use separate sessions, WSS hold
+a connection for the lifetime and must not wait for a pool slot
+"""
+import logging
+import ssl
+from urllib.parse import urlparse
+
+import aiohttp
+
+logger = logging.getLogger('exch_srv_logger')
+
+CONNECTOR = {
+    'limit': 100,  # REST connections per session, concurrency is also bound by the rate limiter
+    'limit_per_host': 32,
+    'ttl_dns_cache': 300,  # sec
+    'keepalive_timeout': 30,  # sec, idle connection kept for the next request
+    'enable_cleanup_closed': True,
+}
+# Per exchange overrides
+EXCHANGE_CONNECTOR = {
+    'binance': {'limit_per_host': 64, 'keepalive_timeout': 60},
+}
+WS_CONNECTOR = {
+    'limit': 0,  # no limit
+    'ttl_dns_cache': 300,
+}
+
+_ssl_context = None
+
+
+def ssl_context() -> ssl.SSLContext:
+    """
+    One context for all sessions, CA certificates are loaded once
+    """
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+class SharedSession:
+    def __init__(self, key, session) -> None:
+        self.key = key
+        self.session = session
+        self.refs = 0
+
+
+sessions = {}  # (host, proxy, ws): SharedSession
+
+
+def get_session(exchange, endpoint, proxy, ws=False) -> aiohttp.ClientSession:
+    """
+    Must be called in running event loop, every call must be paired with release_session()
+    """
+    key = (urlparse(endpoint or '').hostname or exchange, proxy or None, ws)
+    shared = sessions.get(key)
+    if shared is None or shared.session.closed:
+        if ws:
+            connector = aiohttp.TCPConnector(ssl=ssl_context(), **WS_CONNECTOR)
+        else:
+            connector = aiohttp.TCPConnector(ssl=ssl_context(), **{**CONNECTOR, **EXCHANGE_CONNECTOR.get(exchange, {})})
+        # No cookies shared between accounts
+        session = aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+        shared = sessions[key] = SharedSession(key, session)
+        logger.info(f"HTTP session created for {key}")
+    shared.refs += 1
+    return shared.session
+
+
+async def release_session(session) -> None:
+    """
+    Close the session when the last Client released it
+    """
+    for key, shared in list(sessions.items()):
+        if shared.session is session:
+            shared.refs -= 1
+            if shared.refs <= 0:
+                del sessions[key]
+                await session.close()
+                logger.info(f"HTTP session closed for {key}")
+            return
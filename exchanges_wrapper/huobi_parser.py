@@ -7,6 +7,9 @@ import time
 from decimal import Decimal
 import logging
 
+import exchanges_wrapper.order_book as book
+from exchanges_wrapper.kline_columns import Klines
+
 logger = logging.getLogger('exch_srv_logger')
 
 
@@ -74,7 +77,9 @@ def exchange_info(server_time: int, trading_symbol: []) -> {}:
     _binance_res = {
         "timezone": "UTC",
         "serverTime": server_time,
-        "rateLimits": [],
+        "rateLimits": [
+            {"rateLimitType": "REQUEST_WEIGHT", "interval": "SECOND", "intervalNum": 10, "limit": 100}
+        ],
         "exchangeFilters": [],
         "symbols": symbols,
     }
@@ -222,16 +227,29 @@ def order_book(res: {}) -> {}:
     return binance_order_book
 
 
-def order_book_ws(res: {}, symbol: str) -> {}:
-    bids = res.get('tick').get('bids')[0:5]
-    asks = res.get('tick').get('asks')[0:5]
-    return {
-        'stream': f"{symbol}@depth5",
-        'data': {'lastUpdateId': res.get('ts'),
-                 'bids': bids,
-                 'asks': asks,
-                 }
-    }
+class OrderBook(book.OrderBook):
+    def __init__(self, symbol, last_update_id=0) -> None:
+        super().__init__(symbol, last_update_id)
+        self.bids = book.SnapshotSide(reverse=True)
+        self.asks = book.SnapshotSide()
+
+    def update_book(self, res: {}) -> None:
+        # market.$symbol.depth.step0 frame is a full snapshot, sorted best first
+        self.last_update_id = res.get('ts')
+        self.bids.reset(res.get('tick').get('bids'))
+        self.asks.reset(res.get('tick').get('asks'))
+
+    def get_book(self, depth=5) -> dict:
+        # Top levels as in the frame, as before the book engine. Typed stream reads book.bids.top(),
+        # formatted on demand
+        return {
+            'stream': f"{self.symbol}@depth5",
+            'data': {'lastUpdateId': self.last_update_id,
+                     'bids': self.bids.levels[:depth],
+                     'asks': self.asks.levels[:depth],
+                     'book': self,
+                     }
+        }
 
 
 def fetch_symbol_price_ticker(res: {}, symbol) -> {}:
@@ -339,6 +357,11 @@ def klines(res: [], _interval: str) -> []:
     return binance_klines
 
 
+def klines_columns(res: [], _interval: str) -> Klines:
+    return Klines.from_records(res, ('id', 'open', 'high', 'low', 'close', 'amount', 'vol', 'count'),
+                               interval2value(_interval) * 1000, time_unit=1000)
+
+
 def candle(res: [], symbol: str = None, ch_type: str = None) -> {}:
     tick = res.get('tick')
     start_time = tick.get('id')
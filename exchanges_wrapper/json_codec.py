@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+JSON codec for WSS frames and REST payloads. Use the fastest library installed
+(orjson, msgspec, ujson), else fall back to stdlib json
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if orjson:
+    NAME = 'orjson'
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+elif msgspec:
+    NAME = 'msgspec'
+    loads = msgspec.json.decode
+
+    def dumps(obj) -> str:
+        return msgspec.json.encode(obj).decode()
+elif ujson:
+    NAME = 'ujson'
+    loads = ujson.loads
+
+    def dumps(obj) -> str:
+        return ujson.dumps(obj, escape_forward_slashes=False)
+else:
+    NAME = 'json'
+    loads = json.loads
+    dumps = json.dumps
@@ -0,0 +1,223 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Candles cache per (exchange, endpoint, symbol, interval), shared by all accounts.
+Filled by REST pages (backward for history, forward for the missing tail) and by live candles stream,
+repeated FetchKlines are answered from memory. Candles are Binance-like lists, stored read only:
+live update replace the list, never mutate it
+"""
+import asyncio
+import logging
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from sortedcontainers import SortedDict
+
+from exchanges_wrapper import WORK_PATH, json_codec
+from exchanges_wrapper.kline_columns import FIELDS, Klines
+
+logger = logging.getLogger('exch_srv_logger')
+
+ENABLED = True
+MAX_CANDLES = 10000  # per store, the oldest are dropped
+PERSIST = False  # keep cache on disk between restarts
+CACHE_PATH = Path(WORK_PATH, "cache", "klines")
+SAVE_INTERVAL = 60  # sec, between file updates
+LIVE_TIMEOUT = 60  # sec, candle in progress from stream older than it is refreshed by REST
+PAGE_LIMIT = {'binance': 1000, 'ftx': 1500, 'bitfinex': 10000, 'huobi': 2000}
+COLUMNS_TAIL = 100  # candles, converted on each columnar request before the cached arrays are rebuilt
+UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'D': 86400, 'w': 604800, 'W': 604800}
+
+
+def configure(config: {}) -> None:
+    global ENABLED, MAX_CANDLES, PERSIST
+    ENABLED = config.get('enabled', ENABLED)
+    MAX_CANDLES = config.get('max_candles', MAX_CANDLES)
+    PERSIST = config.get('persist', PERSIST)
+
+
+def interval_ms(interval: str) -> int:
+    """
+    Interval length in ms, 0 if not fixed (month) or unknown
+    """
+    unit = UNITS.get(interval[-1:])
+    if unit is None or not interval[:-1].isdigit():
+        return 0
+    return int(interval[:-1]) * unit * 1000
+
+
+class KlineStore:
+    def __init__(self, key, interval: int, page_limit: int) -> None:
+        self.key = key
+        self.interval = interval
+        self.page_limit = page_limit
+        self.candles = SortedDict()  # open time: candle
+        self.offset = 0  # candle open time alignment, as Monday for 1w
+        self.first = None  # open time, all candles from first to last were fetched or streamed
+        self.last = None
+        self.closed_to = None  # open time of the last candle that is final
+        self.live = 0.0  # monotonic time of the last stream update
+        self.columns = None  # Klines of final candles up to columns_to, built on demand
+        self.columns_to = None
+        self.lock = asyncio.Lock()
+        exchange, endpoint, symbol, _interval = key
+        self.file = Path(CACHE_PATH, f"{exchange}_{urlparse(endpoint or '').hostname}_{symbol}_{_interval}.json")
+        self.saved = 0.0
+        if PERSIST:
+            self._restore()
+
+    def _align(self, ms: int) -> int:
+        return (ms - self.offset) // self.interval * self.interval + self.offset
+
+    def _put(self, candles: []) -> None:
+        if candles and self.columns is not None and candles[0][0] <= self.columns_to:
+            self.columns = None
+        for candle in candles:
+            self.candles[candle[0]] = candle
+
+    def update(self, candle: [], closed: bool) -> None:
+        """
+        Candle from stream, accepted only if it continues the cached range
+        """
+        open_time = candle[0]
+        if self.last is None or open_time < self.first or open_time > self.last + self.interval:
+            return
+        self.candles[open_time] = candle
+        self.last = max(self.last, open_time)
+        if closed and open_time == self.closed_to + self.interval:
+            self.closed_to = open_time
+        self.live = time.monotonic()
+
+    async def get(self, start_time, end_time, limit, fetch, columnar=False) -> []:
+        """
+        :param fetch: coroutine function (start_time, end_time, limit) for one REST page
+        :param columnar: return Klines, numpy must be installed
+        :return: candles as Client.fetch_klines
+        """
+        async with self.lock:
+            if self.last is None:
+                page = await fetch(start_time, end_time, min(limit, self.page_limit))
+                if not page:
+                    return page
+                self.offset = page[0][0] % self.interval
+                self._put(page)
+                self.first = page[0][0]
+                self.last = page[-1][0]
+                self.closed_to = min(self.last, self._align(int(time.time() * 1000)) - self.interval)
+                if limit <= self.page_limit:
+                    self._trim()
+                    self._save()
+                    return Klines.from_rows(page) if columnar else page
+            now_open = self._align(int(time.time() * 1000))
+            if start_time:
+                start = self._align(start_time + self.interval - 1)
+                end = min(start + (limit - 1) * self.interval, self._align(end_time) if end_time else now_open)
+            else:
+                end = min(self._align(end_time), now_open) if end_time else now_open
+                start = end - (limit - 1) * self.interval
+            if limit > MAX_CANDLES or start > self.last + self.interval or end < self.first - self.interval:
+                # Not adjacent to the cached range, cache is not used
+                res = await self._fetch_range(start, end, fetch)
+                return Klines.from_rows(res) if columnar else res
+            changed = False
+            if start < self.first:
+                backfill = await self._fetch_range(start, self.first - self.interval, fetch)
+                if backfill:
+                    # Exchange may serve only the latest candles, the rest of range is not cached
+                    self._put(backfill)
+                    self.first = backfill[0][0]
+                    changed = True
+            if end > self.closed_to and not (end <= self.last and end - self.closed_to <= self.interval
+                                             and time.monotonic() - self.live < LIVE_TIMEOUT):
+                tail_start = self.closed_to + self.interval
+                self._put(await self._fetch_range(tail_start, end, fetch))
+                self.last = max(self.last, end)
+                self.closed_to = max(self.closed_to, min(end, now_open - self.interval))
+                changed = True
+            if columnar:
+                res = self._columns(start, end)
+            else:
+                res = [self.candles[i] for i in self.candles.irange(start, end)]
+            if changed:
+                self._trim()
+                self._save()
+            return res
+
+    def _columns(self, start, end) -> Klines:
+        """
+        Final candles are sliced from cached read only arrays, only the newer ones are converted
+        """
+        if self.columns is None or self.closed_to - self.columns_to > COLUMNS_TAIL * self.interval:
+            self.columns = Klines.from_rows([self.candles[i] for i in self.candles.irange(maximum=self.closed_to)])
+            self.columns_to = self.closed_to
+            for field in FIELDS:
+                getattr(self.columns, field).flags.writeable = False
+        tail = [self.candles[i] for i in self.candles.irange(max(start, self.columns_to + self.interval), end)]
+        return Klines.join([self.columns.between(start, end), Klines.from_rows(tail)])
+
+    async def _fetch_range(self, start, end, fetch) -> []:
+        res = []
+        page_span = self.page_limit * self.interval
+        for page_start in range(start, end + 1, page_span):
+            page_end = min(page_start + page_span - self.interval, end)
+            page = await fetch(page_start, page_end, (page_end - page_start) // self.interval + 1)
+            res.extend(i for i in page if page_start <= i[0] <= page_end)
+        return res
+
+    def _trim(self) -> None:
+        excess = len(self.candles) - MAX_CANDLES
+        if excess > 0:
+            self.columns = None
+            for open_time in list(self.candles.islice(0, excess)):
+                del self.candles[open_time]
+            self.first = self.candles.keys()[0]
+
+    def _save(self) -> None:
+        if not PERSIST or time.monotonic() - self.saved < SAVE_INTERVAL:
+            return
+        self.saved = time.monotonic()
+        # Columnar: one list per candle field
+        data = {'first': self.first,
+                'last': self.last,
+                'closed_to': self.closed_to,
+                'offset': self.offset,
+                'columns': [list(column) for column in zip(*self.candles.values())]}
+        try:
+            CACHE_PATH.mkdir(parents=True, exist_ok=True)
+            self.file.write_text(json_codec.dumps(data))
+        except OSError as ex:
+            logger.warning(f"KlineStore {self.key} save failed: {ex}")
+
+    def _restore(self) -> None:
+        try:
+            data = json_codec.loads(self.file.read_text())
+            candles = [list(row) for row in zip(*data['columns'])]
+        except FileNotFoundError:
+            return
+        except Exception as ex:
+            logger.warning(f"KlineStore {self.key} restore failed: {ex}")
+            return
+        if candles:
+            self._put(candles)
+            self.first = data['first']
+            self.last = data['last']
+            self.closed_to = data['closed_to']
+            self.offset = data['offset']
+            logger.info(f"KlineStore {self.key}: restored {len(candles)} candles")
+
+
+kline_stores = {}
+
+
+def get_kline_store(exchange, endpoint, symbol, interval, create=True):
+    """
+    None if cache disabled or interval is not fixed
+    """
+    key = (exchange, endpoint, symbol, interval)
+    store = kline_stores.get(key)
+    if store is None and create and ENABLED:
+        _interval_ms = interval_ms(interval)
+        if _interval_ms:
+            store = kline_stores[key] = KlineStore(key, _interval_ms, PAGE_LIMIT.get(exchange, 500))
+    return store
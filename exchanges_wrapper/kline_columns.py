@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Columnar candles on NumPy arrays, if numpy is installed. One array per candle field instead of
+one list of strings per candle, Binance-like lists are built lazily only if rows are requested
+"""
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INT_FIELDS = ('open_time', 'close_time', 'trades_number')
+FIELDS = ('open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_asset_volume',
+          'trades_number', 'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume')
+
+
+class Klines:
+    """
+    Sequence of candles: len(), iteration and index give Binance-like lists as Client.fetch_klines,
+    slice and between() give Klines on array views
+    """
+    __slots__ = FIELDS + ('_rows',)
+
+    def __init__(self, rows=None, **columns) -> None:
+        size = len(columns['open_time'])
+        for field in FIELDS:
+            column = columns.get(field)
+            if column is None:
+                column = np.zeros(size, dtype=np.int64 if field in INT_FIELDS else np.float64)
+            setattr(self, field, column)
+        self._rows = rows
+
+    @classmethod
+    def from_rows(cls, rows: []):
+        """
+        From Binance-like lists, the lists are kept as rows
+        """
+        if not rows:
+            return cls.empty()
+        table = np.array([row[:11] for row in rows], dtype=np.float64).T.copy()
+        return cls(rows=rows, **{field: table[i].astype(np.int64) if field in INT_FIELDS else table[i]
+                                 for i, field in enumerate(FIELDS)})
+
+    @classmethod
+    def from_records(cls, records: [], keys: (), interval_ms: int, close_offset=-1, time_unit=1):
+        """
+        Vectorized conversion of raw exchange candles (lists, or dicts if keys are names).
+        :param keys: item keys for open_time, open, high, low, close, volume and optional quote_asset_volume,
+         trades_number, absent fields are 0
+        :param close_offset: close_time is open_time + interval_ms + close_offset
+        :param time_unit: open_time multiplier to ms
+        """
+        if not records:
+            return cls.empty()
+        table = np.array(list(map(itemgetter(*keys), records)), dtype=np.float64)
+        table = np.nan_to_num(table.reshape(-1, len(keys)))
+        table = table.T.copy()  # contiguous columns
+        open_time = table[0].astype(np.int64) * time_unit
+        columns = dict(zip(('open', 'high', 'low', 'close', 'volume', 'quote_asset_volume'), table[1:]))
+        if len(keys) > 7:
+            columns['trades_number'] = table[7].astype(np.int64)
+        return cls(open_time=open_time, close_time=open_time + (interval_ms + close_offset), **columns)
+
+    @classmethod
+    def empty(cls):
+        return cls(open_time=np.zeros(0, dtype=np.int64))
+
+    @classmethod
+    def join(cls, parts: []):
+        parts = [part for part in parts if len(part)]
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return cls.empty()
+        rows = None
+        if all(part._rows is not None for part in parts):
+            rows = [row for part in parts for row in part._rows]
+        return cls(rows=rows, **{field: np.concatenate([getattr(part, field) for part in parts]) for field in FIELDS})
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return Klines(rows=self._rows[item] if self._rows is not None else None,
+                          **{field: getattr(self, field)[item] for field in FIELDS})
+        return self.rows[item]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def between(self, start_time=None, end_time=None):
+        """
+        Candles with open_time in [start_time, end_time], open_time is sorted
+        """
+        lo = np.searchsorted(self.open_time, start_time, side='left') if start_time else 0
+        hi = np.searchsorted(self.open_time, end_time, side='right') if end_time else len(self)
+        return self[int(lo):int(hi)]
+
+    @property
+    def rows(self) -> []:
+        if self._rows is None:
+            columns = [getattr(self, field).tolist() if field in INT_FIELDS
+                       else list(map(str, getattr(self, field).tolist())) for field in FIELDS]
+            self._rows = [[*row, '0.0'] for row in zip(*columns)]
+        return self._rows
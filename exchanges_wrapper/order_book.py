@@ -0,0 +1,199 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Incremental price-level order book, shared by exchange parsers
+"""
+import logging
+from collections import deque
+from operator import neg
+
+from sortedcontainers import SortedDict
+
+logger = logging.getLogger('exch_srv_logger')
+
+
+class BookSide:
+    """
+    One side of the order book, levels sorted by numeric price with the best price first.
+    Level value is (price, quantity) in the exchange string representation.
+    Insert and delete are O(log n), top-k read is O(k)
+    """
+    def __init__(self, reverse=False) -> None:
+        self.reverse = reverse
+        self.levels = SortedDict(neg) if reverse else SortedDict()
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __bool__(self) -> bool:
+        return bool(self.levels)
+
+    def set(self, price, qty) -> None:
+        self.levels[float(price)] = (str(price), str(qty))
+
+    def remove(self, price) -> None:
+        self.levels.pop(float(price), None)
+
+    def reset(self, levels: []) -> None:
+        _levels = ((float(i[0]), (str(i[0]), str(i[1]))) for i in levels)
+        self.levels = SortedDict(neg, _levels) if self.reverse else SortedDict(_levels)
+
+    def top(self, depth: int) -> []:
+        return list(map(self.levels.__getitem__, self.levels.islice(0, depth)))
+
+    def in_top(self, price: float, depth: int) -> bool:
+        """
+        True if the level at price is (or would be) among the best depth levels
+        """
+        if len(self.levels) <= depth:
+            return True
+        edge = self.levels.keys()[depth - 1]
+        return price >= edge if self.reverse else price <= edge
+
+
+class SnapshotSide:
+    """
+    Book side from full snapshot frames already sorted best first by the exchange, as Huobi step0.
+    The frame list is kept as is, only levels read by top() are formatted
+    """
+    def __init__(self, reverse=False) -> None:
+        self.reverse = reverse
+        self.levels = []  # [[price, quantity]] from the frame
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __bool__(self) -> bool:
+        return bool(self.levels)
+
+    def reset(self, levels: []) -> None:
+        self.levels = levels or []
+
+    def top(self, depth: int) -> []:
+        return [(str(price), str(qty)) for price, qty, *_ in self.levels[:depth]]
+
+    def in_top(self, price: float, depth: int) -> bool:
+        if len(self.levels) <= depth:
+            return True
+        edge = float(self.levels[depth - 1][0])
+        return price >= edge if self.reverse else price <= edge
+
+
+class OrderBook:
+    def __init__(self, symbol, last_update_id=0) -> None:
+        self.symbol = symbol
+        self.last_update_id = last_update_id
+        self.bids = BookSide(reverse=True)
+        self.asks = BookSide()
+
+    def get_book(self, depth=5) -> dict:
+        return {
+            'stream': f"{self.symbol}@depth5",
+            'data': {'lastUpdateId': self.last_update_id,
+                     'bids': self.bids.top(depth),
+                     'asks': self.asks.top(depth),
+                     'book': self,
+                     }
+        }
+
+    def __call__(self):
+        return self
+
+
+class DiffOrderBook(OrderBook):
+    """
+    Local book from Binance diff depth stream, synced to REST snapshot by update id, see
+    "How to manage a local order book correctly" in
+    https://github.com/binance/binance-spot-api-docs/blob/master/web-socket-streams.md
+    Until the snapshot is loaded the events are buffered
+    """
+    BUFFER = 1000
+
+    def __init__(self, symbol) -> None:
+        super().__init__(symbol)
+        self.synced = False
+        self.buffer = deque(maxlen=self.BUFFER)
+
+    @staticmethod
+    def _update_side(side, levels) -> None:
+        for price, qty in levels:
+            if float(qty):
+                side.set(price, qty)
+            else:
+                side.remove(price)
+
+    def reset(self, snapshot: {}) -> bool:
+        """
+        Load snapshot and apply buffered events. False if the snapshot is older than buffer, refetch it
+        """
+        self.last_update_id = snapshot['lastUpdateId']
+        self.bids.reset(snapshot['bids'])
+        self.asks.reset(snapshot['asks'])
+        self.synced = True
+        buffer, self.buffer = self.buffer, deque(maxlen=self.BUFFER)
+        while buffer:
+            event = buffer.popleft()
+            if not self.update_book(event):
+                # The failed event is buffered by update_book, keep the rest after it for the next snapshot
+                logger.warning(f"DiffOrderBook {self.symbol}: gap after snapshot {snapshot['lastUpdateId']},"
+                               f" event U: {event['U']}, {len(buffer)} events kept for resync")
+                self.buffer.extend(buffer)
+                return False
+        return True
+
+    def update_book(self, event: {}) -> bool:
+        """
+        False on the gap in update id sequence, the book is not synced anymore
+        """
+        if not self.synced:
+            self.buffer.append(event)
+            return True
+        if event['u'] <= self.last_update_id:
+            return True
+        if event['U'] > self.last_update_id + 1:
+            self.synced = False
+            self.buffer.append(event)
+            return False
+        self._update_side(self.bids, event['b'])
+        self._update_side(self.asks, event['a'])
+        self.last_update_id = event['u']
+        return True
+
+
+class BookView:
+    """
+    Top depth levels of the book as last sent to one stream consumer. Diff is made against what was sent,
+    not between events, so events conflated in the stream queue never break the client book.
+    Removed level is sent with quantity '0'
+    """
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        self.bids = {}
+        self.asks = {}
+        self.sequence = 0
+
+    @staticmethod
+    def _diff(sent: {}, top: {}) -> []:
+        changes = [(price, qty) for price, qty in top.items() if sent.get(price) != qty]
+        changes.extend((price, '0') for price in sent if price not in top)
+        return changes
+
+    def snapshot(self, bids: [], asks: []) -> ([], []):
+        self.bids = dict(bids)
+        self.asks = dict(asks)
+        self.sequence += 1
+        return list(self.bids.items()), list(self.asks.items())
+
+    def diff(self, bids: [], asks: []) -> ([], []):
+        """
+        Changed levels since the last sent message, empty if top depth levels are the same
+        """
+        bids = dict(bids)
+        asks = dict(asks)
+        bid_changes = self._diff(self.bids, bids)
+        ask_changes = self._diff(self.asks, asks)
+        self.bids = bids
+        self.asks = asks
+        if bid_changes or ask_changes:
+            self.sequence += 1
+        return bid_changes, ask_changes
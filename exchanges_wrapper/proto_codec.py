@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Fast dict -> protobuf message converters, planned once from the message descriptor.
+Replacement for json_format.ParseDict on the hot path: no per call reflection, the message is built
+by one constructor call (nested messages as kwargs dict). Keys are matched as in ParseDict, by field name
+or lowerCamelCase json name, None value leave the field default, unknown keys are skipped
+"""
+from google.protobuf.descriptor import FieldDescriptor
+
+try:
+    from google.protobuf.message_factory import GetMessageClass
+except ImportError:  # protobuf < 4.21
+    def GetMessageClass(descriptor):
+        return descriptor._concrete_class
+
+_INT_TYPES = (FieldDescriptor.CPPTYPE_INT32, FieldDescriptor.CPPTYPE_INT64,
+              FieldDescriptor.CPPTYPE_UINT32, FieldDescriptor.CPPTYPE_UINT64)
+_FLOAT_TYPES = (FieldDescriptor.CPPTYPE_FLOAT, FieldDescriptor.CPPTYPE_DOUBLE)
+
+
+def _string(value) -> str:
+    return value if type(value) is str else str(value)
+
+
+def _int(value) -> int:
+    return value if type(value) is int else int(value)
+
+
+def _float(value) -> float:
+    return value if type(value) is float else float(value)
+
+
+def _repeated(field) -> bool:
+    if hasattr(field, 'is_repeated'):
+        return field.is_repeated
+    return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _camel(name: str) -> str:
+    head, *tail = name.split('_')
+    return head + ''.join(i[:1].upper() + i[1:] for i in tail)
+
+
+class MessageConverter:
+    def __init__(self, message_class) -> None:
+        self.message_class = message_class
+        self.fields = {}  # dict key: (field name, convert value, repeated)
+        for field in message_class.DESCRIPTOR.fields:
+            if field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+                convert = MessageConverter(GetMessageClass(field.message_type)).kwargs
+            elif field.cpp_type == FieldDescriptor.CPPTYPE_STRING:
+                convert = _string
+            elif field.cpp_type in _INT_TYPES:
+                convert = _int
+            elif field.cpp_type in _FLOAT_TYPES:
+                convert = _float
+            else:
+                convert = None  # bool and enum, as is
+            plan = (field.name, convert, _repeated(field))
+            self.fields[field.name] = plan
+            self.fields.setdefault(_camel(field.name), plan)
+
+    def kwargs(self, data: {}) -> {}:
+        res = {}
+        fields = self.fields
+        for key, value in data.items():
+            plan = fields.get(key)
+            if plan is None or value is None:
+                continue
+            name, convert, repeated = plan
+            if convert is None:
+                res[name] = value
+            elif repeated:
+                res[name] = [convert(i) for i in value]
+            else:
+                res[name] = convert(value)
+        return res
+
+    def __call__(self, data: {}):
+        return self.message_class(**self.kwargs(data))
+
+    def extend(self, repeated, items: []) -> None:
+        """
+        Add messages from dicts to repeated field in place, without copy
+        """
+        add = repeated.add
+        kwargs = self.kwargs
+        for item in items:
+            add(**kwargs(item))
+
+    def merge(self, message, data: {}) -> None:
+        """
+        Fill existing message, e.g. nested field of response
+        """
+        message.MergeFrom(self(data))
+
+
+converters = {}
+
+
+def get_converter(message_class) -> MessageConverter:
+    converter = converters.get(message_class)
+    if converter is None:
+        converter = converters[message_class] = MessageConverter(message_class)
+    return converter
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Per-symbol price and quantity quantizers. Tick/step are kept as integer units of 10**-scale,
+rounding (toward zero) is exact integer arithmetic, no float or Decimal on the hot path
+"""
+from decimal import Decimal
+
+
+def to_units(value, scale: int) -> int:
+    """
+    Value (str, Decimal, int or float) truncated to integer count of 10**-scale
+    """
+    s = value if isinstance(value, str) else str(value)
+    if 'e' in s or 'E' in s:
+        s = f"{Decimal(s):f}"
+    int_part, _, frac = s.partition('.')
+    return int(int_part + frac[:scale].ljust(scale, '0'))
+
+
+def scale_of(value: str) -> int:
+    s = f"{Decimal(value).normalize():f}"
+    return len(s.partition('.')[2])
+
+
+class Quantizer:
+    def __init__(self, step, precision: int) -> None:
+        """
+        :param step: tickSize or stepSize as string, None or zero for precision only
+        :param precision: max decimal places in result
+        """
+        self.precision = precision
+        self.scale = max(precision, scale_of(step)) if step else precision
+        self.step = to_units(step, self.scale) if step else 0
+        self.divider = 10 ** (self.scale - precision)
+
+    def units(self, value) -> int:
+        """
+        Non-negative value rounded down to step and precision, in units of 10**-precision
+        """
+        units = to_units(value, self.scale)
+        if self.step:
+            units -= units % self.step
+        return units // self.divider
+
+    def format(self, units: int) -> str:
+        if not self.precision:
+            return str(units)
+        s = str(units).rjust(self.precision + 1, '0')
+        frac = s[-self.precision:].rstrip('0')
+        return f"{s[:-self.precision]}.{frac}" if frac else s[:-self.precision]
+
+    def __call__(self, value) -> str:
+        return self.format(self.units(value))
+
+    def many(self, values) -> [str]:
+        """
+        Quantize a whole grid of prices or amounts in one call, value by value as __call__.
+        Exact parse and format of decimal strings dominate, on NumPy arrays it is not faster
+        """
+        _units = self.units
+        _format = self.format
+        return [_format(_units(value)) for value in values]
+
+
+class SymbolQuantizer:
+    """
+    price: by PRICE_FILTER tickSize, amount: by LOT_SIZE stepSize, quote: by precision only
+    """
+    def __init__(self, symbol_info: {}) -> None:
+        precision = symbol_info["baseAssetPrecision"]
+        filters = symbol_info["filters"]
+        self.price = Quantizer(filters.get("PRICE_FILTER", {}).get("tickSize"), precision)
+        self.amount = Quantizer(filters.get("LOT_SIZE", {}).get("stepSize"), precision)
+        self.quote = Quantizer(None, precision)
@@ -0,0 +1,189 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Proactive REST rate limiter: weighted token buckets built from Binance exchange info rateLimits
+and kept in sync with X-MBX-USED-WEIGHT-* / X-MBX-ORDER-COUNT-* response headers
+"""
+import asyncio
+import logging
+import time
+
+from exchanges_wrapper.errors import QueryCanceled
+
+logger = logging.getLogger('exch_srv_logger')
+
+SAFETY = 0.9  # Part of the exchange limit we allow ourselves to spend
+MAX_WAIT = 10  # sec, longer queue cancel the query instead of waiting
+# sec, pause after 429/418 if no Retry-After header, not over MAX_WAIT: queries wait it out instead of cancel
+PAUSE_DEFAULT = {'binance': MAX_WAIT, 'bitfinex': 5}
+PAUSE_DEFAULT_OTHER = 1
+ORDERS = 'ORDERS'  # pause scope: only queries that place orders
+INTERVALS = {'SECOND': 1, 'MINUTE': 60, 'HOUR': 3600, 'DAY': 86400}
+IP_LIMITS = ('REQUEST_WEIGHT', 'RAW_REQUESTS')
+ACCOUNT_LIMITS = ('ORDERS',)
+HEADERS = {'REQUEST_WEIGHT': 'X-MBX-USED-WEIGHT', 'ORDERS': 'X-MBX-ORDER-COUNT'}
+#
+# https://github.com/binance/binance-spot-api-docs/blob/master/rest-api.md
+BINANCE_WEIGHT = {
+    ('GET', '/api/v3/exchangeInfo'): 10,
+    ('GET', '/api/v3/historicalTrades'): 5,
+    ('GET', '/api/v3/order'): 2,
+    ('GET', '/api/v3/openOrders'): 3,
+    ('GET', '/api/v3/allOrders'): 10,
+    ('GET', '/api/v3/orderList'): 2,
+    ('GET', '/api/v3/allOrderList'): 10,
+    ('GET', '/api/v3/openOrderList'): 3,
+    ('GET', '/api/v3/account'): 10,
+    ('GET', '/api/v3/myTrades'): 10,
+}
+# Weight if called without symbol
+BINANCE_WEIGHT_ALL = {
+    ('GET', '/api/v3/ticker/24hr'): 40,
+    ('GET', '/api/v3/ticker/price'): 2,
+    ('GET', '/api/v3/ticker/bookTicker'): 2,
+    ('GET', '/api/v3/openOrders'): 40,
+}
+BINANCE_DEPTH_WEIGHT = ((100, 1), (500, 5), (1000, 10), (5000, 50))
+BINANCE_ORDERS = {
+    ('POST', '/api/v3/order'): 1,
+    ('POST', '/api/v3/order/oco'): 2,
+}
+
+
+def request_cost(exchange, path, method, params=None) -> (int, int):
+    """
+    Return (request weight, order count) for REST call
+    """
+    if exchange != 'binance':
+        return 1, 0
+    params = params or {}
+    key = (method, path)
+    if path == '/api/v3/depth':
+        limit = int(params.get('limit', 100))
+        weight = next((w for lim, w in BINANCE_DEPTH_WEIGHT if limit <= lim), BINANCE_DEPTH_WEIGHT[-1][1])
+    elif key in BINANCE_WEIGHT_ALL and not params.get('symbol'):
+        weight = BINANCE_WEIGHT_ALL[key]
+    else:
+        weight = BINANCE_WEIGHT.get(key, 1)
+    return weight, BINANCE_ORDERS.get(key, 0)
+
+
+class TokenBucket:
+    """
+    Continuous refill bucket. Tokens are reserved before the wait, so concurrent callers
+    are served in FIFO order without lock and the token level can go below zero
+    """
+    def __init__(self, limit_type, interval, interval_num, limit) -> None:
+        self.limit_type = limit_type
+        self.limit = limit
+        self.period = INTERVALS.get(interval, 60) * interval_num
+        self.capacity = limit * SAFETY
+        self.rate = self.capacity / self.period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        # Response header with used value for this interval, as X-MBX-USED-WEIGHT-1M
+        _prefix = HEADERS.get(limit_type)
+        self.header = f"{_prefix}-{interval_num}{interval[0]}" if _prefix else None
+
+    def _refill(self, now) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, cost, now) -> float:
+        self._refill(now)
+        return max(0.0, (cost - self.tokens) / self.rate)
+
+    def consume(self, cost) -> None:
+        self.tokens -= cost
+
+    def sync(self, used, now) -> None:
+        """
+        Exchange counter is the authority: never allow more than it has left in the window
+        """
+        self._refill(now)
+        self.tokens = min(self.tokens, self.capacity - used)
+
+
+class RateLimiter:
+    def __init__(self, name, limit_types) -> None:
+        self.name = name
+        self.limit_types = limit_types
+        self.rate_limits = None
+        self.buckets = []
+        self.paused_until = 0.0
+        self.scope_paused_until = {}  # ORDERS or path: monotonic time
+
+    def update(self, rate_limits: []) -> None:
+        if rate_limits == self.rate_limits:
+            return
+        self.rate_limits = rate_limits
+        self.buckets = [TokenBucket(i['rateLimitType'], i['interval'], i['intervalNum'], i['limit'])
+                        for i in rate_limits or [] if i.get('rateLimitType') in self.limit_types]
+        logger.info(f"RateLimiter {self.name}: {[(b.header, b.limit) for b in self.buckets]}")
+
+    def paused(self) -> bool:
+        now = time.monotonic()
+        return self.paused_until > now or any(i > now for i in self.scope_paused_until.values())
+
+    def pause(self, seconds, scope=None) -> None:
+        """
+        :param scope: None - all queries, ORDERS - queries that place orders, other - queries to this path
+        """
+        until = time.monotonic() + seconds
+        if scope is None:
+            self.paused_until = max(self.paused_until, until)
+        else:
+            self.scope_paused_until[scope] = max(self.scope_paused_until.get(scope, 0.0), until)
+        logger.warning(f"RateLimiter {self.name}: paused for {seconds} s{f' for {scope}' if scope else ''}")
+
+    def _costs(self, weight, orders) -> []:
+        costs = ((bucket, orders if bucket.limit_type == 'ORDERS' else weight) for bucket in self.buckets)
+        return [(bucket, cost) for bucket, cost in costs if cost]
+
+    def delay(self, weight, orders, now, path=None) -> float:
+        delays = [bucket.delay(cost, now) for bucket, cost in self._costs(weight, orders)]
+        if self.scope_paused_until:
+            if orders:
+                delays.append(self.scope_paused_until.get(ORDERS, 0.0) - now)
+            if path:
+                delays.append(self.scope_paused_until.get(path, 0.0) - now)
+        return max([self.paused_until - now] + delays)
+
+    def consume(self, weight, orders) -> None:
+        for bucket, cost in self._costs(weight, orders):
+            bucket.consume(cost)
+
+    def sync(self, headers) -> None:
+        now = time.monotonic()
+        for bucket in self.buckets:
+            used = bucket.header and headers.get(bucket.header)
+            if used is not None:
+                bucket.sync(int(used), now)
+
+
+ip_limiters = {}
+
+
+def get_ip_limiter(exchange, proxy) -> RateLimiter:
+    """
+    REQUEST_WEIGHT and RAW_REQUESTS are counted per IP, share it between accounts with same route
+    """
+    key = (exchange, proxy)
+    if key not in ip_limiters:
+        ip_limiters[key] = RateLimiter(f"{exchange}:{proxy or 'direct'}", IP_LIMITS)
+    return ip_limiters[key]
+
+
+async def acquire(limiters, weight=1, orders=0, path=None) -> None:
+    """
+    Reserve tokens in all limiters and wait for their turn, or cancel query if the queue is too long
+    """
+    now = time.monotonic()
+    delay = max(limiter.delay(weight, orders, now, path) for limiter in limiters)
+    if delay > MAX_WAIT:
+        raise QueryCanceled(f"Rate limit reached, to avoid an IP ban, this query has been cancelled,"
+                            f" retry after {round(delay, 1)} s")
+    for limiter in limiters:
+        limiter.consume(weight, orders)
+    if delay > 0:
+        await asyncio.sleep(delay)
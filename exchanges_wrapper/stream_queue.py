@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Queues between WSS event handlers and gRPC stream consumers, with per-stream backpressure policy.
+Both are unbounded for asyncio.Queue, so put_nowait() never block event loop, the bound is kept by policy.
+Not event items (StopStream mark) are never conflated or dropped
+"""
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from itertools import count
+
+logger = logging.getLogger('exch_srv_logger')
+
+_unique = count()
+
+
+class QueueStats:
+    def __init__(self) -> None:
+        self.put = 0
+        self.conflated = 0
+        self.dropped = 0
+        self.high_water = 0
+
+    def __str__(self):
+        return (f"put: {self.put}, conflated: {self.conflated}, dropped: {self.dropped},"
+                f" high water: {self.high_water}")
+
+
+class ConflatingQueue(asyncio.Queue):
+    """
+    Keep only the latest event per key, for snapshots as ticker, order book or candle in progress.
+    If the slow consumer accumulate more than size keys, the oldest one is dropped
+    """
+    def __init__(self, size, key=None) -> None:
+        self.size = size
+        self.key = key or (lambda _event: None)
+        self.stats = QueueStats()
+        super().__init__()
+
+    def _init(self, maxsize):
+        self._queue = OrderedDict()
+
+    def _put(self, item):
+        self.stats.put += 1
+        key = self.key(item) if not isinstance(item, str) else None
+        if key is None:
+            key = next(_unique)
+        elif key in self._queue:
+            self.stats.conflated += 1
+        elif len(self._queue) >= self.size:
+            oldest = next((k for k, v in self._queue.items() if not isinstance(v, str)), None)
+            if oldest is not None:
+                del self._queue[oldest]
+                self.stats.dropped += 1
+                if self.stats.dropped & (self.stats.dropped - 1) == 0:  # 1, 2, 4, ...
+                    logger.warning(f"ConflatingQueue: slow consumer, {self.stats}")
+        self._queue[key] = item
+        self.stats.high_water = max(self.stats.high_water, len(self._queue))
+
+    def _get(self):
+        return self._queue.popitem(last=False)[1]
+
+
+class LosslessQueue(asyncio.Queue):
+    """
+    FIFO without loss up to budget events, over it put_nowait() raise QueueFull
+    and the consumer must be resynced
+    """
+    def __init__(self, budget) -> None:
+        self.budget = budget
+        self.stats = QueueStats()
+        super().__init__()
+
+    def _init(self, maxsize):
+        self._queue = deque()
+
+    def _put(self, item):
+        if len(self._queue) >= self.budget and not isinstance(item, str):
+            self.stats.dropped += 1
+            raise asyncio.QueueFull
+        self.stats.put += 1
+        self._queue.append(item)
+        self.stats.high_water = max(self.stats.high_water, len(self._queue))
+
+    def _get(self):
+        return self._queue.popleft()
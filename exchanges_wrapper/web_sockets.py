@@ -1,12 +1,11 @@
 #!/usr/bin/python3
 # -*- coding: utf-8 -*-
-# __version__ = "1.2.6b4"
+# __version__ = "1.2.7b0"
 
 from exchanges_wrapper import __version__
 
 import aiohttp
 import asyncio
-import json
 import random
 import logging
 import time
@@ -15,19 +14,39 @@ import traceback
 import gzip
 from datetime import datetime
 from urllib.parse import urlencode, urlparse
+from collections import defaultdict
 
 import exchanges_wrapper.ftx_parser as ftx
 import exchanges_wrapper.bitfinex_parser as bfx
 import exchanges_wrapper.huobi_parser as hbp
+from exchanges_wrapper.order_book import DiffOrderBook
+from exchanges_wrapper.events import KlineWrapper
 from exchanges_wrapper.c_structures import generate_signature
+from exchanges_wrapper import json_codec
 
 logger = logging.getLogger('exch_srv_logger')
 
+# Market channels per socket
+CHANNELS_LIMIT = {
+    'binance': 1024,
+    'ftx': 20,
+    'bitfinex': 25,  # WSS error 10305 above it
+    'huobi': 20,
+}
+CHANNELS_LIMIT_DEFAULT = 20
+# Binance combined stream: streams passed in URL on connect, others are subscribed by control messages
+BINANCE_URL_STREAMS = 100
+BINANCE_CONTROL_RATE = 4  # messages per second, exchange limit is 5 including PING/PONG
+# Binance order book: local book from diff depth stream instead of depth5 partial
+BINANCE_DEPTH_STREAM = 'depth@100ms'
+BINANCE_BOOK_LIMIT = 1000  # REST snapshot depth
+BINANCE_BOOK_RETRY = 5  # sec, delay after failed snapshot
+
 
 class EventsDataStream:
     def __init__(self, client, endpoint, user_agent, exchange, trade_id):
         self.client = client
-        self.session = client.session
+        self.session = client.ws_session
         self.endpoint = endpoint
         if user_agent:
             self.user_agent = user_agent
@@ -46,7 +65,8 @@ class EventsDataStream:
             delay = random.randint(1, 10) * self.try_count
             logger.error(f"WSS start({self.exchange}): {ex}, restart try count: {self.try_count}, delay: {delay}s")
             await asyncio.sleep(delay)
-            asyncio.ensure_future(self.start())
+            if self._active():
+                asyncio.ensure_future(self.start())
         except Exception as ex:
             logger.error(f"WSS start() other exception: {ex}")
             logger.debug(traceback.format_exc())
@@ -57,9 +77,13 @@ class EventsDataStream:
     async def stop(self):
         pass  # meant to be overridden in a subclass
 
-    async def upstream_bitfinex(self, request, symbol=None, ch_type=str()):
-        await self.web_socket.send_json(request)
-        msg = await self.web_socket.receive_json()
+    def _active(self) -> bool:
+        return bool(self.client.data_streams.get(self.trade_id, None))
+
+    async def upstream_bitfinex(self, request=None, symbol=None, ch_type=str()):
+        if request:
+            await self.web_socket.send_json(request)
+        msg = await self.web_socket.receive_json(loads=json_codec.loads)
         if msg.get('event') == 'info':
             if msg.get('version') != 2:
                 logger.warning('Change WSS version detected')
@@ -80,42 +104,51 @@ class EventsDataStream:
     async def _handle_event(self, *args):
         pass  # meant to be overridden in a subclass
 
+    async def _receive(self, web_socket, name):
+        """
+        Receive and decode next frame, None if the stream was stopped
+        """
+        msg = await web_socket.receive()
+        # logger.debug(f"_receive: {name}, msg.type: {msg.type}")
+        if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+            if self._active():
+                raise aiohttp.ClientOSError(f"Reconnecting WSS for {name}")
+            logger.info(f"Event stream stopped for {name}")
+            return None
+        elif msg.type is aiohttp.WSMsgType.ERROR:
+            raise aiohttp.ClientOSError(f"For {name} something went wrong with the WSS, reconnecting")
+        return json_codec.loads(gzip.decompress(msg.data) if msg.type is aiohttp.WSMsgType.BINARY else msg.data)
+
+    async def _huobi_ping(self, msg_data) -> bool:
+        if msg_data.get('ping'):
+            await self.web_socket.send_json({"pong": msg_data.get('ping')})
+        elif msg_data.get('action') == 'ping':
+            pong = {
+                "action": "pong",
+                "data": {
+                      "ts": msg_data.get('data').get('ts')
+                }
+            }
+            await self.web_socket.send_json(pong)
+        else:
+            return False
+        return True
+
     async def _handle_messages(self, web_socket, symbol=None, ch_type=str()):
-        order_book = None
-        price = None
         while True:
-            msg = await web_socket.receive()
-            # logger.debug(f"_handle_messages: symbol: {symbol}, ch_type: {ch_type}, msg.type: {msg.type}")
-            if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
-                if self.client.data_streams.get(self.trade_id, None):
-                    raise aiohttp.ClientOSError(f"Reconnecting WSS for {symbol}:{ch_type}:{self.trade_id}")
-                else:
-                    logger.info(f"Event stream stopped for {symbol}:{ch_type}:{self.trade_id}")
-                    break
-            elif msg.type is aiohttp.WSMsgType.ERROR:
-                raise aiohttp.ClientOSError(f"For {symbol}:{ch_type} something went wrong with the WSS, reconnecting")
-            msg_data = json.loads(gzip.decompress(msg.data) if msg.type is aiohttp.WSMsgType.BINARY else msg.data)
+            msg_data = await self._receive(web_socket, f"{symbol}:{ch_type}:{self.trade_id}")
+            if msg_data is None:
+                break
             # logger.debug(f"_handle_messages: symbol: {symbol}, ch_type: {ch_type}, msg_data: {msg_data}")
             if self.exchange == 'binance':
                 await self._handle_event(msg_data)
             elif self.exchange == 'ftx':
-                if ch_type == 'orderbook' and msg_data.get('type') == 'partial':
-                    order_book = ftx.OrderBook(msg_data.get('data', {}), symbol)
-                elif msg_data.get('type') == 'update':
-                    if ch_type == 'ticker':
-                        _price = msg_data.get('data', {}).get('last', None)
-                        if price != _price:
-                            price = _price
-                            await self._handle_event(msg_data, symbol, ch_type, order_book)
-                    else:
-                        await self._handle_event(msg_data, symbol, ch_type, order_book)
+                if msg_data.get('type') == 'update':
+                    await self._handle_event(msg_data)
             elif self.exchange == 'bitfinex':
                 # info and error handling
                 if isinstance(msg_data, dict):
-                    if msg_data.get('event') == 'subscribed':
-                        chan_id = msg_data.get('chanId')
-                        logger.info(f"bitfinex, ch_type: {ch_type}, chan_id: {chan_id}")
-                    elif msg_data.get('event') == 'auth' and msg_data.get('status') == 'OK':
+                    if msg_data.get('event') == 'auth' and msg_data.get('status') == 'OK':
                         chan_id = msg_data.get('chanId')
                         logger.info(f"bitfinex, user stream chan_id: {chan_id}")
                     elif 'code' in msg_data:
@@ -139,22 +172,11 @@ class EventsDataStream:
                             raise aiohttp.ClientOSError
                 # data handling
                 elif 'hb' not in msg_data and isinstance(msg_data, list):
-                    if ch_type == 'book' and isinstance(msg_data[1][-1], list):
-                        order_book = bfx.OrderBook(msg_data[1], symbol)
-                    else:
-                        await self._handle_event(msg_data, symbol, ch_type, order_book)
+                    await self._handle_event(msg_data)
             elif self.exchange == 'huobi':
                 # print(f"_handle_messages: symbol: {symbol}, ch_type: {ch_type}, msg_data: {msg_data}")
-                if msg_data.get('ping'):
-                    await self.web_socket.send_json({"pong": msg_data.get('ping')})
-                elif msg_data.get('action') == 'ping':
-                    pong = {
-                        "action": "pong",
-                        "data": {
-                              "ts": msg_data.get('data').get('ts')
-                        }
-                    }
-                    await self.web_socket.send_json(pong)
+                if await self._huobi_ping(msg_data):
+                    pass
                 elif msg_data.get('action') == 'req' and msg_data.get('code') == 200 and msg_data.get('ch') == 'auth':
                     return
                 elif (msg_data.get('action') == 'sub' and
@@ -162,127 +184,405 @@ class EventsDataStream:
                       msg_data.get('message') == '系统异常:'):
                     raise aiohttp.ClientOSError(f"Reconnecting Huobi user {ch_type} WSS")
                 elif msg_data.get('tick') or msg_data.get('data'):
-                    if ch_type == 'ticker':
-                        _price = msg_data.get('tick', {}).get('lastPrice', None)
-                        if price != _price:
-                            price = _price
-                            await self._handle_event(msg_data, symbol, ch_type)
-                    else:
-                        await self._handle_event(msg_data, symbol, ch_type)
+                    await self._handle_event(msg_data)
                 else:
                     logger.debug(f"Huobi undefined WSS: symbol: {symbol}, ch_type: {ch_type}, msg_data: {msg_data}")
 
 
-class MarketEventsDataStream(EventsDataStream):
-
-    def __init__(self, client, endpoint, user_agent, exchange, trade_id, channel=None):
-        super().__init__(client, endpoint, user_agent, exchange, trade_id)
+class MarketChannel:
+    """
+    State of one market channel (symbol@type), several channels share one socket
+    """
+    def __init__(self, exchange, channel) -> None:
         self.channel = channel
+        self.symbol = channel.split('@')[0]
+        self.ch_type = channel.split('@')[1]
+        self.key = channel
+        self.request = {}
         self.candles_max_time = None
+        if exchange == 'binance':
+            if self.ch_type == 'depth5':
+                self.key = f"{self.symbol}@{BINANCE_DEPTH_STREAM}"
+        elif exchange == 'ftx':
+            if self.ch_type == 'miniTicker':
+                self.ch_type = 'ticker'
+            elif self.ch_type == 'depth5':
+                self.ch_type = 'orderbook'
+            self.request = {'channel': self.ch_type, 'market': self.symbol}
+            self.key = f"{self.ch_type}:{self.symbol}"
+        elif exchange == 'bitfinex':
+            if self.ch_type == 'miniTicker':
+                self.ch_type = 'ticker'
+                self.request = {'channel': self.ch_type, 'symbol': self.symbol}
+                self.key = f"{self.ch_type}:{self.symbol}"
+            elif 'kline_' in self.ch_type:
+                self.ch_type = self.ch_type.replace('kline_', 'candles_')
+                tf = self.ch_type.split('_')[1]
+                self.request = {'channel': 'candles', 'key': f"trade:{tf}:{self.symbol}"}
+                self.key = f"candles:trade:{tf}:{self.symbol}"
+            elif self.ch_type == 'depth5':
+                self.ch_type = 'book'
+                self.request = {'channel': self.ch_type, 'symbol': self.symbol, 'prec': 'P0', 'len': '100'}
+                self.key = f"{self.ch_type}:{self.symbol}"
+        elif exchange == 'huobi':
+            if self.ch_type == 'miniTicker':
+                self.ch_type = 'ticker'
+                self.key = f"market.{self.symbol}.{self.ch_type}"
+            elif 'kline_' in self.ch_type:
+                tf = self.ch_type.split('_')[1]
+                self.key = f"market.{self.symbol}.kline.{hbp.interval(tf)}"
+            elif self.ch_type == 'depth5':
+                self.key = f"market.{self.symbol}.depth.step0"
+        self.order_book = None
+        self.sync_task = None
+        self.price = None
+        self.chan_id = None
+        self.subscribed = False
+
+    def reset(self) -> None:
+        if self.sync_task:
+            self.sync_task.cancel()
+            self.sync_task = None
+        self.order_book = None
+        self.price = None
+        self.chan_id = None
+        self.subscribed = False
+
+
+class MarketEventsDataStream(EventsDataStream):
+    """
+    Socket that carries up to CHANNELS_LIMIT market channels, owned by MarketStreamsManager
+    """
+    def __init__(self, client, endpoint, user_agent, exchange, manager):
+        super().__init__(client, endpoint, user_agent, exchange, None)
+        self.manager = manager
+        self.channels = {}  # channel name: MarketChannel
+        self.routes = {}  # route key from exchange frame (FTX channel:market, Huobi topic): MarketChannel
+        self.chan_ids = {}  # Bitfinex chanId: MarketChannel
+        self.limit = CHANNELS_LIMIT.get(exchange, CHANNELS_LIMIT_DEFAULT)
+        self.stopped = False
+        # Binance pending SUBSCRIBE/UNSUBSCRIBE
+        self.pending_sub = set()
+        self.pending_unsub = set()
+        self.control_task = None
+        self.request_id = 0
+
+    def _active(self) -> bool:
+        return not self.stopped and bool(self.channels)
+
+    def has_room(self) -> bool:
+        return len(self.channels) < self.limit
+
+    def _connected(self) -> bool:
+        return self.web_socket is not None and not self.web_socket.closed
+
+    def _request(self, channel: MarketChannel, subscribe=True) -> {}:
+        request = {}
+        if self.exchange == 'binance':
+            pass
+        elif self.exchange == 'ftx':
+            request = dict({'op': 'subscribe' if subscribe else 'unsubscribe'}, **channel.request)
+        elif self.exchange == 'bitfinex':
+            if subscribe:
+                request = dict({'event': 'subscribe'}, **channel.request)
+            elif channel.chan_id is not None:
+                request = {'event': 'unsubscribe', 'chanId': channel.chan_id}
+        elif self.exchange == 'huobi':
+            request = {'sub' if subscribe else 'unsub': channel.key}
+        return request
+
+    async def _subscribe(self, channel: MarketChannel):
+        if not channel.subscribed:
+            channel.subscribed = True
+            if self.exchange == 'binance':
+                self._binance_control('SUBSCRIBE', channel.key)
+            else:
+                await self.web_socket.send_json(self._request(channel))
+
+    def _binance_control(self, method, stream):
+        self._binance_pending(method, stream)
+        if self.control_task is None:
+            self.control_task = asyncio.ensure_future(self._binance_control_sender())
+
+    def _binance_pending(self, method, stream):
+        pending, opposite = ((self.pending_sub, self.pending_unsub) if method == 'SUBSCRIBE'
+                             else (self.pending_unsub, self.pending_sub))
+        if stream in opposite:
+            # Not sent yet, cancel each other
+            opposite.discard(stream)
+        else:
+            pending.add(stream)
+
+    async def _binance_control_sender(self):
+        """
+        Send pending streams as batched SUBSCRIBE/UNSUBSCRIBE, no more than BINANCE_CONTROL_RATE messages per second.
+        Batch that was not sent is put back to pending, sent again while connected or restored on reconnect
+        """
+        try:
+            while (self.pending_sub or self.pending_unsub) and self._connected():
+                for method, pending in (('UNSUBSCRIBE', self.pending_unsub), ('SUBSCRIBE', self.pending_sub)):
+                    if pending:
+                        self.request_id += 1
+                        batch = list(pending)
+                        request = {'method': method, 'params': batch, 'id': self.request_id}
+                        pending.clear()
+                        logger.debug(f"Binance combined stream: {request}")
+                        try:
+                            await self.web_socket.send_json(request)
+                        except (aiohttp.ClientConnectionError, RuntimeError) as ex:
+                            logger.warning(f"Binance combined stream control message failed: {ex}, will be resent")
+                            for stream in batch:
+                                self._binance_pending(method, stream)
+                        await asyncio.sleep(1 / BINANCE_CONTROL_RATE)
+        finally:
+            self.control_task = None
+
+    async def _resubscribe(self, channel: MarketChannel):
+        channel.order_book = None
+        await self.web_socket.send_json(self._request(channel, subscribe=False))
+        await self.web_socket.send_json(self._request(channel))
+
+    async def add_channel(self, channel):
+        _channel = MarketChannel(self.exchange, channel)
+        self.channels[channel] = _channel
+        self.routes[_channel.key] = _channel
+        if self._connected():
+            await self._subscribe(_channel)
+
+    async def remove_channel(self, channel, unsubscribe=True):
+        _channel = self.channels.pop(channel, None)
+        if _channel:
+            self.routes.pop(_channel.key, None)
+            self.chan_ids.pop(_channel.chan_id, None)
+            # Before reset, it clears subscribed and Bitfinex chanId
+            request = None
+            if unsubscribe and _channel.subscribed and self._connected():
+                if self.exchange == 'binance':
+                    self._binance_control('UNSUBSCRIBE', _channel.key)
+                else:
+                    request = self._request(_channel, subscribe=False)
+            _channel.reset()
+            if request:
+                await self.web_socket.send_json(request)
 
     async def stop(self):
         """
         Stop market data stream
         """
-        logger.info(f"Market WSS stop for {self.exchange}:{self.trade_id}:{self.channel}")
+        logger.info(f"Market WSS stop for {self.exchange}")
+        self.stopped = True
+        for channel in self.channels.values():
+            channel.reset()
+        if self.control_task:
+            self.control_task.cancel()
         if self.web_socket:
             await self.web_socket.close()
 
     async def start_wss(self):
-        logger.info(f"Start market WSS {self.channel} for {self.exchange}")
-        registered_streams = self.client.events.registered_streams.get(self.exchange, {}).get(self.trade_id, set())
+        logger.info(f"Start market WSS for {self.exchange}: {', '.join(self.channels)}")
+        for channel in self.channels.values():
+            channel.reset()
+        self.chan_ids.clear()
         if self.exchange == 'binance':
-            combined_streams = "/".join(registered_streams)
+            self.pending_sub.clear()
+            self.pending_unsub.clear()
+            url_streams = list(self.channels.values())[:BINANCE_URL_STREAMS]
+            for channel in url_streams:
+                channel.subscribed = True
+            combined_streams = "/".join(channel.key for channel in url_streams)
             self.web_socket = await self.session.ws_connect(f"{self.endpoint}/stream?streams={combined_streams}",
                                                             proxy=self.client.proxy)
             logger.info(f"Combined events stream started: {combined_streams}")
+        elif self.exchange == 'ftx':
+            self.web_socket = await self.session.ws_connect(self.endpoint,
+                                                            receive_timeout=30,
+                                                            proxy=self.client.proxy)
+        elif self.exchange == 'bitfinex':
+            self.web_socket = await self.session.ws_connect(self.endpoint, heartbeat=15, proxy=self.client.proxy)
+        elif self.exchange == 'huobi':
+            self.web_socket = await self.session.ws_connect(self.endpoint,
+                                                            receive_timeout=20,
+                                                            proxy=self.client.proxy,
+                                                            autoping=False)
+        for channel in list(self.channels.values()):
+            await self._subscribe(channel)
+        if self.exchange == 'ftx':
+            _task = asyncio.ensure_future(self._heartbeat_ftx())
+            try:
+                await self._handle_messages(self.web_socket)
+            finally:
+                _task.cancel()
+        elif self.exchange == 'bitfinex':
+            await self.upstream_bitfinex()
+        else:
             await self._handle_messages(self.web_socket)
+
+    async def _bitfinex_event(self, msg_data):
+        channel = msg_data.get('channel')
+        if channel == 'candles':
+            channel = self.routes.get(f"candles:{msg_data.get('key')}")
         else:
-            symbol = self.channel.split('@')[0]
-            ch_type = self.channel.split('@')[1]
-            request = {}
-            if self.exchange == 'ftx':
-                self.web_socket = await self.session.ws_connect(self.endpoint,
-                                                                receive_timeout=30,
-                                                                proxy=self.client.proxy)
-                if ch_type == 'miniTicker':
-                    ch_type = 'ticker'
-                elif ch_type == 'depth5':
-                    ch_type = 'orderbook'
-                request = {'op': 'subscribe', 'channel': ch_type, 'market': symbol}
-                await self.web_socket.send_json(request)
-                _task = asyncio.ensure_future(self._heartbeat_ftx())
-                try:
-                    await self._handle_messages(self.web_socket, symbol=symbol, ch_type=ch_type)
-                finally:
-                    _task.cancel()
+            channel = self.routes.get(f"{channel}:{msg_data.get('symbol')}")
+        if msg_data.get('event') == 'subscribed':
+            if channel is None:
+                # Channel was removed before subscription confirmed
+                await self.web_socket.send_json({'event': 'unsubscribe', 'chanId': msg_data.get('chanId')})
+            else:
+                channel.chan_id = msg_data.get('chanId')
+                self.chan_ids[channel.chan_id] = channel
+                logger.info(f"bitfinex, ch_type: {channel.ch_type}, chan_id: {channel.chan_id}")
+        elif 'code' in msg_data:
+            code = msg_data.get('code')
+            if code == 10300:
+                raise aiohttp.ClientOSError('WSS Subscription failed (generic)')
+            elif code == 10301:
+                logger.error(f"WSS Already subscribed: {msg_data}")
+            elif code == 10302:
+                logger.error(f"WSS Unknown channel: {msg_data}")
+            elif code == 10305:
+                logger.warning('WSS Reached limit of open channels, move channels to other socket')
+                await self.manager.overflow(self, channel)
+            elif code == 20051:
+                raise aiohttp.ClientOSError('WSS reconnection request received from exchange')
+            elif code == 20060:
+                logger.info('WSS entering in maintenance mode, trying reconnect after 120s')
+                await asyncio.sleep(120)
+                raise aiohttp.ClientOSError
+
+    async def _handle_messages(self, web_socket, *args):
+        while True:
+            msg_data = await self._receive(web_socket, f"{self.exchange}:{', '.join(self.channels)}")
+            if msg_data is None:
+                break
+            if self.exchange == 'binance':
+                if 'id' in msg_data:
+                    # Reply to control message
+                    if msg_data.get('error'):
+                        logger.warning(f"Binance combined stream control message failed: {msg_data}")
+                else:
+                    # Skip streams what was released but still not unsubscribed
+                    channel = self.routes.get(msg_data.get('stream'))
+                    if channel is None:
+                        continue
+                    if channel.ch_type == 'depth5':
+                        await self._binance_depth(channel, msg_data.get('data'))
+                    else:
+                        await self._handle_event(msg_data)
+            elif self.exchange == 'ftx':
+                channel = self.routes.get(f"{msg_data.get('channel')}:{msg_data.get('market')}")
+                if channel is None:
+                    if msg_data.get('type') == 'error':
+                        logger.warning(f"FTX market WSS: {msg_data}")
+                elif channel.ch_type == 'orderbook' and msg_data.get('type') == 'partial':
+                    channel.order_book = ftx.OrderBook(msg_data.get('data', {}), channel.symbol)
+                elif msg_data.get('type') == 'update':
+                    if channel.ch_type == 'ticker':
+                        _price = msg_data.get('data', {}).get('last', None)
+                        if channel.price != _price:
+                            channel.price = _price
+                            await self._handle_event(msg_data, channel)
+                    else:
+                        await self._handle_event(msg_data, channel)
             elif self.exchange == 'bitfinex':
-                self.web_socket = await self.session.ws_connect(self.endpoint, heartbeat=15, proxy=self.client.proxy)
-                if ch_type == 'miniTicker':
-                    ch_type = 'ticker'
-                    request = {'event': 'subscribe', 'channel': ch_type, 'pair': symbol}
-                elif 'kline_' in ch_type:
-                    ch_type = ch_type.replace('kline_', 'candles_')
-                    tf = ch_type.split('_')[1]
-                    request = {'event': 'subscribe', 'channel': 'candles', 'key': f"trade:{tf}:{symbol}"}
-                elif ch_type == 'depth5':
-                    ch_type = 'book'
-                    request = {'event': 'subscribe', 'channel': ch_type, 'symbol': symbol, 'prec': 'P0', }
-                await self.upstream_bitfinex(request, symbol, ch_type)
+                if isinstance(msg_data, dict):
+                    await self._bitfinex_event(msg_data)
+                elif isinstance(msg_data, list) and 'hb' not in msg_data:
+                    channel = self.chan_ids.get(msg_data[0])
+                    if channel is None:
+                        continue
+                    if channel.ch_type == 'book' and isinstance(msg_data[1][-1], list):
+                        channel.order_book = bfx.OrderBook(msg_data[1], channel.symbol)
+                    else:
+                        await self._handle_event(msg_data, channel)
             elif self.exchange == 'huobi':
-                self.web_socket = await self.session.ws_connect(self.endpoint,
-                                                                receive_timeout=20,
-                                                                proxy=self.client.proxy,
-                                                                autoping=False)
-                if ch_type == 'miniTicker':
-                    ch_type = 'ticker'
-                    request = {'sub': f"market.{symbol}.{ch_type}"}
-                elif 'kline_' in ch_type:
-                    tf = ch_type.split('_')[1]
-                    request = {'sub': f"market.{symbol}.kline.{hbp.interval(tf)}"}
-                elif ch_type == 'depth5':
-                    request = {'sub': f"market.{symbol}.depth.step0"}
-                await self.web_socket.send_json(request)
-                await self._handle_messages(self.web_socket, symbol=symbol, ch_type=ch_type)
+                if await self._huobi_ping(msg_data):
+                    continue
+                channel = self.routes.get(msg_data.get('ch'))
+                if channel and msg_data.get('tick'):
+                    if channel.ch_type == 'ticker':
+                        _price = msg_data.get('tick', {}).get('lastPrice', None)
+                        if channel.price != _price:
+                            channel.price = _price
+                            await self._handle_event(msg_data, channel)
+                    else:
+                        if channel.ch_type == 'depth5' and channel.order_book is None:
+                            channel.order_book = hbp.OrderBook(channel.symbol)
+                        await self._handle_event(msg_data, channel)
+                elif msg_data.get('status') == 'error':
+                    logger.warning(f"Huobi market WSS: {msg_data}")
+                else:
+                    logger.debug(f"Huobi undefined WSS: msg_data: {msg_data}")
+
+    async def _binance_depth(self, channel: MarketChannel, event):
+        if channel.order_book is None:
+            channel.order_book = DiffOrderBook(channel.symbol)
+            channel.sync_task = asyncio.ensure_future(self._binance_book_sync(channel, channel.order_book))
+        if not channel.order_book.update_book(event):
+            logger.warning(f"For {channel.channel} diff depth stream gap, resync order book")
+            channel.sync_task = asyncio.ensure_future(self._binance_book_sync(channel, channel.order_book))
+        elif channel.order_book.synced:
+            await self._handle_event(channel.order_book.get_book())
+
+    async def _binance_book_sync(self, channel: MarketChannel, book: DiffOrderBook):
+        """
+        Load REST snapshot into the buffering book, repeat while snapshot is older than the stream
+        """
+        while channel.order_book is book:
+            try:
+                snapshot = await self.client.fetch_order_book(symbol=channel.symbol.upper(), limit=BINANCE_BOOK_LIMIT)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                logger.warning(f"For {channel.channel} order book snapshot failed: {ex}")
+                await asyncio.sleep(BINANCE_BOOK_RETRY)
+                continue
+            if channel.order_book is not book:
+                return
+            if book.reset(snapshot):
+                logger.info(f"For {channel.channel} order book synced, lastUpdateId: {book.last_update_id}")
+                await self._handle_event(book.get_book())
+                return
+            logger.info(f"For {channel.channel} order book snapshot is older than stream, refetch")
 
-    async def _handle_event(self, content, symbol=None, ch_type=str(), order_book=None):
-        # logger.info(f"MARKET_handle_event.content: symbol: {symbol}, ch_type: {ch_type}, content: {content}")
+    async def _handle_event(self, content, channel: MarketChannel = None):
+        # logger.info(f"MARKET_handle_event.content: channel: {channel.channel}, content: {content}")
         self.try_count = 0
         if self.exchange == 'bitfinex':
-            if 'candles' in ch_type:
+            if 'candles' in channel.ch_type:
                 if isinstance(content[1][-1], list):
                     bfx_data = content[1][-1]
                 else:
                     bfx_data = content[1]
-                if self.candles_max_time is None or bfx_data[0] >= self.candles_max_time:
-                    self.candles_max_time = bfx_data[0]
-                    content = bfx.candle(bfx_data, symbol, ch_type)
+                if channel.candles_max_time is None or bfx_data[0] >= channel.candles_max_time:
+                    channel.candles_max_time = bfx_data[0]
+                    content = bfx.candle(bfx_data, channel.symbol, channel.ch_type)
                 else:
                     return
-            elif ch_type == 'ticker':
-                content = bfx.ticker(content[1], symbol)
-            elif ch_type == 'book' and isinstance(order_book, bfx.OrderBook):
-                order_book.update_book(content[1])
-                content = order_book.get_book()
+            elif channel.ch_type == 'ticker':
+                content = bfx.ticker(content[1], channel.symbol)
+            elif channel.ch_type == 'book' and isinstance(channel.order_book, bfx.OrderBook):
+                channel.order_book.update_book(content[1])
+                content = channel.order_book.get_book()
         elif self.exchange == 'ftx':
-            if ch_type == 'orderbook' and isinstance(order_book, ftx.OrderBook):
-                if content['data']['checksum'] == order_book.update_book(content['data']):
-                    content = order_book.get_book()
+            if channel.ch_type == 'orderbook' and isinstance(channel.order_book, ftx.OrderBook):
+                if content['data']['checksum'] == channel.order_book.update_book(content['data']):
+                    content = channel.order_book.get_book()
                 else:
-                    logger.warning("For orderbook WSS lost the current state, restarting the stream")
-                    await asyncio.sleep(1)
-                    raise aiohttp.ClientOSError
-            elif ch_type == 'ticker':
-                content = ftx.stream_convert(content, symbol, ch_type)
+                    logger.warning(f"For {channel.channel} orderbook WSS lost the current state, resubscribe")
+                    await self._resubscribe(channel)
+                    return
+            elif channel.ch_type == 'ticker':
+                content = ftx.stream_convert(content, channel.symbol, channel.ch_type)
             else:
                 return
         elif self.exchange == 'huobi':
-            if ch_type == 'ticker':
-                content = hbp.ticker(content, symbol)
-            elif 'kline_' in ch_type:
-                content = hbp.candle(content, symbol, ch_type)
-            elif ch_type == 'depth5':
-                content = hbp.order_book_ws(content, symbol)
+            if channel.ch_type == 'ticker':
+                content = hbp.ticker(content, channel.symbol)
+            elif 'kline_' in channel.ch_type:
+                content = hbp.candle(content, channel.symbol, channel.ch_type)
+            elif channel.ch_type == 'depth5' and isinstance(channel.order_book, hbp.OrderBook):
+                channel.order_book.update_book(content)
+                content = channel.order_book.get_book()
             else:
                 return
         #
@@ -291,11 +591,90 @@ class MarketEventsDataStream(EventsDataStream):
             stream_name = content["stream"]
             content = content["data"]
             content["stream"] = stream_name
-            await self.client.events.wrap_event(content).fire()
+            await self._fire(content)
         elif isinstance(content, list):
             for event_content in content:
                 event_content["stream"] = stream_name
-                await self.client.events.wrap_event(event_content).fire()
+                await self._fire(event_content)
+
+    async def _fire(self, content):
+        event = self.client.events.wrap_event(content)
+        if isinstance(event, KlineWrapper):
+            self.client.kline_update(event)
+        await event.fire()
+
+
+class MarketStreamsManager:
+    """
+    Multiplex market channels over a small pool of sockets.
+    Each (exchange, symbol, channel) is subscribed and decoded once, fanned out to all trade_id handlers,
+    and is reference-counted by trade_id
+    """
+    def __init__(self, client, endpoint, user_agent, exchange):
+        self.client = client
+        self.endpoint = endpoint
+        self.user_agent = user_agent
+        self.exchange = exchange
+        self.channels = defaultdict(set)  # channel name: {trade_id}
+        self.streams = []
+        self.lock = asyncio.Lock()  # channels and streams are changed by one task at a time
+
+    async def subscribe(self, trade_id, channels):
+        async with self.lock:
+            for channel in channels:
+                if not self.channels.get(channel):
+                    await self._add(channel)
+                self.channels[channel].add(trade_id)
+
+    async def unsubscribe(self, trade_id):
+        async with self.lock:
+            for channel in [k for k, v in self.channels.items() if trade_id in v]:
+                self.channels[channel].discard(trade_id)
+                if not self.channels[channel]:
+                    del self.channels[channel]
+                    await self._remove(channel)
+
+    async def overflow(self, stream, channel: MarketChannel = None):
+        """
+        Channels limit for the socket reached, move channel(s) what are not confirmed to other socket
+        """
+        async with self.lock:
+            if stream not in self.streams:
+                return  # stopped or removed while waiting
+            channels = [channel] if channel else [i for i in stream.channels.values() if i.chan_id is None]
+            stream.limit = max(len(stream.channels) - len(channels), 1)
+            for _channel in channels:
+                await stream.remove_channel(_channel.channel, unsubscribe=False)
+                await self._add(_channel.channel)
+
+    async def stop(self):
+        async with self.lock:
+            self.channels.clear()
+            streams, self.streams = self.streams, []
+            for stream in streams:
+                await stream.stop()
+
+    async def _add(self, channel):
+        stream = next((i for i in self.streams if i.has_room()), None)
+        if stream is None:
+            stream = MarketEventsDataStream(self.client,
+                                            self.endpoint,
+                                            self.user_agent,
+                                            self.exchange,
+                                            manager=self)
+            self.streams.append(stream)
+            await stream.add_channel(channel)
+            asyncio.ensure_future(stream.start())
+        else:
+            await stream.add_channel(channel)
+
+    async def _remove(self, channel):
+        stream = next((i for i in self.streams if channel in i.channels), None)
+        if stream:
+            await stream.remove_channel(channel)
+            if not stream.channels:
+                self.streams.remove(stream)
+                await stream.stop()
 
 
 class HbpPrivateEventsDataStream(EventsDataStream):
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+exchanges_wrapper stop on import without config file in ~/.MartinBinance, tests run with
+temporary home directory and config from the template
+"""
+import atexit
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+_home = tempfile.mkdtemp(prefix='exch_srv_test_')
+os.environ['HOME'] = _home
+atexit.register(shutil.rmtree, _home, ignore_errors=True)
+_config_path = Path(_home, ".MartinBinance", "config")
+_config_path.mkdir(parents=True)
+Path(_home, ".MartinBinance", "exch_srv_log").mkdir()
+shutil.copy(Path(Path(__file__).parent.parent, "exchanges_wrapper", "exch_srv_cfg.toml.template"),
+            Path(_config_path, "exch_srv_cfg.toml"))
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Event wrappers: queued events keep values only, not the source dict
+"""
+import gc
+
+import pytest
+
+from exchanges_wrapper import events
+from exchanges_wrapper.c_structures import OrderTradesEvent
+
+KLINE = {'e': 'kline', 'E': 1660000000100, 's': 'BTCUSDT', 'stream': 'btcusdt@kline_1m',
+         'k': {'t': 1660000000000, 'T': 1660000059999, 's': 'BTCUSDT', 'i': '1m', 'f': 100, 'L': 200,
+               'o': '20000.0', 'c': '20001.0', 'h': '20002.0', 'l': '19999.0', 'v': '1.5', 'n': 100, 'x': False,
+               'q': '30000.0', 'V': '1.0', 'Q': '20000.0', 'B': '0'}}
+MINI_TICKER = {'e': '24hrMiniTicker', 'E': 1660000000100, 's': 'BTCUSDT', 'c': '20001.0', 'o': '20000.0',
+               'h': '20002.0', 'l': '19999.0', 'v': '1000.0', 'q': '20000000.0', 'stream': 'btcusdt@miniTicker'}
+ACCOUNT = {'e': 'outboundAccountPosition', 'E': 1660000000100, 'u': 1660000000000,
+           'B': [{'a': 'BTC', 'f': '1.0', 'l': '0.5'}, {'a': 'USDT', 'f': '100.0', 'l': '0.0'}]}
+TRADE = {'symbol': 'BTCUSDT', 'orderId': 1, 'qty': '0.1', 'price': '20000.0', 'commission': '0.01',
+         'commissionAsset': 'USDT', 'time': 1660000000000, 'id': 5, 'quoteQty': '2000.0', 'isBuyer': False}
+
+
+def holds(obj, source) -> bool:
+    return any(i is source or i is source.get('k') for i in gc.get_referents(obj))
+
+
+@pytest.mark.parametrize('event_data', (KLINE, MINI_TICKER, ACCOUNT), ids=('kline', 'miniTicker', 'account'))
+def test_queued_wrapper_release_source(event_data):
+    event = events.Events().wrap_event(event_data)
+    assert not holds(event, event_data) and not hasattr(event, '__dict__')
+
+
+def test_wrapper_fields():
+    kline = events.KlineWrapper(KLINE, None)
+    assert (kline.kline_interval, kline.kline_start_time, kline.kline_close_price) == ('1m', 1660000000000, '20001.0')
+    ticker = events.SymbolMiniTickerWrapper(MINI_TICKER, None)
+    assert (ticker.symbol, ticker.open_price, ticker.close_price) == ('BTCUSDT', '20000.0', '20001.0')
+    account = events.OutboundAccountPositionWrapper(ACCOUNT, None)
+    assert account.balances == {'BTC': {'free': '1.0', 'locked': '0.5'}, 'USDT': {'free': '100.0', 'locked': '0.0'}}
+    trade = OrderTradesEvent(TRADE)
+    assert (trade.side, trade.last_executed_price, trade.order_status) == ('SELL', '20000.0', 'PARTIALLY_FILLED')
+    assert not holds(trade, TRADE)
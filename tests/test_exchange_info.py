@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Exchange info cache: background refresh after TTL reach running Client
+"""
+import asyncio
+import time
+
+from exchanges_wrapper import exchange_info
+from exchanges_wrapper.client import Client
+
+ENDPOINT = 'https://exchange-info.test'
+
+
+def symbol(name, tick_size) -> {}:
+    return {'symbol': name, 'status': 'TRADING', 'baseAsset': name[:3], 'quoteAsset': name[3:],
+            'baseAssetPrecision': 8, 'quoteAssetPrecision': 8,
+            'filters': [{'filterType': 'PRICE_FILTER', 'minPrice': tick_size, 'maxPrice': '100000.0',
+                         'tickSize': tick_size}]}
+
+
+def info(*symbols) -> {}:
+    return {'serverTime': 1, 'rateLimits': [], 'symbols': list(symbols)}
+
+
+async def refresh():
+    client = Client('binance', None, 'key', 'secret', ENDPOINT, ENDPOINT, ENDPOINT, ENDPOINT)
+    responses = [info(symbol('BTCUSDT', '0.01')), info(symbol('BTCUSDT', '0.1'), symbol('ETHUSDT', '0.01'))]
+
+    async def fetch_exchange_info():
+        return responses.pop(0)
+
+    client.fetch_exchange_info = fetch_exchange_info
+    try:
+        await client.load()
+        assert client.get_symbol_info('BTCUSDT')['filters']['PRICE_FILTER']['tickSize'] == '0.01'
+        assert client.get_symbol_info('ETHUSDT') is None
+        assert client.refine_price('BTCUSDT', '20000.123') == '20000.12'
+
+        client.exchange_info.updated = time.monotonic() - exchange_info.TTL - 1
+        await client.exchange_info.get(client.fetch_exchange_info)
+        await client.exchange_info.refresh_task
+        assert client.exchange_info.version == 2
+        assert client.get_symbol_info('BTCUSDT')['filters']['PRICE_FILTER']['tickSize'] == '0.1'
+        assert client.get_symbol_info('ETHUSDT') is not None
+        client.assert_symbol_exists('ETHUSDT')
+        assert client.refine_price('BTCUSDT', '20000.123') == '20000.1'
+    finally:
+        await client.close()
+        exchange_info.exchange_infos.pop(('binance', ENDPOINT), None)
+
+
+def test_refresh_reach_client():
+    asyncio.run(refresh())
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+FetchOrder with filled_update_call: order update queue overflow stop the stream, the response is still returned
+"""
+import asyncio
+import logging
+
+from exchanges_wrapper import api_pb2, exch_srv
+from exchanges_wrapper.exch_srv import Martin, OpenClient
+from exchanges_wrapper.stream_queue import LosslessQueue
+
+exch_srv.logger = logging.getLogger('exch_srv_logger')  # set in exch_srv __main__
+
+ACCOUNT = 'Demo - Binance'
+ORDER = {'symbol': 'BTCUSDT', 'orderId': 12345, 'orderListId': -1, 'clientOrderId': 'c1', 'price': '20000.0',
+         'origQty': '0.1', 'executedQty': '0.1', 'cummulativeQuoteQty': '2000.0', 'status': 'FILLED',
+         'timeInForce': 'GTC', 'type': 'LIMIT', 'side': 'BUY', 'stopPrice': '0.0', 'icebergQty': '0.0',
+         'time': 1660000000000, 'updateTime': 1660000001000, 'isWorking': True, 'origQuoteOrderQty': '0.0'}
+
+
+class Context:
+    async def abort(self, code, details):
+        raise AssertionError(f"{code}: {details}")
+
+
+async def fetch_order(queue_size) -> (api_pb2.FetchOrderResponse, LosslessQueue, []):
+    open_client = OpenClient(ACCOUNT)
+    client_id = open_client.register()
+    client = open_client.client
+    stopped = []
+
+    async def fetch(**_kwargs):
+        return dict(ORDER)
+
+    async def stop_events_listener(trade_id):
+        stopped.append(trade_id)
+
+    client.fetch_order = fetch
+    client.stop_events_listener = stop_events_listener
+    _queue = LosslessQueue(queue_size)
+    open_client.on_order_update_queues['t1'] = _queue
+    try:
+        response = await Martin().FetchOrder(api_pb2.FetchOrderRequest(
+            client_id=client_id, trade_id='t1', symbol='BTCUSDT', order_id=12345, filled_update_call=True), Context())
+        await asyncio.sleep(0)  # stop_stream scheduled on overflow
+        return response, _queue, stopped
+    finally:
+        OpenClient.clients.pop(client_id, None)
+        OpenClient.ids.pop(ACCOUNT, None)
+        await client.close()
+
+
+def test_fetch_order_queued():
+    response, _queue, stopped = asyncio.run(fetch_order(1))
+    assert response.orderId == 12345 and response.status == 'FILLED'
+    assert _queue.qsize() == 1 and _queue.get_nowait().order_status == 'FILLED'
+    assert not stopped
+
+
+def test_fetch_order_queue_full():
+    response, _queue, stopped = asyncio.run(fetch_order(0))
+    assert response.orderId == 12345 and response.status == 'FILLED'
+    assert _queue.qsize() == 0 and _queue.stats.dropped == 1
+    assert stopped == ['t1']
@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+FetchOrderBook: depth is rounded up to the exchange limit and cut back, typed levels only if typed is set
+"""
+import asyncio
+import json
+import logging
+
+import grpc
+
+from exchanges_wrapper import api_pb2, exch_srv
+from exchanges_wrapper.exch_srv import Martin, OpenClient
+
+exch_srv.logger = logging.getLogger('exch_srv_logger')  # set in exch_srv __main__
+
+ACCOUNT = 'Demo - Binance'
+BOOK = {'lastUpdateId': 100,
+        'bids': [[f"{20000 - i}.0", '1.0'] for i in range(20)],
+        'asks': [[f"{20001 + i}.0", '1.0'] for i in range(20)]}
+
+
+class Context:
+    code = None
+
+    async def abort(self, code, details):
+        raise AssertionError(f"{code}: {details}")
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, _details):
+        pass
+
+
+async def fetch_order_book(request, book=None) -> (api_pb2.FetchOrderBookResponse, [], Context):
+    open_client = OpenClient(ACCOUNT)
+    client_id = open_client.register()
+    client = open_client.client
+    limits = []
+
+    async def fetch(symbol, limit):
+        limits.append(limit)
+        return json.loads(json.dumps(BOOK if book is None else book))
+
+    client.fetch_order_book = fetch
+    context = Context()
+    request.client_id = client_id
+    try:
+        return await Martin().FetchOrderBook(request, context), limits, context
+    finally:
+        OpenClient.clients.pop(client_id, None)
+        OpenClient.ids.pop(ACCOUNT, None)
+        await client.close()
+
+
+def test_legacy_with_depth():
+    response, limits, _ = asyncio.run(fetch_order_book(api_pb2.MarketRequest(symbol='BTCUSDT', depth=7)))
+    assert limits == [10]
+    assert [json.loads(i) for i in response.bids] == BOOK['bids'][:7]
+    assert [json.loads(i) for i in response.asks] == BOOK['asks'][:7]
+    assert not response.bid_levels and not response.snapshot
+
+
+def test_typed():
+    response, limits, _ = asyncio.run(fetch_order_book(api_pb2.MarketRequest(symbol='BTCUSDT', depth=3, typed=True)))
+    assert limits == [5]
+    assert [(i.price, i.quantity) for i in response.bid_levels] == [tuple(i) for i in BOOK['bids'][:3]]
+    assert len(response.ask_levels) == 3 and response.snapshot
+    assert not response.bids and not response.asks
+
+
+def test_empty_book():
+    _, _, context = asyncio.run(fetch_order_book(api_pb2.MarketRequest(symbol='BTCUSDT'), book={}))
+    assert context.code == grpc.StatusCode.UNAVAILABLE
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+FTX order book checksum from cached level strings equals the one built from the full sorted book:
+https://docs.ftx.com/#orderbooks
+"""
+import random
+import zlib
+
+from exchanges_wrapper import ftx_parser as ftx
+
+
+def reference_checksum(bids: {}, asks: {}) -> int:
+    """
+    Best 100 levels of each side interleaved as bid_price:bid_qty:ask_price:ask_qty
+    """
+    bids = sorted(bids.items(), reverse=True)[:100]
+    asks = sorted(asks.items())[:100]
+    parts = []
+    for i in range(max(len(bids), len(asks))):
+        if i < len(bids):
+            parts.append(f"{bids[i][0]}:{bids[i][1]}")
+        if i < len(asks):
+            parts.append(f"{asks[i][0]}:{asks[i][1]}")
+    return zlib.crc32(':'.join(parts).encode('utf8'))
+
+
+def replay(levels, updates, seed) -> None:
+    rnd = random.Random(seed)
+    bids = {20000.0 - 0.5 * i: round(rnd.uniform(0.001, 5), 4) for i in range(1, levels + 1)}
+    asks = {20000.0 + 0.5 * i: round(rnd.uniform(0.001, 5), 4) for i in range(1, levels + 1)}
+    book = ftx.OrderBook({'time': 1.0, 'bids': [[p, q] for p, q in bids.items()],
+                          'asks': [[p, q] for p, q in asks.items()]}, 'BTC/USD')
+    assert book.checksum() == reference_checksum(bids, asks)
+    for i in range(updates):
+        update = {'time': 2.0 + i, 'bids': [], 'asks': []}
+        for _ in range(rnd.randint(1, 4)):
+            side, key, sign = (bids, 'bids', -1) if rnd.random() < 0.5 else (asks, 'asks', 1)
+            # Mostly near the top, sometimes deep out of the checksum levels
+            price = 20000.0 + sign * 0.5 * rnd.choice((rnd.randint(1, 10), rnd.randint(1, levels + 20)))
+            if price in side and rnd.random() < 0.4:
+                del side[price]
+                update[key].append([price, 0.0])
+            else:
+                side[price] = round(rnd.uniform(0.001, 5), 4)
+                update[key].append([price, side[price]])
+        assert book.update_book(update) == reference_checksum(bids, asks), i
+
+
+def test_checksum_shallow_book():
+    replay(30, 2000, seed=1)
+
+
+def test_checksum_deep_book():
+    replay(300, 2000, seed=2)
+
+
+def test_checksum_side_emptied():
+    book = ftx.OrderBook({'time': 1.0, 'bids': [[100.0, 1.0]], 'asks': [[101.0, 2.0], [102.0, 3.0]]}, 'BTC/USD')
+    res = book.update_book({'time': 2.0, 'bids': [[100.0, 0.0]], 'asks': []})
+    assert res == reference_checksum({}, {101.0: 2.0, 102.0: 3.0})
+    assert book.get_book()['data']['bids'] == []
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Binance combined stream control: SUBSCRIBE/UNSUBSCRIBE batch is not lost if send failed
+"""
+import asyncio
+from types import SimpleNamespace
+
+from exchanges_wrapper.web_sockets import MarketEventsDataStream
+
+
+class WebSocket:
+    closed = False
+
+    def __init__(self, fails):
+        self.fails = fails
+        self.sent = []
+
+    async def send_json(self, request):
+        if self.fails:
+            self.fails -= 1
+            raise RuntimeError('send failed')
+        self.sent.append(request)
+
+
+async def control(fails, unsubscribe_in_flight=False) -> (WebSocket, MarketEventsDataStream):
+    stream = MarketEventsDataStream(SimpleNamespace(ws_session=None, proxy=None), 'wss://localhost', None,
+                                    'binance', None)
+    stream.web_socket = WebSocket(fails)
+    await stream.add_channel('btcusdt@miniTicker')
+    await stream.add_channel('ethusdt@miniTicker')
+    if unsubscribe_in_flight:
+        await asyncio.sleep(0)  # the batch is taken by the sender
+        await stream.remove_channel('btcusdt@miniTicker')
+    await asyncio.wait_for(stream.control_task, 5)
+    return stream.web_socket, stream
+
+
+def test_batch_sent():
+    web_socket, stream = asyncio.run(control(0))
+    assert [(i['method'], sorted(i['params'])) for i in web_socket.sent] == [
+        ('SUBSCRIBE', ['btcusdt@miniTicker', 'ethusdt@miniTicker'])]
+    assert not stream.pending_sub and stream.control_task is None
+
+
+def test_batch_resent_after_failure():
+    web_socket, stream = asyncio.run(control(1))
+    assert [(i['method'], sorted(i['params'])) for i in web_socket.sent] == [
+        ('SUBSCRIBE', ['btcusdt@miniTicker', 'ethusdt@miniTicker'])]
+    assert not stream.pending_sub and not stream.pending_unsub
+
+
+def test_failed_batch_cancel_unsubscribe():
+    web_socket, stream = asyncio.run(control(1, unsubscribe_in_flight=True))
+    assert [(i['method'], i['params']) for i in web_socket.sent] == [('SUBSCRIBE', ['ethusdt@miniTicker'])]
+    assert not stream.pending_sub and not stream.pending_unsub
+
+
+async def unsubscribe() -> WebSocket:
+    web_socket, stream = await control(0)
+    await stream.remove_channel('btcusdt@miniTicker')
+    await asyncio.wait_for(stream.control_task, 5)
+    return web_socket
+
+
+def test_unsubscribe_sent():
+    web_socket = asyncio.run(unsubscribe())
+    assert [(i['method'], i['params']) for i in web_socket.sent][-1] == ('UNSUBSCRIBE', ['btcusdt@miniTicker'])
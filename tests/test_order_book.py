@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Binance local order book from diff depth stream: U/u sequence rules, gap detection and resync
+"""
+from exchanges_wrapper import huobi_parser as hbp
+from exchanges_wrapper.order_book import BookSide, DiffOrderBook
+
+
+def diff(first, last, bids=(), asks=()) -> {}:
+    return {'e': 'depthUpdate', 's': 'BTCUSDT', 'U': first, 'u': last, 'b': list(bids), 'a': list(asks)}
+
+
+def snapshot(last_update_id, bids=(('100.0', '1.0'), ('99.0', '2.0')), asks=(('101.0', '1.0'), ('102.0', '2.0'))):
+    return {'lastUpdateId': last_update_id, 'bids': list(bids), 'asks': list(asks)}
+
+
+def test_book_side_order():
+    bids = BookSide(reverse=True)
+    asks = BookSide()
+    for price in ('99.5', '100.25', '9.75', '100'):
+        bids.set(price, '1')
+        asks.set(price, '1')
+    assert [i[0] for i in bids.top(3)] == ['100.25', '100', '99.5']
+    assert [i[0] for i in asks.top(3)] == ['9.75', '99.5', '100']
+    bids.remove('100.25')
+    assert bids.top(1) == [('100', '1')]
+    assert bids.in_top(99.6, 2) and not bids.in_top(9.8, 2)
+
+
+def test_buffered_events_applied_after_snapshot():
+    book = DiffOrderBook('btcusdt')
+    book.update_book(diff(90, 100, bids=[('100.0', '5.0')]))  # older than snapshot, dropped
+    book.update_book(diff(101, 105, bids=[('100.0', '0.0'), ('98.0', '3.0')]))
+    book.update_book(diff(106, 110, asks=[('100.5', '1.5')]))
+    assert not book.synced
+    assert book.reset(snapshot(103))
+    assert book.synced and book.last_update_id == 110
+    assert book.bids.top(5) == [('99.0', '2.0'), ('98.0', '3.0')]
+    assert book.asks.top(1) == [('100.5', '1.5')]
+
+
+def test_snapshot_older_than_stream_keeps_events():
+    book = DiffOrderBook('btcusdt')
+    book.update_book(diff(201, 210, bids=[('98.0', '3.0')]))
+    book.update_book(diff(211, 220))
+    assert not book.reset(snapshot(150))
+    assert not book.synced
+    assert [i['U'] for i in book.buffer] == [201, 211]
+    assert book.reset(snapshot(205))
+    assert book.last_update_id == 220
+    assert ('98.0', '3.0') in book.bids.top(5)
+
+
+def test_gap_in_buffer_keeps_unapplied_tail():
+    book = DiffOrderBook('btcusdt')
+    for first in (101, 111, 131, 141):
+        book.update_book(diff(first, first + 9, asks=[(f"{first}.0", '1.0')]))
+    assert not book.reset(snapshot(105))
+    assert not book.synced
+    assert book.last_update_id == 120
+    assert [i['U'] for i in book.buffer] == [131, 141]
+    # Events received while the snapshot is refetched are buffered after the tail
+    book.update_book(diff(151, 160))
+    assert [i['U'] for i in book.buffer] == [131, 141, 151]
+    assert book.reset(snapshot(140))
+    assert book.synced and book.last_update_id == 160
+    assert ('141.0', '1.0') in book.asks.top(5)
+
+
+def test_gap_in_stream():
+    book = DiffOrderBook('btcusdt')
+    assert book.reset(snapshot(100))
+    assert book.update_book(diff(101, 102, bids=[('99.0', '0')]))
+    assert book.bids.top(5) == [('100.0', '1.0')]
+    assert book.update_book(diff(95, 102))  # already applied
+    assert not book.update_book(diff(104, 105))
+    assert not book.synced
+    assert book.update_book(diff(106, 107))  # buffered until resync
+    assert [i['U'] for i in book.buffer] == [104, 106]
+
+
+def test_get_book_depth():
+    book = DiffOrderBook('btcusdt')
+    book.reset(snapshot(1, bids=[(f"{100 - i}.0", '1') for i in range(20)]))
+    data = book.get_book(depth=5)['data']
+    assert len(data['bids']) == 5 and data['bids'][0][0] == '100.0'
+    assert data['lastUpdateId'] == 1
+
+
+def test_huobi_snapshot_book():
+    book = hbp.OrderBook('btcusdt')
+    frame = {'ch': 'market.btcusdt.depth.step0', 'ts': 1,
+             'tick': {'bids': [[100.5, 1.0], [100.0, 2.0], [99.5, 3.0]], 'asks': [[101.0, 1.5], [101.5, 2.5]]}}
+    book.update_book(frame)
+    data = book.get_book(depth=2)['data']
+    assert data['bids'] == [[100.5, 1.0], [100.0, 2.0]] and data['lastUpdateId'] == 1
+    assert data['book'].bids.top(5) == [('100.5', '1.0'), ('100.0', '2.0'), ('99.5', '3.0')]
+    assert data['book'].asks.top(1) == [('101.0', '1.5')]
+    assert book.bids.in_top(100.2, 2) and not book.bids.in_top(99.7, 2)
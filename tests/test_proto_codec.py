@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+proto_codec converters give the same messages as json_format.ParseDict
+"""
+import random
+
+import pytest
+from google.protobuf import json_format
+from google.protobuf.descriptor import FieldDescriptor
+
+from exchanges_wrapper import api_pb2
+from exchanges_wrapper.proto_codec import get_converter, _repeated
+
+MESSAGES = [
+    api_pb2.FetchOpenOrdersResponse.Order,
+    api_pb2.FetchOrderResponse,
+    api_pb2.CancelOrderResponse,
+    api_pb2.CreateLimitOrderResponse,
+    api_pb2.AccountTradeListResponse.Trade,
+    api_pb2.CancelAllOrdersResponse.CancelOrder,
+    api_pb2.FetchSymbolPriceTickerResponse,
+    api_pb2.FetchTickerPriceChangeStatisticsResponse,
+    api_pb2.FetchAccountBalanceResponse.Balances,
+    api_pb2.FetchFundingWalletResponse.Balances,
+    api_pb2.FetchExchangeInfoSymbolResponse,
+]
+_INT_TYPES = (FieldDescriptor.CPPTYPE_INT32, FieldDescriptor.CPPTYPE_INT64,
+              FieldDescriptor.CPPTYPE_UINT32, FieldDescriptor.CPPTYPE_UINT64)
+
+
+def binance_order(i=0) -> {}:
+    return {'symbol': 'BTCUSDT', 'orderId': 1000 + i, 'orderListId': -1, 'clientOrderId': f"c{i}",
+            'price': '10000.01000000', 'origQty': '0.01000000', 'executedQty': '0.00000000',
+            'cummulativeQuoteQty': '0.00000000', 'status': 'NEW', 'timeInForce': 'GTC', 'type': 'LIMIT',
+            'side': 'BUY', 'stopPrice': '0.00000000', 'icebergQty': '0.00000000', 'time': 1600000000000 + i,
+            'updateTime': 1600000000000 + i, 'isWorking': True, 'origQuoteOrderQty': '0.00000000'}
+
+
+def random_value(field, rnd):
+    if field.cpp_type == FieldDescriptor.CPPTYPE_STRING:
+        return f"{rnd.random():.8f}"
+    if field.cpp_type == FieldDescriptor.CPPTYPE_BOOL:
+        return rnd.random() < 0.5
+    if field.cpp_type in _INT_TYPES:
+        value = rnd.randint(0, 10 ** 6)
+        return str(value) if rnd.random() < 0.3 else value
+    if field.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
+        return random_dict(field.message_type, rnd)
+    return rnd.random()
+
+
+def random_dict(descriptor, rnd) -> {}:
+    """
+    Field name or json name as key, some fields absent or None, int as str
+    """
+    res = {}
+    for field in descriptor.fields:
+        case = rnd.random()
+        if case < 0.15:
+            continue
+        key = field.json_name if rnd.random() < 0.5 else field.name
+        if case < 0.25:
+            res[key] = None
+        elif _repeated(field):
+            res[key] = [random_value(field, rnd), random_value(field, rnd)]
+        else:
+            res[key] = random_value(field, rnd)
+    return res
+
+
+@pytest.mark.parametrize('message_class', MESSAGES, ids=lambda i: i.DESCRIPTOR.full_name)
+def test_random_dicts_equal_parse_dict(message_class):
+    rnd = random.Random(message_class.DESCRIPTOR.full_name)
+    converter = get_converter(message_class)
+    for _ in range(500):
+        data = random_dict(message_class.DESCRIPTOR, rnd)
+        assert converter(data) == json_format.ParseDict(data, message_class()), data
+
+
+def test_open_orders_extend():
+    orders = [binance_order(i) for i in range(50)]
+    expected = api_pb2.FetchOpenOrdersResponse()
+    for order in orders:
+        expected.items.append(json_format.ParseDict(order, api_pb2.FetchOpenOrdersResponse.Order()))
+    response = api_pb2.FetchOpenOrdersResponse()
+    get_converter(api_pb2.FetchOpenOrdersResponse.Order).extend(response.items, orders)
+    assert response.SerializeToString() == expected.SerializeToString()
+
+
+def test_merge_into_nested():
+    converter = get_converter(api_pb2.CreateLimitOrderResponse)
+    order = {k: v for k, v in binance_order().items() if k in converter.fields}
+    response = api_pb2.CreateLimitOrdersResponse()
+    item = response.items.add()
+    converter.merge(item.order, order)
+    assert item.order == json_format.ParseDict(order, api_pb2.CreateLimitOrderResponse())
+
+
+def test_exchange_info_symbol_filters():
+    symbol = {'symbol': 'BTCUSDT', 'status': 'TRADING', 'baseAsset': 'BTC', 'baseAssetPrecision': 8,
+              'quoteAsset': 'USDT', 'quotePrecision': 8, 'orderTypes': ['LIMIT', 'MARKET'],
+              'icebergAllowed': True, 'ocoAllowed': True, 'isSpotTradingAllowed': True,
+              'filters': {'price_filter': {'filterType': 'PRICE_FILTER', 'minPrice': '0.01000000',
+                                           'maxPrice': '1000000.00000000', 'tickSize': '0.01000000'},
+                          'lot_size': {'filterType': 'LOT_SIZE', 'minQty': '0.00001000',
+                                       'maxQty': '9000.00000000', 'stepSize': '0.00001000'}}}
+    response = get_converter(api_pb2.FetchExchangeInfoSymbolResponse)(symbol)
+    assert response == json_format.ParseDict(symbol, api_pb2.FetchExchangeInfoSymbolResponse())
+    assert response.filters.price_filter.tickSize == '0.01000000'
+
+
+def test_unknown_keys_skipped():
+    data = dict(binance_order(), unknownField='x')
+    message = get_converter(api_pb2.FetchOrderResponse)(data)
+    assert message == json_format.ParseDict(data, api_pb2.FetchOrderResponse(), ignore_unknown_fields=True)
@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Quantizer: exact rounding down to tick/step and precision, batch equal to value by value
+"""
+import random
+from decimal import Decimal, ROUND_DOWN, localcontext
+
+import pytest
+
+from exchanges_wrapper.quantizer import Quantizer, SymbolQuantizer
+
+
+@pytest.mark.parametrize('step, precision, value, expected', (
+    ('0.01', 8, '20000.129', '20000.12'),
+    ('0.01', 8, '20000.1', '20000.1'),
+    ('0.5', 8, '19999.99', '19999.5'),
+    ('0.00001', 8, '0.123456789', '0.12345'),
+    ('1', 8, '17.9', '17'),
+    ('10', 2, '1234.5', '1230'),
+    (None, 2, '1.239', '1.23'),
+    (None, 0, '7.99', '7'),
+    ('0.01', 8, '1E+1', '10'),
+    ('0.001', 8, Decimal('0.0025'), '0.002'),
+    ('0.1', 8, 3.14159, '3.1'),
+))
+def test_quantize(step, precision, value, expected):
+    assert Quantizer(step, precision)(value) == expected
+
+
+def test_many_equal_to_decimal():
+    rnd = random.Random(1)
+    for step in ('0.01', '0.00001', '0.5', '1', '0.00000001'):
+        quantizer = Quantizer(step, 8)
+        values = [f"{rnd.uniform(0, 30000):.8f}" for _ in range(500)]
+        with localcontext() as context:
+            context.prec = 28  # Client.load set it by exchange info
+            expected = [Decimal(v) - Decimal(v) % Decimal(step) for v in values]
+            expected = [i.quantize(Decimal('1e-8'), rounding=ROUND_DOWN) for i in expected]
+        assert quantizer.many(values) == [quantizer(v) for v in values]
+        assert [Decimal(i) for i in quantizer.many(values)] == expected
+
+
+def test_symbol_quantizer():
+    quantizer = SymbolQuantizer({'baseAssetPrecision': 8, 'filters': {'PRICE_FILTER': {'tickSize': '0.01'},
+                                                                      'LOT_SIZE': {'stepSize': '0.0001'}}})
+    assert quantizer.price('20000.129') == '20000.12'
+    assert quantizer.amount.many(['0.12345', '1']) == ['0.1234', '1']
+    assert quantizer.quote('1.123456789') == '1.12345678'
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+REST rate limiter: buckets only from Binance rateLimits, other exchanges pause after 429 only
+"""
+import asyncio
+import time
+
+from exchanges_wrapper import rate_limiter
+from exchanges_wrapper.http_client import HttpClient
+
+BINANCE_LIMITS = [
+    {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 1200},
+    {"rateLimitType": "ORDERS", "interval": "SECOND", "intervalNum": 10, "limit": 50},
+]
+PLACEHOLDER_LIMITS = [{"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 90}]
+
+
+def http_client(exchange, proxy) -> HttpClient:
+    return HttpClient('key', 'secret', 'https://localhost', None, proxy, None, exchange, None)
+
+
+def test_binance_buckets():
+    http = http_client('binance', 'test-binance')
+    http.set_rate_limits(BINANCE_LIMITS)
+    assert [b.header for b in http.ip_limiter.buckets] == ['X-MBX-USED-WEIGHT-1M']
+    assert [b.header for b in http.account_limiter.buckets] == ['X-MBX-ORDER-COUNT-10S']
+
+
+def test_other_exchanges_not_throttled():
+    for exchange in ('ftx', 'bitfinex', 'huobi'):
+        http = http_client(exchange, f"test-{exchange}")
+        http.set_rate_limits(PLACEHOLDER_LIMITS)
+        assert not http.ip_limiter.buckets and not http.account_limiter.buckets
+        limiters = (http.account_limiter, http.ip_limiter)
+
+        async def burst():
+            for _ in range(1000):
+                await rate_limiter.acquire(limiters, *rate_limiter.request_cost(exchange, 'v2/ticker', 'GET'))
+
+        asyncio.run(asyncio.wait_for(burst(), 1))
+
+
+def test_path_pause():
+    http = http_client('bitfinex', 'test-pause')
+    http.ip_limiter.pause(30, 'v2/ticker')
+    assert http.ip_limiter.delay(1, 0, time.monotonic(), 'v2/ticker') > rate_limiter.MAX_WAIT
+    assert http.ip_limiter.delay(1, 0, time.monotonic(), 'v2/book') <= 0
@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+StartStream / StopStream are event driven: start returns as soon as the streams are registered,
+the first market event reaches the gRPC stream without HEARTBEAT polling delay
+"""
+import asyncio
+import logging
+import time
+
+from exchanges_wrapper import api_pb2, exch_srv
+from exchanges_wrapper.exch_srv import HEARTBEAT, Martin, OpenClient
+
+exch_srv.logger = logging.getLogger('exch_srv_logger')  # set in exch_srv __main__
+
+ACCOUNT = 'Demo - Binance'
+LATENCY_LIMIT = HEARTBEAT / 10  # sec, polling loop took up to HEARTBEAT
+
+
+def ticker(close_price) -> {}:
+    # Combined stream frame data with stream name, as MarketEventsDataStream fire it
+    return {'stream': 'btcusdt@miniTicker', 'e': '24hrMiniTicker', 'E': 1660000000000, 's': 'BTCUSDT',
+            'c': close_price, 'o': '20000.0', 'h': '20002.0', 'l': '0.5', 'v': '100.0', 'q': '2000000.0'}
+
+
+class Context:
+    async def abort(self, code, details):
+        raise AssertionError(f"{code}: {details}")
+
+
+async def start_to_first_event() -> (float, float, float):
+    open_client = OpenClient(ACCOUNT)
+    client_id = open_client.register()
+    client = open_client.client
+    started = []
+
+    async def listener(*args):
+        started.append(args)
+
+    # No exchange connection, the events are fired below
+    client.start_market_events_listener = listener
+    client.start_user_events_listener = listener
+    martin = Martin()
+    request = api_pb2.MarketRequest(client_id=client_id, trade_id='t1', symbol='BTCUSDT')
+    try:
+        t0 = time.perf_counter()
+        start = asyncio.ensure_future(martin.StartStream(
+            api_pb2.StartStreamRequest(client_id=client_id, trade_id='t1', market_stream_count=1), Context()))
+        await asyncio.sleep(0.05)  # StartStream waits for the stream registration
+        assert not start.done()
+        stream = martin.OnTickerUpdate(request, Context())
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.wait_for(start, 1)
+        t_started = time.perf_counter() - t0 - 0.05
+        await asyncio.sleep(0)
+        t1 = time.perf_counter()
+        await client.events.wrap_event(ticker('20001.0')).fire()
+        response = await asyncio.wait_for(first, 1)
+        t_first = time.perf_counter() - t1
+        assert response.symbol == 'BTCUSDT' and response.close_price == '20001.0'
+        assert len(started) == 2
+        consumer = asyncio.ensure_future(stream.__anext__())
+        t2 = time.perf_counter()
+        stop = await asyncio.wait_for(martin.StopStream(request, Context()), 1)
+        t_stop = time.perf_counter() - t2
+        assert stop.success
+        try:
+            await consumer
+        except StopAsyncIteration:
+            pass
+        return t_started, t_first, t_stop
+    finally:
+        OpenClient.clients.pop(client_id, None)
+        OpenClient.ids.pop(ACCOUNT, None)
+        await client.close()
+
+
+async def stop_with_consumer() -> float:
+    """
+    StopStream returns once the consumer drained its queue up to the stop mark
+    """
+    open_client = OpenClient(ACCOUNT)
+    client_id = open_client.register()
+    client = open_client.client
+    martin = Martin()
+    request = api_pb2.MarketRequest(client_id=client_id, trade_id='t2', symbol='BTCUSDT')
+    responses = []
+
+    async def consume():
+        async for response in martin.OnTickerUpdate(request, Context()):
+            responses.append(response.close_price)
+
+    try:
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        await client.events.wrap_event(ticker('1.0')).fire()
+        t0 = time.perf_counter()
+        await asyncio.wait_for(martin.StopStream(request, Context()), 1)
+        t_stop = time.perf_counter() - t0
+        await asyncio.wait_for(consumer, 1)
+        assert responses == ['1.0']
+        assert not client.stream_queue.get('t2')
+        return t_stop
+    finally:
+        OpenClient.clients.pop(client_id, None)
+        OpenClient.ids.pop(ACCOUNT, None)
+        await client.close()
+
+
+def test_start_to_first_event_latency():
+    t_started, t_first, t_stop = asyncio.run(start_to_first_event())
+    assert t_started < LATENCY_LIMIT, t_started
+    assert t_first < LATENCY_LIMIT, t_first
+    assert t_stop < LATENCY_LIMIT, t_stop
+
+
+def test_stop_waits_for_consumer():
+    assert asyncio.run(stop_with_consumer()) < LATENCY_LIMIT